@@ -1,6 +1,111 @@
 """Package to solve Advent of Code puzzles."""
 
+import importlib
+
 from .advent_of_code import AdventOfCode
+from .backend import BACKENDS, numpy_available, select_backend
 from .day_solution import DaySolution
+from .executor import EXECUTORS, create_executor, gil_enabled, select_executor
+from .grid import Grid
+from .input_source import InputSource
+from .integer_table import IntegerTable
+from .phase_timing import PhaseTiming, timed
+from .run_result import PartResult, RunResult
+from .solution_entry import SolutionEntry
+
+# Names that are imported when they are used for the first time. Importing
+# them right away would slow down the startup of every run.
+_LAZY_IMPORTS = {
+    'AllocationSite': '.memory_report',
+    'AnswerCache': '.answer_cache',
+    'BatchResult': '.batch',
+    'BenchmarkReport': '.benchmark',
+    'DayBenchmark': '.benchmark',
+    'DayMemory': '.memory_report',
+    'ExecutorComparison': '.benchmark',
+    'ExecutorPoint': '.benchmark',
+    'ParseCache': '.parse_cache',
+    'PhaseComparison': '.benchmark',
+    'PhaseMemory': '.memory_report',
+    'ScalingPoint': '.benchmark',
+    'ScalingResult': '.benchmark',
+    'SolverServer': '.solver_server',
+    'TimingStatistics': '.benchmark',
+    'benchmark_solution': '.benchmark',
+    'collapsed_stacks': '.profiling',
+    'compare_reports': '.benchmark',
+    'fit_power_law': '.benchmark',
+    'measure_executors': '.benchmark',
+    'measure_memory': '.memory_report',
+    'measure_scaling': '.benchmark',
+    'perf_supported': '.perf_trampoline',
+    'perf_trampoline': '.perf_trampoline',
+    'profile_solution': '.profiling',
+    'solve_parts': '.time_budget',
+    'solve_remote': '.solver_server',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the lazily imported names on first use.
+
+    Args:
+        name: the name to get.
+
+    Returns:
+        The object with that name.
+
+    Raises:
+        AttributeError: when the name does not exist in this package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
-__all__ = ['AdventOfCode', 'DaySolution']
+__all__ = [
+    'BACKENDS',
+    'EXECUTORS',
+    'AdventOfCode',
+    'AllocationSite',
+    'AnswerCache',
+    'BatchResult',
+    'BenchmarkReport',
+    'DayBenchmark',
+    'DayMemory',
+    'DaySolution',
+    'ExecutorComparison',
+    'ExecutorPoint',
+    'Grid',
+    'InputSource',
+    'IntegerTable',
+    'ParseCache',
+    'PartResult',
+    'PhaseComparison',
+    'PhaseMemory',
+    'PhaseTiming',
+    'RunResult',
+    'ScalingPoint',
+    'ScalingResult',
+    'SolutionEntry',
+    'SolverServer',
+    'TimingStatistics',
+    'benchmark_solution',
+    'collapsed_stacks',
+    'compare_reports',
+    'create_executor',
+    'fit_power_law',
+    'gil_enabled',
+    'measure_executors',
+    'measure_scaling',
+    'numpy_available',
+    'perf_supported',
+    'perf_trampoline',
+    'profile_solution',
+    'select_backend',
+    'select_executor',
+    'solve_parts',
+    'solve_remote',
+    'timed',
+]
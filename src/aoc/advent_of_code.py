@@ -1,14 +1,140 @@
 """Module with the AdventOfCode class."""
 
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from functools import partial
+from typing import TYPE_CHECKING
+
 from .day_solution import DaySolution
+from .input_source import InputSource
+from .phase_timing import PhaseTiming, collect_phases
+from .run_result import PartResult, RunResult
+from .solution_entry import SolutionEntry
+
+if TYPE_CHECKING:
+    # Only imported for type checking, to keep the import of this module
+    # (and thus the startup of the CLI) fast
+    from concurrent.futures import Executor, Future
+    from pstats import Stats
+
+    from .answer_cache import AnswerCache
+    from .batch import BatchResult
+    from .benchmark import BenchmarkReport, ScalingResult
+    from .memory_report import DayMemory
+    from .parse_cache import ParseCache
+
+PARTS = (1, 2)
+
+
+def _solve_part(
+    day: int,
+    part: int,
+    solution: DaySolution,
+    perf: bool = False,
+    timings: bool = False,
+) -> PartResult:
+    """Solve one part of a solution and time it.
+
+    This is a module level function so it can be sent to a process pool.
+
+    Args:
+        day: the day for which the solution is.
+        part: the part to solve; 1 or 2.
+        solution: the solution to solve the part with.
+        perf: whether to make the Python functions visible to Linux `perf`
+            while solving.
+        timings: whether to record the phases inside the solution.
+
+    Returns:
+        The answer with the wall and CPU time it took, and the phases that
+        were recorded inside the solution. The CPU time is that of the
+        thread that solved it, so other parts that are solved at the same
+        time in other threads are not counted.
+    """
+    if perf:
+        from .perf_trampoline import perf_trampoline  # noqa: PLC0415
+
+        context = perf_trampoline()
+    else:
+        context = nullcontext()
+    phases: AbstractContextManager[dict[str, PhaseTiming]] = (
+        collect_phases() if timings else nullcontext({})
+    )
+
+    with context, phases as collected:
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        if part == 1:
+            answer = solution.solve_puzzle_one()
+        else:
+            answer = solution.solve_puzzle_two()
+        wall_time = time.perf_counter() - start_wall
+        cpu_time = time.thread_time() - start_cpu
+
+    return PartResult(
+        day=day,
+        part=part,
+        answer=answer,
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        timings=collected,
+    )
 
 
 class AdventOfCode:
     """Class that can be used for the solutions of Advent of Code."""
 
-    def __init__(self) -> None:
-        """Set internal values."""
+    def __init__(
+        self,
+        parse_cache: 'ParseCache | None' = None,
+        answer_cache: 'AnswerCache | None' = None,
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            parse_cache: the cache for parsed input data to give to the
+                solutions that are created from registered classes.
+            answer_cache: the cache for the answers of `run_all`. Only the
+                answers of solutions registered with `register_solution`
+                are cached.
+        """
         self._solutions: dict[int, DaySolution] = {}
+        self._entries: dict[int, SolutionEntry] = {}
+        self._parse_cache = parse_cache
+        self._answer_cache = answer_cache
+
+    @property
+    def days(self) -> list[int]:
+        """Get the days that have a solution.
+
+        Returns:
+            The registered days, in order.
+        """
+        return sorted(set(self._solutions) | set(self._entries))
+
+    @property
+    def entries(self) -> dict[int, SolutionEntry]:
+        """Get the solution classes that are registered.
+
+        Returns:
+            The registration per day, for the days that are registered with
+            `register_solution`.
+        """
+        return dict(self._entries)
+
+    @staticmethod
+    def _validate_day(day: int) -> None:
+        """Check if a day is a valid Advent of Code day.
+
+        Args:
+            day: the day to check.
+
+        Raises:
+            ValueError: when the day is not 1 to 24.
+        """
+        if day < 1 or day > 24:
+            raise ValueError('Invalid day.')
 
     def add_solution(self, day: int, solution: DaySolution) -> None:
         """Add a solution to the list of solutions.
@@ -17,10 +143,75 @@ class AdventOfCode:
             day: the day for which the solution is. Can be 1 to 24.
             solution: the solution to add.
         """
-        if day < 1 or day > 24:
-            raise ValueError('Invalid day.')
+        self._validate_day(day)
         self._solutions[day] = solution
 
+    def register_solution(
+        self,
+        day: int,
+        solution_class: type[DaySolution] | str,
+        input_file: InputSource | str,
+        **arguments: object,
+    ) -> None:
+        """Register a solution class for a day.
+
+        Other than with `add_solution`, no object is created yet. Objects are
+        created when they are requested, and new objects can be created with
+        `create_solution`.
+
+        The class can be given as a `"module:Class"` string. The module is
+        then only imported when an object for the day is created, so
+        registering all days does not import all solutions.
+
+        Args:
+            day: the day for which the solution is. Can be 1 to 24.
+            solution_class: the class of the solution, or the location of
+                the class as `"module:Class"` string.
+            input_file: the input file, or input source, for the solution.
+            **arguments: extra keyword arguments for the constructor.
+        """
+        self._validate_day(day)
+        self._entries[day] = SolutionEntry(
+            solution_class=solution_class,
+            input_file=input_file,
+            arguments=arguments,
+        )
+
+    def _create(
+        self, entry: SolutionEntry, input_file: InputSource | str | None = None
+    ) -> DaySolution:
+        """Create a solution object from a registration.
+
+        Args:
+            entry: the registration of the solution.
+            input_file: an input file to use instead of the registered one.
+
+        Returns:
+            The new solution object, using the parse cache when there is one.
+        """
+        solution = entry.create(input_file)
+        if self._parse_cache is not None:
+            solution.parse_cache = self._parse_cache
+        return solution
+
+    def create_solution(
+        self, day: int, input_file: InputSource | str | None = None
+    ) -> DaySolution | None:
+        """Create a new solution object for a registered day.
+
+        Args:
+            day: the day for which the solution is. Can be 1 to 24.
+            input_file: an input file to use instead of the registered one.
+
+        Returns:
+            A new solution object or None if no solution class is registered
+            for the day.
+        """
+        entry = self._entries.get(day, None)
+        if entry is None:
+            return None
+        return self._create(entry, input_file)
+
     def get_solution(self, day: int) -> DaySolution | None:
         """Get the solution for a specific day.
 
@@ -31,4 +222,470 @@ class AdventOfCode:
             The solution for the specific day or None if it does not exist.
         """
         solution = self._solutions.get(day, None)
+        if solution is None and day in self._entries:
+            solution = self._create(self._entries[day])
+            self._solutions[day] = solution
         return solution
+
+    def _selected_days(self, days: Iterable[int] | None) -> list[int]:
+        """Get the registered days out of a selection of days.
+
+        Args:
+            days: the days to select, or None for all registered days.
+
+        Returns:
+            The selected days that have a solution, in order.
+        """
+        if days is None:
+            return self.days
+        selection = set(days)
+        return [day for day in self.days if day in selection]
+
+    def _answer_key(
+        self, day: int, input_file: InputSource | str | None = None
+    ) -> tuple[str, str] | None:
+        """Get the key for the cached answers of a day.
+
+        Args:
+            day: the day to get the key for.
+            input_file: the input to get the key for, instead of the
+                registered one.
+
+        Returns:
+            The hash of the input and the hash of the solution, or None when
+            the answers of the day cannot be cached.
+        """
+        entry = self._entries.get(day)
+        if self._answer_cache is None or entry is None:
+            return None
+        solution_hash = entry.fingerprint()
+        if solution_hash is None:
+            return None
+        try:
+            input_hash = InputSource.of(input_file or entry.input_file).sha256
+        except OSError:
+            # Let the solution report the missing input
+            return None
+        return input_hash, solution_hash
+
+    def _cached_part(
+        self, day: int, part: int, key: tuple[str, str]
+    ) -> PartResult | None:
+        """Get the result of a part from the answer cache.
+
+        Args:
+            day: the day of the part.
+            part: the part to get; 1 or 2.
+            key: the hash of the input and the hash of the solution.
+
+        Returns:
+            The cached result, or None when the answer is not cached.
+        """
+        if self._answer_cache is None:
+            return None
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        answer = self._answer_cache.get(day, part, *key)
+        if answer is None:
+            return None
+        return PartResult(
+            day=day,
+            part=part,
+            answer=answer,
+            wall_time=time.perf_counter() - start_wall,
+            cpu_time=time.process_time() - start_cpu,
+            cached=True,
+        )
+
+    def _plan(
+        self, days: Iterable[int] | None
+    ) -> tuple[
+        list[PartResult],
+        dict[int, tuple[str, str]],
+        list[tuple[int, int, DaySolution]],
+    ]:
+        """Find the parts that are cached and the parts that must be solved.
+
+        Args:
+            days: the days to solve. All registered days when not given.
+
+        Returns:
+            The results from the answer cache, the answer cache keys of the
+            days, and the day, part and solution of every part to solve.
+        """
+        cached: list[PartResult] = []
+        keys: dict[int, tuple[str, str]] = {}
+        tasks: list[tuple[int, int, DaySolution]] = []
+        for day in self._selected_days(days):
+            key = self._answer_key(day)
+            missing = list(PARTS)
+            if key is not None:
+                keys[day] = key
+                for part in PARTS:
+                    result = self._cached_part(day, part, key)
+                    if result is not None:
+                        cached.append(result)
+                        missing.remove(part)
+
+            if missing:
+                solution = self.get_solution(day)
+                tasks.extend((day, part, solution) for part in missing)
+        return cached, keys, tasks
+
+    def _store_answer(
+        self, result: PartResult, keys: dict[int, tuple[str, str]]
+    ) -> None:
+        """Add the answer of a solved part to the answer cache.
+
+        Parts that were stopped by their time budget have no answer, and are
+        not added.
+
+        Args:
+            result: the result of the part.
+            keys: the answer cache keys of the days.
+        """
+        if (
+            self._answer_cache is not None
+            and result.day in keys
+            and not result.timed_out
+        ):
+            self._answer_cache.put(
+                result.day, result.part, *keys[result.day], result.answer
+            )
+
+    def run_all(
+        self,
+        executor: 'Executor | None' = None,
+        days: Iterable[int] | None = None,
+        perf: bool = False,
+        timeout: float | None = None,
+        timings: bool = False,
+    ) -> RunResult:
+        """Solve both parts of all registered days.
+
+        When an executor is given, every part is sent to it as a separate
+        task. For a `ProcessPoolExecutor`, every task gets its own copy of the
+        solution, so the parts cannot influence each other and can run at the
+        same time. For a `ThreadPoolExecutor`, the parts of a day share the
+        solution object, which loads and prepares the data once. Without an
+        executor, the parts are solved one after another
+        in this process.
+
+        With a timeout, the executor is not used. Every part is solved in its
+        own worker process instead, which is stopped when the part takes
+        longer than the timeout; see `aoc.time_budget.solve_parts`. The
+        stopped parts are in the result with `timed_out` set.
+
+        With an answer cache, the parts that are in the cache are not solved,
+        and the answers of the solved parts are added to it.
+
+        Args:
+            executor: the executor to run the parts on.
+            days: the days to solve. All registered days when not given.
+            perf: whether to make the Python functions visible to Linux
+                `perf` while the parts are solved; see `perf_trampoline`.
+            timeout: the time budget of every part, in seconds. Parts are
+                not stopped when not given.
+            timings: whether to record the phases inside the solutions.
+
+        Returns:
+            The results for all parts, in day and part order, together with
+            the total wall time.
+        """
+        start_wall = time.perf_counter()
+        cached, keys, tasks = self._plan(days)
+        results = {(result.day, result.part): result for result in cached}
+
+        if timeout is not None:
+            from .time_budget import solve_parts  # noqa: PLC0415
+
+            solved = list(
+                solve_parts(tasks, timeout, perf=perf, timings=timings)
+            )
+        elif executor is None:
+            solved = [_solve_part(*task, perf, timings) for task in tasks]
+        else:
+            futures: list[Future[PartResult]] = [
+                executor.submit(_solve_part, *task, perf, timings)
+                for task in tasks
+            ]
+            solved = [future.result() for future in futures]
+
+        for result in solved:
+            results[result.day, result.part] = result
+            self._store_answer(result, keys)
+
+        return RunResult(
+            parts=[results[key] for key in sorted(results)],
+            wall_time=time.perf_counter() - start_wall,
+        )
+
+    async def stream(
+        self,
+        executor: 'Executor | None' = None,
+        days: Iterable[int] | None = None,
+        perf: bool = False,
+        timeout: float | None = None,
+        timings: bool = False,
+    ) -> AsyncIterator[PartResult]:
+        """Solve both parts of all registered days as a stream of results.
+
+        This works like `run_all`, but the parts are scheduled on the
+        executor from an asyncio event loop, and every result is given when
+        its part is solved. So the results come in the order in which the
+        parts finish, and a slow day does not hold back the others. Cached
+        answers are given first.
+
+        Without an executor, the parts are solved one after another in a
+        separate thread, so the event loop is not blocked. With a timeout,
+        the parts are solved in worker processes that are stopped when they
+        take too long, like in `run_all`.
+
+        Args:
+            executor: the executor to run the parts on.
+            days: the days to solve. All registered days when not given.
+            perf: whether to make the Python functions visible to Linux
+                `perf` while the parts are solved; see `perf_trampoline`.
+            timeout: the time budget of every part, in seconds. Parts are
+                not stopped when not given.
+            timings: whether to record the phases inside the solutions.
+
+        Yields:
+            The result of every part, in the order in which they are ready.
+        """
+        import asyncio  # noqa: PLC0415
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        cached, keys, tasks = self._plan(days)
+        for result in cached:
+            yield result
+
+        if timeout is not None:
+            from .time_budget import solve_parts  # noqa: PLC0415
+
+            solving = solve_parts(tasks, timeout, perf=perf, timings=timings)
+            try:
+                # The workers are watched in a separate thread, so the event
+                # loop is not blocked
+                while True:
+                    result = await asyncio.to_thread(next, solving, None)
+                    if result is None:
+                        return
+                    self._store_answer(result, keys)
+                    yield result
+            finally:
+                # When the caller stops early, the workers are killed
+                solving.close()
+
+        loop = asyncio.get_running_loop()
+        with ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=1)
+                )
+            pending = [
+                loop.run_in_executor(
+                    executor, _solve_part, *task, perf, timings
+                )
+                for task in tasks
+            ]
+            try:
+                for next_result in asyncio.as_completed(pending):
+                    result = await next_result
+                    self._store_answer(result, keys)
+                    yield result
+            finally:
+                # When the caller stops early, the parts that did not
+                # start yet are not solved
+                for future in pending:
+                    future.cancel()
+
+    def solve_input(
+        self,
+        day: int,
+        input_file: InputSource | str,
+        parts: Iterable[int] = PARTS,
+        executor: 'Executor | None' = None,
+    ) -> list[PartResult]:
+        """Solve parts of a registered day for another input.
+
+        Like `run_all`, the answer cache is used and the answers of the
+        solved parts are added to it.
+
+        Args:
+            day: the day to solve.
+            input_file: the input file, or input source, to solve.
+            parts: the parts to solve.
+            executor: the executor to run the parts on. Without an executor,
+                the parts are solved in this process.
+
+        Returns:
+            The results of the parts, in part order.
+
+        Raises:
+            ValueError: when no solution class is registered for the day.
+        """
+        entry = self._entries.get(day)
+        if entry is None:
+            raise ValueError(f'No solution class registered for day {day}.')
+
+        results: dict[int, PartResult] = {}
+        keys: dict[int, tuple[str, str]] = {}
+        key = self._answer_key(day, input_file)
+        if key is not None:
+            keys[day] = key
+            for part in parts:
+                result = self._cached_part(day, part, key)
+                if result is not None:
+                    results[part] = result
+
+        missing = [part for part in parts if part not in results]
+        if missing:
+            solution = self._create(entry, input_file)
+            if executor is None:
+                solved = [_solve_part(day, part, solution) for part in missing]
+            else:
+                futures = [
+                    executor.submit(_solve_part, day, part, solution)
+                    for part in missing
+                ]
+                solved = [future.result() for future in futures]
+            for result in solved:
+                results[result.part] = result
+                self._store_answer(result, keys)
+        return [results[part] for part in sorted(results)]
+
+    def benchmark(
+        self,
+        days: Iterable[int] | None = None,
+        warmup: int = 1,
+        repeat: int = 5,
+    ) -> 'BenchmarkReport':
+        """Benchmark the registered solutions.
+
+        Every timed phase uses a new solution object, so only days that are
+        registered with `register_solution` can be benchmarked.
+
+        Args:
+            days: the days to benchmark. All registered days when not given.
+            warmup: the amount of untimed repetitions per phase.
+            repeat: the amount of timed repetitions per phase.
+
+        Returns:
+            The benchmark report with the statistics per day and phase.
+        """
+        from .benchmark import BenchmarkReport, benchmark_solution  # noqa: PLC0415
+
+        report = BenchmarkReport(warmup=warmup, repeat=repeat)
+        for day in self._selected_days(days):
+            entry = self._entries.get(day, None)
+            if entry is not None:
+                report.days.append(
+                    benchmark_solution(
+                        day, partial(self._create, entry), warmup, repeat
+                    )
+                )
+        return report
+
+    def measure_scaling(
+        self, day: int, input_files: list[str], repeat: int = 3
+    ) -> 'ScalingResult | None':
+        """Measure how a registered solution scales with the input size.
+
+        Args:
+            day: the day to measure.
+            input_files: input files of increasing size for the day.
+            repeat: the amount of timed repetitions per phase and input.
+
+        Returns:
+            The measurements per phase and input size, or None if no
+            solution class is registered for the day.
+        """
+        from .benchmark import measure_scaling  # noqa: PLC0415
+
+        entry = self._entries.get(day, None)
+        if entry is None:
+            return None
+        return measure_scaling(
+            day, partial(self._create, entry), input_files, repeat
+        )
+
+    def measure_memory(
+        self, days: Iterable[int] | None = None, top: int = 5
+    ) -> list['DayMemory']:
+        """Measure the memory of every phase of the solutions.
+
+        The days are measured one after another in this process, since
+        `tracemalloc` only sees the allocations of its own process. Days that
+        are registered with `register_solution` get a new solution object;
+        for days added with `add_solution`, the added object is measured.
+
+        Args:
+            days: the days to measure. All registered days when not given.
+            top: the number of allocation sites to give per phase.
+
+        Returns:
+            The memory per phase, for every day in order.
+        """
+        from .memory_report import measure_memory  # noqa: PLC0415
+
+        results: list[DayMemory] = []
+        for day in self._selected_days(days):
+            solution = self.create_solution(day) or self.get_solution(day)
+            if solution is not None:
+                results.append(measure_memory(day, solution, top))
+        return results
+
+    def profile(self, day: int, part: int | None = None) -> 'Stats | None':
+        """Profile a solution with `cProfile`.
+
+        Args:
+            day: the day to profile.
+            part: the part to profile; 1 or 2. Both parts, and the loading
+                of the data, when not given.
+
+        Returns:
+            The statistics of the profiled functions, or None if the day
+            has no solution.
+        """
+        from .profiling import profile_solution  # noqa: PLC0415
+
+        solution = self.create_solution(day) or self.get_solution(day)
+        if solution is None:
+            return None
+        return profile_solution(solution, part)
+
+    def solve_many(
+        self,
+        day: int,
+        input_files: Iterable[str],
+        workers: int | None = None,
+        chunksize: int = 16,
+    ) -> Iterator['BatchResult']:
+        """Solve a registered day for many input files.
+
+        The inputs are solved on a pool of worker processes that import the
+        solution once; see `aoc.batch.solve_many`. The answer cache is not
+        used, but the parse cache is.
+
+        Args:
+            day: the day to solve.
+            input_files: the input files to solve the day for.
+            workers: the number of worker processes. The number of CPUs when
+                not given.
+            chunksize: the number of inputs that is sent to a worker at once.
+
+        Returns:
+            An iterator over the results, in the order of the input files.
+
+        Raises:
+            ValueError: when no solution class is registered for the day.
+        """
+        from .batch import solve_many  # noqa: PLC0415
+
+        entry = self._entries.get(day)
+        if entry is None:
+            raise ValueError(f'No solution class registered for day {day}.')
+        return solve_many(
+            entry, input_files, workers, chunksize, self._parse_cache
+        )
@@ -0,0 +1,178 @@
+"""Module with the AnswerCache class."""
+
+import os
+import sqlite3
+import threading
+import time
+from types import TracebackType
+
+# Layout of the database; a different layout is created in a new table
+_TABLE = 'answers_v1'
+
+
+class AnswerCache:
+    """Persistent cache for the answers of solutions.
+
+    The answers are stored in a SQLite database, keyed by the day, the part,
+    a hash of the input and a hash of the solution (see
+    `SolutionEntry.fingerprint`). When the input or the code changes, the
+    key changes, so a stale answer is never given.
+
+    The cache holds at most `max_entries` answers. When more are stored,
+    the answers that were used the longest time ago are removed.
+
+    The cache can be used from multiple threads; the database is used by one
+    thread at a time.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1000) -> None:
+        """Set internal values.
+
+        The database is opened when it is used for the first time.
+
+        Args:
+            path: the path of the SQLite database. The file and its directory
+                are created when needed.
+            max_entries: the maximum number of answers to keep.
+        """
+        self._path = path
+        self._max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Get the path of the database.
+
+        Returns:
+            The path.
+        """
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table if it does not exist.
+
+        Returns:
+            The connection to the database.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self._path, check_same_thread=False
+            )
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {_TABLE} ('
+                'day INTEGER NOT NULL, '
+                'part INTEGER NOT NULL, '
+                'input_hash TEXT NOT NULL, '
+                'solution_hash TEXT NOT NULL, '
+                'answer TEXT NOT NULL, '
+                'last_used REAL NOT NULL, '
+                'PRIMARY KEY (day, part, input_hash, solution_hash))'
+            )
+        return self._connection
+
+    def get(
+        self, day: int, part: int, input_hash: str, solution_hash: str
+    ) -> str | None:
+        """Get a cached answer.
+
+        Args:
+            day: the day of the solution.
+            part: the part of the puzzle.
+            input_hash: the hash of the input.
+            solution_hash: the hash of the solution.
+
+        Returns:
+            The answer, or None if it is not in the cache.
+        """
+        key = (day, part, input_hash, solution_hash)
+        with self._lock, self._connect() as connection:
+            row = connection.execute(
+                f'SELECT answer FROM {_TABLE} WHERE day = ? AND part = ? '
+                'AND input_hash = ? AND solution_hash = ?',
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                f'UPDATE {_TABLE} SET last_used = ? WHERE day = ? '
+                'AND part = ? AND input_hash = ? AND solution_hash = ?',
+                (time.time(), *key),
+            )
+        return row[0]
+
+    def put(
+        self,
+        day: int,
+        part: int,
+        input_hash: str,
+        solution_hash: str,
+        answer: str,
+    ) -> None:
+        """Store an answer in the cache.
+
+        Args:
+            day: the day of the solution.
+            part: the part of the puzzle.
+            input_hash: the hash of the input.
+            solution_hash: the hash of the solution.
+            answer: the answer to store.
+        """
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                f'INSERT OR REPLACE INTO {_TABLE} VALUES (?, ?, ?, ?, ?, ?)',
+                (day, part, input_hash, solution_hash, answer, time.time()),
+            )
+            # Evict the least recently used answers
+            connection.execute(
+                f'DELETE FROM {_TABLE} WHERE rowid NOT IN ('
+                f'SELECT rowid FROM {_TABLE} '
+                'ORDER BY last_used DESC LIMIT ?)',
+                (self._max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all answers from the cache."""
+        with self._lock, self._connect() as connection:
+            connection.execute(f'DELETE FROM {_TABLE}')
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> 'AnswerCache':
+        """Use the cache as context manager.
+
+        Returns:
+            The cache itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database when leaving the context.
+
+        Args:
+            exc_type: the type of the raised exception, if any.
+            exc_value: the raised exception, if any.
+            traceback: the traceback of the raised exception, if any.
+        """
+        self.close()
+
+    def __repr__(self) -> str:
+        """Get a representation of the cache.
+
+        Returns:
+            The representation, with the path of the database.
+        """
+        return f'AnswerCache({self._path!r})'
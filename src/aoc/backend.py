@@ -0,0 +1,46 @@
+"""Module with functions to select the backend of a solution."""
+
+import functools
+import importlib.util
+
+# The backends a solution can use: pure Python, and vectorized with NumPy
+BACKENDS = ('python', 'numpy')
+
+
+@functools.cache
+def numpy_available() -> bool:
+    """Check if NumPy is installed.
+
+    NumPy is an optional dependency; it is checked without importing it.
+
+    Returns:
+        True when NumPy can be imported.
+    """
+    return importlib.util.find_spec('numpy') is not None
+
+
+def select_backend(backend: str) -> str:
+    """Select the backend that a solution uses.
+
+    Solutions with a vectorized implementation take a `backend` argument
+    and call this in their constructor. When NumPy is asked for but not
+    installed, the pure Python implementation is used; it gives the same
+    answers.
+
+    Args:
+        backend: the requested backend, one of `BACKENDS`.
+
+    Returns:
+        The backend to use.
+
+    Raises:
+        ValueError: when the backend does not exist.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f'Unknown backend {backend!r}; expected one of '
+            f'{", ".join(BACKENDS)}.'
+        )
+    if backend == 'numpy' and not numpy_available():
+        return 'python'
+    return backend
@@ -0,0 +1,146 @@
+"""Module with classes and functions to solve a day for many inputs."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from .phase_timing import PhaseTiming, collect_phases, record_phase
+from .solution_entry import SolutionEntry
+
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Answers of one input of a batch.
+
+    Attributes:
+        path: the path of the input file.
+        part1: the answer of part one; empty when solving failed.
+        part2: the answer of part two; empty when solving failed.
+        timings: the time of loading and of both parts, followed by the
+            phases recorded inside the solution.
+        error: the error when loading or solving failed, or None.
+    """
+
+    path: str
+    part1: str
+    part2: str
+    timings: dict[str, PhaseTiming] = field(default_factory=dict, hash=False)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'path': self.path,
+            'part1': self.part1,
+            'part2': self.part2,
+            'timings': {
+                name: timing.to_dict() for name, timing in self.timings.items()
+            },
+            'error': self.error,
+        }
+
+
+def _initialize_worker(entry: SolutionEntry) -> None:
+    """Prepare a worker process for solving inputs.
+
+    The solution module, with everything it imports and its module level
+    compiled patterns, is imported once per worker instead of once per
+    input.
+
+    Args:
+        entry: the registration of the solution.
+    """
+    entry.resolve()
+
+
+def _solve_input(
+    entry: SolutionEntry, parse_cache: 'ParseCache | None', path: str
+) -> BatchResult:
+    """Solve both parts of a solution for one input file.
+
+    This is a module level function so it can be sent to a process pool.
+
+    Args:
+        entry: the registration of the solution.
+        parse_cache: the cache for parsed input data, if any.
+        path: the input file.
+
+    Returns:
+        The answers and timings, or the error when solving failed.
+    """
+    timings: dict[str, PhaseTiming] = {}
+    try:
+        solution = entry.create(path)
+        if parse_cache is not None:
+            solution.parse_cache = parse_cache
+        # Also records the phases inside the solution
+        with collect_phases() as phases:
+            with record_phase(timings, 'load'):
+                solution.load_data()
+            with record_phase(timings, 'part1'):
+                part1 = solution.solve_puzzle_one()
+            with record_phase(timings, 'part2'):
+                part2 = solution.solve_puzzle_two()
+    except Exception as exc:  # noqa: BLE001
+        # One bad input should not stop the whole batch
+        return BatchResult(
+            path=path,
+            part1='',
+            part2='',
+            timings=timings,
+            error=f'{type(exc).__name__}: {exc}',
+        )
+    return BatchResult(
+        path=path,
+        part1=part1,
+        part2=part2,
+        timings=timings | phases,
+    )
+
+
+def solve_many(
+    entry: SolutionEntry,
+    input_files: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = 16,
+    parse_cache: 'ParseCache | None' = None,
+) -> Iterator[BatchResult]:
+    """Solve a solution for many input files on a process pool.
+
+    The worker processes are started once and import the solution once, so
+    every input only costs the loading and solving itself. The inputs are
+    sent to the workers in chunks, which saves a round trip per input.
+
+    Args:
+        entry: the registration of the solution.
+        input_files: the input files to solve.
+        workers: the number of worker processes. The number of CPUs when
+            not given.
+        chunksize: the number of inputs that is sent to a worker at once.
+        parse_cache: the cache for parsed input data, if any.
+
+    Yields:
+        The result of every input, in the order of the input files, as soon
+        as it and the results before it are ready.
+    """
+    executor = ProcessPoolExecutor(
+        workers, initializer=_initialize_worker, initargs=(entry,)
+    )
+    try:
+        yield from executor.map(
+            partial(_solve_input, entry, parse_cache),
+            input_files,
+            chunksize=chunksize,
+        )
+    finally:
+        # When the caller stops early, the remaining inputs are not solved
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,679 @@
+"""Module with classes and functions to benchmark solutions."""
+
+import math
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .day_solution import DaySolution
+from .executor import EXECUTORS, create_executor, gil_enabled
+
+if TYPE_CHECKING:
+    from .advent_of_code import AdventOfCode
+
+PHASES = ('load', 'prepare', 'part1', 'part2')
+
+
+@dataclass(frozen=True)
+class TimingStatistics:
+    """Statistics for a list of timing samples.
+
+    Attributes:
+        samples: the measured times, in seconds.
+    """
+
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        """Get the fastest sample.
+
+        Returns:
+            The lowest time, in seconds.
+        """
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        """Get the median of the samples.
+
+        Returns:
+            The median time, in seconds.
+        """
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        """Get the 95th percentile of the samples.
+
+        Returns:
+            The 95th percentile, in seconds. With only one sample, this is
+            that sample.
+        """
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method='inclusive')[-1]
+
+    @property
+    def stddev(self) -> float:
+        """Get the standard deviation of the samples.
+
+        Returns:
+            The sample standard deviation, in seconds. With only one sample,
+            this is 0.
+        """
+        if len(self.samples) < 2:
+            return 0.0
+        return statistics.stdev(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the statistics to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'stddev': self.stddev,
+            'samples': list(self.samples),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'TimingStatistics':
+        """Create the statistics from a dictionary.
+
+        Args:
+            data: a dictionary as created by `to_dict`.
+
+        Returns:
+            The statistics for the samples in the dictionary.
+        """
+        return cls(samples=tuple(data['samples']))
+
+
+@dataclass
+class DayBenchmark:
+    """Benchmark results for one day.
+
+    Attributes:
+        day: the day that was benchmarked.
+        phases: the timing statistics per phase; `load`, `prepare`,
+            `part1` and `part2`.
+    """
+
+    day: int
+    phases: dict[str, TimingStatistics] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the benchmark to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            phase: timing.to_dict() for phase, timing in self.phases.items()
+        }
+
+    @classmethod
+    def from_dict(cls, day: int, data: dict[str, Any]) -> 'DayBenchmark':
+        """Create the benchmark from a dictionary.
+
+        Args:
+            day: the day that was benchmarked.
+            data: a dictionary as created by `to_dict`.
+
+        Returns:
+            The benchmark for the day.
+        """
+        return cls(
+            day=day,
+            phases={
+                phase: TimingStatistics.from_dict(timing)
+                for phase, timing in data.items()
+            },
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Benchmark results for a set of days.
+
+    Attributes:
+        warmup: the amount of untimed repetitions per phase.
+        repeat: the amount of timed repetitions per phase.
+        days: the benchmark results, in day order.
+    """
+
+    warmup: int
+    repeat: int
+    days: list[DayBenchmark] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'warmup': self.warmup,
+            'repeat': self.repeat,
+            'days': {str(day.day): day.to_dict() for day in self.days},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'BenchmarkReport':
+        """Create the report from a dictionary.
+
+        Args:
+            data: a dictionary as created by `to_dict`.
+
+        Returns:
+            The benchmark report.
+        """
+        return cls(
+            warmup=data['warmup'],
+            repeat=data['repeat'],
+            days=[
+                DayBenchmark.from_dict(int(day), phases)
+                for day, phases in data['days'].items()
+            ],
+        )
+
+
+@dataclass(frozen=True)
+class PhaseComparison:
+    """Comparison of the median time of a phase against a baseline.
+
+    Attributes:
+        day: the day of the phase.
+        phase: the compared phase.
+        baseline: the median time in the baseline, in seconds; None when
+            the day or phase is missing from the baseline.
+        current: the current median time, in seconds.
+    """
+
+    day: int
+    phase: str
+    baseline: float | None
+    current: float
+
+    @property
+    def missing(self) -> bool:
+        """Check if the phase is missing from the baseline.
+
+        Returns:
+            True when there is no baseline to compare against.
+        """
+        return self.baseline is None
+
+    @property
+    def change(self) -> float:
+        """Get the relative change against the baseline.
+
+        Returns:
+            The change as fraction; 0.1 means 10% slower, -0.1 means 10%
+            faster. NaN when the phase is missing from the baseline.
+        """
+        if self.baseline is None:
+            return math.nan
+        if self.baseline == 0:
+            return 0.0 if self.current == 0 else float('inf')
+        return self.current / self.baseline - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        """Check if the phase got slower than allowed.
+
+        Args:
+            threshold: the allowed slowdown as fraction; 0.1 for 10%.
+
+        Returns:
+            True when the phase is slower than the baseline by more than the
+            threshold. False when it is missing from the baseline.
+        """
+        return not self.missing and self.change > threshold
+
+
+def compare_reports(
+    current: BenchmarkReport, baseline: BenchmarkReport
+) -> list[PhaseComparison]:
+    """Compare the medians of a benchmark against a baseline.
+
+    Medians are used instead of single samples, so one noisy repetition does
+    not make a phase look slower or faster. Days and phases of the current
+    report that are not in the baseline are returned as missing, so a
+    baseline of other days does not pass as one without regressions.
+
+    Args:
+        current: the report of the current benchmark.
+        baseline: the report to compare against.
+
+    Returns:
+        The comparisons, in day and phase order.
+    """
+    baseline_days = {day.day: day.phases for day in baseline.days}
+    comparisons: list[PhaseComparison] = []
+    for day in current.days:
+        baseline_phases = baseline_days.get(day.day, {})
+        for phase, timing in day.phases.items():
+            baseline_timing = baseline_phases.get(phase)
+            comparisons.append(
+                PhaseComparison(
+                    day=day.day,
+                    phase=phase,
+                    baseline=(
+                        None
+                        if baseline_timing is None
+                        else baseline_timing.median
+                    ),
+                    current=timing.median,
+                )
+            )
+    return comparisons
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    """Measurement of one phase on an input of a specific size.
+
+    Attributes:
+        size: the size of the input file, in bytes.
+        time: the median wall time of the phase, in seconds.
+        peak_memory: the peak memory allocated during the phase, in bytes.
+    """
+
+    size: int
+    time: float
+    peak_memory: int
+
+
+@dataclass
+class ScalingResult:
+    """Measurements of the phases of a day on inputs of increasing size.
+
+    Attributes:
+        day: the day that was measured.
+        phases: the measurements per phase, from small to large input.
+    """
+
+    day: int
+    phases: dict[str, list[ScalingPoint]] = field(default_factory=dict)
+
+    def time_exponent(self, phase: str) -> float:
+        """Estimate the time complexity exponent of a phase.
+
+        Args:
+            phase: the phase to estimate the exponent for.
+
+        Returns:
+            The exponent `k` in `time = c * size ** k`; 1 for linear, 2 for
+            quadratic. NaN if there are not enough measurements.
+        """
+        points = self.phases[phase]
+        return fit_power_law(
+            [point.size for point in points], [point.time for point in points]
+        )[0]
+
+    def memory_exponent(self, phase: str) -> float:
+        """Estimate the memory complexity exponent of a phase.
+
+        Args:
+            phase: the phase to estimate the exponent for.
+
+        Returns:
+            The exponent `k` in `peak_memory = c * size ** k`. NaN if there
+            are not enough measurements.
+        """
+        points = self.phases[phase]
+        return fit_power_law(
+            [point.size for point in points],
+            [point.peak_memory for point in points],
+        )[0]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            phase: {
+                'time_exponent': self.time_exponent(phase),
+                'memory_exponent': self.memory_exponent(phase),
+                'points': [
+                    {
+                        'size': point.size,
+                        'time': point.time,
+                        'peak_memory': point.peak_memory,
+                    }
+                    for point in points
+                ],
+            }
+            for phase, points in self.phases.items()
+        }
+
+
+@dataclass(frozen=True)
+class ExecutorPoint:
+    """Wall time of solving all parts with every executor, for one size.
+
+    Attributes:
+        scale: the size of the inputs compared to the official inputs.
+        size: the total size of the input files, in bytes.
+        times: the median wall time per executor, in seconds.
+    """
+
+    scale: float
+    size: int
+    times: dict[str, float] = field(default_factory=dict, hash=False)
+
+    @property
+    def fastest(self) -> str:
+        """Get the fastest executor.
+
+        Returns:
+            The executor with the lowest wall time.
+        """
+        return min(self.times, key=self.times.__getitem__)
+
+
+@dataclass
+class ExecutorComparison:
+    """Wall times of the executors on inputs of increasing size.
+
+    Attributes:
+        gil_enabled: whether the GIL was enabled, so only one thread ran at
+            a time.
+        points: the measurements, from small to large inputs.
+    """
+
+    gil_enabled: bool
+    points: list[ExecutorPoint] = field(default_factory=list)
+
+    @property
+    def crossover(self) -> ExecutorPoint | None:
+        """Find where another executor becomes the fastest.
+
+        Returns:
+            The first measurement where the fastest executor differs from
+            the fastest on the smallest inputs, or None when the same
+            executor is the fastest on all sizes.
+        """
+        for point in self.points[1:]:
+            if point.fastest != self.points[0].fastest:
+                return point
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the comparison to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        crossover = self.crossover
+        return {
+            'gil_enabled': self.gil_enabled,
+            'crossover': None if crossover is None else crossover.scale,
+            'points': [
+                {
+                    'scale': point.scale,
+                    'size': point.size,
+                    'times': point.times,
+                }
+                for point in self.points
+            ],
+        }
+
+
+def fit_power_law(
+    sizes: list[float], values: list[float]
+) -> tuple[float, float]:
+    """Fit measurements to a power law `value = c * size ** k`.
+
+    This is a least squares fit of a straight line through the logarithms
+    of the measurements. Measurements with a value of zero or lower are
+    left out, since they have no logarithm.
+
+    Args:
+        sizes: the input sizes.
+        values: the measured values for the input sizes.
+
+    Returns:
+        The exponent `k` and the coefficient `c`. Both are NaN when there
+        are less than two usable measurements with different sizes.
+    """
+    points = [
+        (math.log(size), math.log(value))
+        for size, value in zip(sizes, values, strict=True)
+        if size > 0 and value > 0
+    ]
+    if len({x for x, _ in points}) < 2:
+        return (math.nan, math.nan)
+
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sum(
+        (x - mean_x) ** 2 for x, _ in points
+    )
+    return (slope, math.exp(mean_y - slope * mean_x))
+
+
+def _time_call(function: Callable[[], object]) -> float:
+    """Time a single call to a function.
+
+    Args:
+        function: the function to call.
+
+    Returns:
+        The wall time the call took, in seconds.
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _time_phase(
+    factory: Callable[[], DaySolution], loaded: DaySolution, phase: str
+) -> float:
+    """Time one phase of a solution.
+
+    The load and prepare phases are timed on a new object; for the prepare
+    phase, the data is loaded before the timer starts. The solve phases are
+    timed on an object that is already loaded and prepared; solutions do not
+    change that data, so it can be used for every repetition.
+
+    Args:
+        factory: function that creates a new solution object.
+        loaded: a solution object with the data loaded and prepared.
+        phase: the phase to time.
+
+    Returns:
+        The wall time of the phase, in seconds.
+    """
+    if phase == 'load':
+        return _time_call(factory().load_data)
+    if phase == 'prepare':
+        solution = factory()
+        solution.load_data()
+        return _time_call(solution.prepare)
+    if phase == 'part1':
+        return _time_call(loaded.solve_puzzle_one)
+    return _time_call(loaded.solve_puzzle_two)
+
+
+def _peak_memory_of_phase(
+    factory: Callable[[], DaySolution], loaded: DaySolution, phase: str
+) -> int:
+    """Measure the peak memory of one phase of a solution.
+
+    Only the memory of the phase itself is counted, not that of the data
+    of the earlier phases.
+
+    Args:
+        factory: function that creates a new solution object.
+        loaded: a solution object with the data loaded and prepared.
+        phase: the phase to measure.
+
+    Returns:
+        The peak amount of memory allocated during the phase, in bytes.
+    """
+    solution = loaded
+    if phase in ('load', 'prepare'):
+        solution = factory()
+    if phase == 'prepare':
+        solution.load_data()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        if phase == 'load':
+            solution.load_data()
+        elif phase == 'prepare':
+            solution.prepare()
+        elif phase == 'part1':
+            solution.solve_puzzle_one()
+        else:
+            solution.solve_puzzle_two()
+        return tracemalloc.get_traced_memory()[1] - start_memory
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_solution(
+    day: int,
+    factory: Callable[[], DaySolution],
+    warmup: int = 1,
+    repeat: int = 5,
+) -> DayBenchmark:
+    """Benchmark the loading and solving of a solution.
+
+    Args:
+        day: the day of the solution.
+        factory: function that creates a new solution object.
+        warmup: the amount of untimed repetitions before timing.
+        repeat: the amount of timed repetitions.
+
+    Returns:
+        The timing statistics per phase.
+
+    Raises:
+        ValueError: when `repeat` is lower than 1.
+    """
+    if repeat < 1:
+        raise ValueError('At least one repetition is needed.')
+
+    loaded = factory()
+    loaded.prepare()
+    for _ in range(warmup):
+        for phase in PHASES:
+            _time_phase(factory, loaded, phase)
+
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for _ in range(repeat):
+        for phase in PHASES:
+            samples[phase].append(_time_phase(factory, loaded, phase))
+
+    return DayBenchmark(
+        day=day,
+        phases={
+            phase: TimingStatistics(samples=tuple(phase_samples))
+            for phase, phase_samples in samples.items()
+        },
+    )
+
+
+def measure_scaling(
+    day: int,
+    factory: Callable[[str], DaySolution],
+    input_files: list[str],
+    repeat: int = 3,
+) -> ScalingResult:
+    """Measure how the phases of a solution scale with the input size.
+
+    Every phase is timed `repeat` times per input, and run once more with
+    `tracemalloc` to find its peak memory. Timing and memory are measured
+    separately, since `tracemalloc` slows down the code a lot.
+
+    Args:
+        day: the day of the solution.
+        factory: function that creates a new solution object for an
+            input file.
+        input_files: the input files, from small to large.
+        repeat: the amount of timed repetitions per phase and input.
+
+    Returns:
+        The measurements per phase and input size.
+    """
+    result = ScalingResult(day=day, phases={phase: [] for phase in PHASES})
+    for input_file in input_files:
+
+        def create(input_file: str = input_file) -> DaySolution:
+            return factory(input_file)
+
+        loaded = create()
+        loaded.prepare()
+        for phase in PHASES:
+            times = [_time_phase(create, loaded, phase) for _ in range(repeat)]
+            result.phases[phase].append(
+                ScalingPoint(
+                    size=os.path.getsize(input_file),
+                    time=statistics.median(times),
+                    peak_memory=_peak_memory_of_phase(create, loaded, phase),
+                )
+            )
+    return result
+
+
+def measure_executors(
+    factory: Callable[[str], 'AdventOfCode'],
+    inputs: list[tuple[float, str]],
+    days: Iterable[int] | None = None,
+    repeat: int = 3,
+    executors: Iterable[str] = EXECUTORS,
+) -> ExecutorComparison:
+    """Measure the wall time of solving all parts on every executor.
+
+    Every run uses a new pool and new solution objects, so the time includes
+    what the executors differ in: starting the workers, sending the
+    solutions to them, and loading the inputs once per part for processes
+    or once per day for threads. Threads are used as they are, also with
+    the GIL, to show what they cost there.
+
+    Args:
+        factory: function that creates the AdventOfCode object for a
+            directory with input files, without answer cache.
+        inputs: the scale and the directory of every set of inputs, from
+            small to large.
+        days: the days to solve. All registered days when not given.
+        repeat: the amount of timed runs per executor and input size.
+        executors: the executors to compare.
+
+    Returns:
+        The median wall time per executor and input size.
+    """
+    comparison = ExecutorComparison(gil_enabled=gil_enabled())
+    for scale, directory in inputs:
+        point = ExecutorPoint(
+            scale=scale,
+            size=sum(
+                entry.stat().st_size
+                for entry in os.scandir(directory)
+                if entry.is_file()
+            ),
+        )
+        for executor in executors:
+            times: list[float] = []
+            for _ in range(repeat):
+                advent_of_code = factory(directory)
+                start = time.perf_counter()
+                with create_executor(executor) as pool:
+                    advent_of_code.run_all(pool, days)
+                times.append(time.perf_counter() - start)
+            point.times[executor] = statistics.median(times)
+        comparison.points.append(point)
+    return comparison
@@ -1,14 +1,182 @@
 """Module with a abstract class for solutions."""
 
+import threading
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
 
+from .phase_timing import PhaseTiming, record_phase, timing_enabled
 
-class DaySolution(ABC):
+if TYPE_CHECKING:
+    from .input_source import InputSource
+    from .parse_cache import ParseCache
+
+
+class DaySolution[PreparedT](ABC):
     """Abstract class for solutions.
 
-    Should be implemented by specific solutions.
+    Should be implemented by specific solutions. The data that `load_data`
+    and `prepare` give is read-only, so the parts can be solved in any
+    order, repeated, and solved at the same time from several threads.
+
+    Attributes:
+        PARSER_VERSION: the version of the parsed attributes; raise it when
+            they change.
+        PARSED_ATTRIBUTES: the attributes to store in the parse cache.
+        parse_cache: the parse cache to use, if any.
     """
 
+    PARSER_VERSION: ClassVar[int] = 1
+    PARSED_ATTRIBUTES: ClassVar[tuple[str, ...]] = ()
+    parse_cache: 'ParseCache | None' = None
+    _backend: str = 'python'
+    _is_prepared: bool = False
+    _prepared_data: object = None
+    _lock: 'threading.RLock'
+    _timings: dict[str, PhaseTiming]
+
+    def __new__(cls, *args: object, **kwargs: object) -> Self:
+        """Create the object, with the lock for loading and preparing.
+
+        This is done here instead of in `__init__`, so it is also done for
+        solutions that do not call `super().__init__`, and for copies and
+        unpickled objects.
+
+        Args:
+            *args: the arguments for the constructor.
+            **kwargs: the keyword arguments for the constructor.
+
+        Returns:
+            The new object.
+        """
+        solution = super().__new__(cls)
+        solution._lock = threading.RLock()
+        solution._timings = {}
+        return solution
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state for pickling, to send the object to a process.
+
+        Returns:
+            The attributes of the object, without the lock; the new object
+            gets its own lock.
+        """
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    @property
+    def backend(self) -> str:
+        """Get the backend that the solution uses.
+
+        Returns:
+            The backend, one of `BACKENDS`; `python` for solutions without
+            a NumPy implementation.
+        """
+        return self._backend
+
+    @property
+    def timings(self) -> dict[str, PhaseTiming]:
+        """Get the recorded time per phase.
+
+        Phases are only recorded while timing is enabled, inside
+        `collect_phases`. When the object is used from several threads, the
+        phases of all threads are added up here. The phases of one part are
+        in the `PartResult` of that part.
+
+        Returns:
+            The timings, by phase name, in the order the phases first ran.
+        """
+        return self._timings
+
+    def timing(self, name: str) -> AbstractContextManager[None]:
+        """Record the time of a `with` block as a phase.
+
+        The time is only recorded when timing is enabled; see
+        `timing_enabled`.
+
+        Args:
+            name: the name of the phase.
+
+        Returns:
+            The context manager that records the time.
+        """
+        if not timing_enabled():
+            return nullcontext()
+        return record_phase(self.timings, name)
+
+    @abstractmethod
+    def _load_data(self) -> None:
+        """Load the data from the input file.
+
+        Should only load the data the first time it is called. It is only
+        called by `load_data`, which holds the lock of the object.
+        """
+
+    def load_data(self) -> None:
+        """Load the data from the input file.
+
+        The solve methods call this when they need the data. It can also be
+        used to load the data up front, for instance to time the loading
+        separately from the solving. When several threads call this at the
+        same time, one loads the data and the others wait for it.
+        """
+        with self._lock:
+            self._load_data()
+
+    def _prepare(self) -> PreparedT:
+        """Do the work that is shared by both parts.
+
+        Solutions without shared work do not need to override this.
+
+        Returns:
+            The data to share between the parts.
+        """
+        return cast(PreparedT, None)
+
+    def prepare(self) -> PreparedT:
+        """Load the data and do the work that is shared by both parts.
+
+        The work is done the first time this is called. Like `load_data`,
+        this can be used to time it separately from the solving, and it is
+        done once when several threads call it at the same time.
+
+        Returns:
+            The data to share between the parts.
+        """
+        if not self._is_prepared:
+            with self._lock:
+                # Another thread may have prepared it while this one waited
+                if not self._is_prepared:
+                    self._load_data()
+                    with self.timing('prepare'):
+                        self._prepared_data = self._prepare()
+                    self._is_prepared = True
+        return cast(PreparedT, self._prepared_data)
+
+    def _load_parsed(self, source: 'InputSource') -> bool:
+        """Restore the parsed attributes from the parse cache.
+
+        Args:
+            source: the input of the solution.
+
+        Returns:
+            True when the attributes were restored and parsing can be
+            skipped, False when they must be parsed.
+        """
+        if self.parse_cache is None or not self.PARSED_ATTRIBUTES:
+            return False
+        return self.parse_cache.load(self, source)
+
+    def _store_parsed(self, source: 'InputSource') -> None:
+        """Store the parsed attributes in the parse cache, if any.
+
+        Args:
+            source: the input of the solution.
+        """
+        if self.parse_cache is not None and self.PARSED_ATTRIBUTES:
+            self.parse_cache.store(self, source)
+
     @abstractmethod
     def solve_puzzle_one(self) -> str:
         """Solve the first puzzle and return the solution.
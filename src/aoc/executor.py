@@ -0,0 +1,91 @@
+"""Module with functions to select the executor that solves the parts."""
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# The executors to solve the parts on: a pool of worker processes, and a
+# pool of threads that only runs parts at the same time without the GIL
+EXECUTORS = ('processes', 'threads')
+
+
+def gil_enabled() -> bool:
+    """Check if the GIL is enabled.
+
+    Free-threaded builds of CPython 3.13 and later run Python code in
+    several threads at the same time. They enable the GIL again when an
+    extension module is imported that does not support that, so this is
+    checked at the moment it matters, not once.
+
+    Returns:
+        True when only one thread at a time can run Python code.
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def select_executor(executor: str) -> str:
+    """Select the executor that solves the parts.
+
+    Threads avoid starting processes and pickling the solutions, but with
+    the GIL only one of them solves at a time. So when threads are asked
+    for on a build with the GIL, processes are used.
+
+    Args:
+        executor: the requested executor, one of `EXECUTORS`.
+
+    Returns:
+        The executor to use.
+
+    Raises:
+        ValueError: when the executor does not exist.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f'Unknown executor {executor!r}; expected one of '
+            f'{", ".join(EXECUTORS)}.'
+        )
+    if executor == 'threads' and gil_enabled():
+        return 'processes'
+    return executor
+
+
+def create_executor(executor: str, workers: int | None = None) -> 'Executor':
+    """Create the pool for an executor.
+
+    The executor is used as given; use `select_executor` first to fall back
+    to processes on builds with the GIL.
+
+    A process pool gives every part its own copy of the solution. A thread
+    pool shares the solution between the parts of a day, so the data is
+    loaded and prepared once; see `DaySolution` for what that asks of the
+    solutions.
+
+    Args:
+        executor: the executor, one of `EXECUTORS`.
+        workers: the number of workers. The number of CPUs when not given.
+
+    Returns:
+        The new pool.
+
+    Raises:
+        ValueError: when the executor does not exist.
+    """
+    from concurrent.futures import (  # noqa: PLC0415
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+    )
+
+    if executor == 'processes':
+        return ProcessPoolExecutor(workers)
+    if executor == 'threads':
+        # The default of a thread pool is meant for waiting on I/O; the
+        # parts need a CPU each
+        return ThreadPoolExecutor(workers or os.cpu_count())
+    raise ValueError(
+        f'Unknown executor {executor!r}; expected one of '
+        f'{", ".join(EXECUTORS)}.'
+    )
@@ -0,0 +1,324 @@
+"""Module with the Grid class."""
+
+from collections.abc import Iterable, Iterator
+
+
+class Grid:
+    """A rectangular map of characters, like the maps of many puzzles.
+
+    All cells are stored as bytes in one flat `bytes` object, row after row,
+    instead of one list per row with one object per cell. A cell is found by
+    its flat index, and its neighbours by adding an offset to that index, so
+    moving around the map is plain integer arithmetic.
+
+    The map has a border of one cell with the `padding` value around it.
+    The neighbours of every cell on the map therefore exist, and a step off
+    the map lands on a padding cell instead of needing a bounds check.
+
+    Like the loaded data of solutions, a grid is read-only.
+    """
+
+    def __init__(
+        self, cells: bytes, width: int, height: int, padding: int
+    ) -> None:
+        """Set internal values.
+
+        Use `from_lines` to create a grid from the lines of an input.
+
+        Args:
+            cells: all cells, including the border, row after row.
+            width: the width of the map, without the border.
+            height: the height of the map, without the border.
+            padding: the value of the cells of the border.
+        """
+        self._cells = cells
+        self._width = width
+        self._height = height
+        self._padding = padding
+        self._stride = stride = width + 2
+        self._offsets = (-stride, 1, stride, -1)
+        self._diagonal_offsets = (
+            1 - stride,
+            stride + 1,
+            stride - 1,
+            -stride - 1,
+        )
+
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[bytes | memoryview], padding: int = 0
+    ) -> 'Grid':
+        """Create a grid from the lines of a map.
+
+        Args:
+            lines: the lines of the map. Shorter lines are filled up with the
+                padding value.
+            padding: the value of the cells of the border. It should not be
+                used on the map itself; the default 0 is never part of a
+                text input.
+
+        Returns:
+            The grid.
+        """
+        rows = [bytes(line) for line in lines]
+        width = max(map(len, rows), default=0)
+        border = bytes([padding])
+        cells = bytearray(border * (width + 2))
+        for row in rows:
+            cells += border
+            cells += row.ljust(width, border)
+            cells += border
+        cells += border * (width + 2)
+        return cls(bytes(cells), width, len(rows), padding)
+
+    @property
+    def cells(self) -> bytes:
+        """Get all cells, including the border.
+
+        Returns:
+            The cells, row after row, to use with flat indices.
+        """
+        return self._cells
+
+    @property
+    def width(self) -> int:
+        """Get the width of the map.
+
+        Returns:
+            The number of columns, without the border.
+        """
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Get the height of the map.
+
+        Returns:
+            The number of rows, without the border.
+        """
+        return self._height
+
+    @property
+    def padding(self) -> int:
+        """Get the value of the cells around the map.
+
+        Returns:
+            The value of the border cells.
+        """
+        return self._padding
+
+    @property
+    def stride(self) -> int:
+        """Get the distance between two rows in the flat indices.
+
+        Returns:
+            The width of a row, including the border.
+        """
+        return self._stride
+
+    @property
+    def offsets(self) -> tuple[int, int, int, int]:
+        """Get the offsets of the neighbours of a cell.
+
+        Returns:
+            The offsets to go north, east, south and west, in that order.
+        """
+        return self._offsets
+
+    @property
+    def diagonal_offsets(self) -> tuple[int, int, int, int]:
+        """Get the offsets of the diagonal neighbours of a cell.
+
+        Returns:
+            The offsets to go north-east, south-east, south-west and
+            north-west, in that order.
+        """
+        return self._diagonal_offsets
+
+    def index(self, x: int, y: int) -> int:
+        """Get the flat index of a position.
+
+        Args:
+            x: the column, from 0 to the width. -1 and the width itself are
+                the border.
+            y: the row, from 0 to the height. -1 and the height itself are
+                the border.
+
+        Returns:
+            The index in `cells`.
+        """
+        return (y + 1) * self._stride + x + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Get the position of a flat index.
+
+        Args:
+            index: the index in `cells`.
+
+        Returns:
+            The column and row.
+        """
+        y, x = divmod(index, self._stride)
+        return (x - 1, y - 1)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Check if a position is on the map.
+
+        Args:
+            x: the column.
+            y: the row.
+
+        Returns:
+            True when the position is on the map, not on or beyond the
+            border.
+        """
+        return 0 <= x < self._width and 0 <= y < self._height
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        """Get the value of a cell.
+
+        Args:
+            position: the column and row of the cell.
+
+        Returns:
+            The value of the cell; the padding value for the border.
+        """
+        return self._cells[self.index(*position)]
+
+    def indices(self) -> Iterator[int]:
+        """Iterate over the flat indices of the cells on the map.
+
+        Yields:
+            The index of every cell, row after row, without the border.
+        """
+        stride = self._stride
+        for start in range(stride + 1, (self._height + 1) * stride, stride):
+            yield from range(start, start + self._width)
+
+    def find(self, value: int) -> int:
+        """Find the first cell with a value.
+
+        Args:
+            value: the value to find.
+
+        Returns:
+            The flat index of the first cell with the value, or -1 if no
+            cell has it.
+        """
+        return self._cells.find(value)
+
+    def find_all(self, value: int) -> Iterator[int]:
+        """Find all cells with a value.
+
+        Args:
+            value: the value to find.
+
+        Yields:
+            The flat index of every cell with the value, in order.
+        """
+        find = self._cells.find
+        index = find(value)
+        while index != -1:
+            yield index
+            index = find(value, index + 1)
+
+    def row(self, y: int) -> bytes:
+        """Get the cells of a row.
+
+        Args:
+            y: the row.
+
+        Returns:
+            The cells of the row, without the border.
+        """
+        start = self.index(0, y)
+        return self._cells[start : start + self._width]
+
+    def rows(self) -> Iterator[bytes]:
+        """Iterate over the rows.
+
+        Yields:
+            The cells of every row, from top to bottom.
+        """
+        for y in range(self._height):
+            yield self.row(y)
+
+    def column(self, x: int) -> bytes:
+        """Get the cells of a column.
+
+        Args:
+            x: the column.
+
+        Returns:
+            The cells of the column, from top to bottom, without the border.
+        """
+        start = self.index(x, 0)
+        return self._cells[
+            start : start + self._height * self._stride : self._stride
+        ]
+
+    def columns(self) -> Iterator[bytes]:
+        """Iterate over the columns.
+
+        Yields:
+            The cells of every column, from left to right.
+        """
+        for x in range(self._width):
+            yield self.column(x)
+
+    def _lines(self, starts: Iterable[int], step: int) -> Iterator[bytes]:
+        """Take lines of cells from starting cells until the border.
+
+        Args:
+            starts: the flat indices of the first cells.
+            step: the offset between the cells of a line.
+
+        Yields:
+            The cells of every line, without the border.
+        """
+        cells = self._cells
+        stop = len(cells)
+        padding = bytes([self._padding])
+        for start in starts:
+            line = cells[start:stop:step]
+            yield line[: line.find(padding)]
+
+    def diagonals(self) -> Iterator[bytes]:
+        """Iterate over the diagonals that go down to the right.
+
+        The padding value is the end of a diagonal, so it must not be used on
+        the map itself.
+
+        Yields:
+            The cells of every diagonal, from the top left; first the ones
+            that start in the top row, then the ones that start in the left
+            column.
+        """
+        starts = [self.index(x, 0) for x in range(self._width)]
+        starts += [self.index(0, y) for y in range(1, self._height)]
+        return self._lines(starts, self._stride + 1)
+
+    def anti_diagonals(self) -> Iterator[bytes]:
+        """Iterate over the diagonals that go down to the left.
+
+        The padding value is the end of a diagonal, so it must not be used on
+        the map itself.
+
+        Yields:
+            The cells of every diagonal, from the top right; first the ones
+            that start in the top row, then the ones that start in the right
+            column.
+        """
+        starts = [self.index(x, 0) for x in range(self._width)]
+        starts += [
+            self.index(self._width - 1, y) for y in range(1, self._height)
+        ]
+        return self._lines(starts, self._stride - 1)
+
+    def __repr__(self) -> str:
+        """Get a representation of the grid.
+
+        Returns:
+            The representation, with the size of the map.
+        """
+        return f'Grid(<{self._width}x{self._height}>)'
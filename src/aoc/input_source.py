@@ -0,0 +1,268 @@
+"""Module with the InputSource class."""
+
+import mmap
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any
+
+from .grid import Grid
+from .integer_table import IntegerTable
+
+
+class InputSource:
+    """Input data for a solution.
+
+    The data of an input file is memory-mapped instead of read, so the
+    operating system loads it when it is used and it is never copied as a
+    whole. The data can be accessed as a `memoryview`, or as lines and
+    fields. The lines are views on the memory map, so no copy is made until
+    a line is converted to `bytes` or `str`.
+
+    Sources can be pickled, to send them to a process pool. For sources
+    backed by a file, only the path is pickled and the file is mapped again
+    on first use.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Set internal values.
+
+        Args:
+            path: the path of the input file.
+        """
+        self._path: str | None = path
+        self._bytes: bytes | None = None
+        self._mmap: mmap.mmap | None = None
+        self._data: memoryview | None = None
+        self._sha256: str | None = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputSource':
+        """Create an input source for data that is already in memory.
+
+        Args:
+            data: the input data.
+
+        Returns:
+            The input source.
+        """
+        source = cls.__new__(cls)
+        source.__setstate__({'path': None, 'bytes': bytes(data)})
+        return source
+
+    @classmethod
+    def of(cls, source: 'InputSource | str') -> 'InputSource':
+        """Get an input source for an input file or an input source.
+
+        This makes it possible for solutions to accept both.
+
+        Args:
+            source: the path of the input file, or an input source.
+
+        Returns:
+            The given input source, or a new one for the given path.
+        """
+        if isinstance(source, InputSource):
+            return source
+        return cls(source)
+
+    @property
+    def path(self) -> str | None:
+        """Get the path of the input file.
+
+        Returns:
+            The path, or None when the source was created from bytes.
+        """
+        return self._path
+
+    @property
+    def data(self) -> memoryview:
+        """Get the input data, without copying it.
+
+        Returns:
+            A read-only view on the data.
+        """
+        if self._data is None:
+            if self._bytes is not None:
+                self._data = memoryview(self._bytes)
+            else:
+                self._data = self._map_file()
+        return self._data
+
+    def _map_file(self) -> memoryview:
+        """Map the input file into memory.
+
+        Returns:
+            A read-only view on the mapped file.
+        """
+        with open(self._path or '', 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files cannot be mapped
+                self._bytes = b''
+                return memoryview(self._bytes)
+        return memoryview(self._mmap)
+
+    @property
+    def sha256(self) -> str:
+        """Get the SHA-256 hash of the input data.
+
+        The hash identifies the content of the input, so it can be used as
+        key for cached results. It is calculated once per source.
+
+        Returns:
+            The hash as hexadecimal string.
+        """
+        if self._sha256 is None:
+            import hashlib  # noqa: PLC0415
+
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def read_bytes(self) -> bytes:
+        """Get a copy of the input data.
+
+        Returns:
+            The data as bytes.
+        """
+        return self.data.tobytes()
+
+    def read_text(self) -> str:
+        """Get the input data as text.
+
+        Returns:
+            The data, decoded as UTF-8.
+        """
+        return str(self.data, 'utf-8')
+
+    def lines(self) -> Iterator[memoryview]:
+        """Iterate over the lines of the input data, without copying them.
+
+        Yields:
+            A view on every line, without the line ending. A last, empty line
+            (after a trailing newline) is not given.
+        """
+        data = self.data
+        end_of_data = len(data)
+        if self._mmap is not None:
+            find = self._mmap.find
+        else:
+            find = (self._bytes or b'').find
+
+        start = 0
+        while start < end_of_data:
+            end = find(b'\n', start)
+            if end == -1:
+                end = end_of_data
+            line_end = end
+            if line_end > start and data[line_end - 1] == 13:
+                line_end -= 1
+            yield data[start:line_end]
+            start = end + 1
+
+    def fields(self, separator: bytes | None = None) -> Iterator[list[bytes]]:
+        """Iterate over the fields of every line of the input data.
+
+        Args:
+            separator: the separator between the fields. By default, the
+                fields are separated by whitespace.
+
+        Yields:
+            A list with the fields of every line.
+        """
+        for line in self.lines():
+            yield line.tobytes().split(separator)
+
+    def integers(self, backend: str = 'python') -> IntegerTable:
+        """Get all integers in the input data, per line.
+
+        Args:
+            backend: `python`, or `numpy` to find the integers with NumPy
+                when it is installed.
+
+        Returns:
+            The table with the integers of every line.
+        """
+        return IntegerTable.from_bytes(self.data, backend)
+
+    def grid(self, padding: int = 0) -> Grid:
+        """Get the input data as a grid of characters.
+
+        Args:
+            padding: the value of the cells around the map.
+
+        Returns:
+            The grid with a cell for every character of every line.
+        """
+        return Grid.from_lines(self.lines(), padding)
+
+    def close(self) -> None:
+        """Release the memory map of the input file.
+
+        When views on the data (like lines) are still in use, the memory map
+        cannot be closed yet. It is then closed when the last view is gone.
+        """
+        try:
+            if self._data is not None:
+                self._data.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass
+        self._data = None
+        self._mmap = None
+
+    def __enter__(self) -> 'InputSource':
+        """Use the input source as context manager.
+
+        Returns:
+            The input source itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the input source when leaving the context.
+
+        Args:
+            exc_type: the type of the raised exception, if any.
+            exc_value: the raised exception, if any.
+            traceback: the traceback of the raised exception, if any.
+        """
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state to pickle; the memory map cannot be pickled.
+
+        Returns:
+            The path, or the data when the source has no file.
+        """
+        return {'path': self._path, 'bytes': self._bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled input source.
+
+        Args:
+            state: the state as created by `__getstate__`.
+        """
+        self._path = state['path']
+        self._bytes = state['bytes']
+        self._mmap = None
+        self._data = None
+        self._sha256 = None
+
+    def __repr__(self) -> str:
+        """Get a representation of the input source.
+
+        Returns:
+            The representation, with the path of the input file.
+        """
+        if self._path is None:
+            return f'InputSource.from_bytes(<{len(self._bytes or b"")} bytes>)'
+        return f'InputSource({self._path!r})'
@@ -0,0 +1,242 @@
+"""Module with the IntegerTable class."""
+
+import re
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import accumulate, chain, islice
+
+from .backend import select_backend
+
+# A signed integer, like `12` or `-3`. Other characters, like `+` in `X+94`,
+# are separators.
+_INTEGER = re.compile(rb'-?\d+')
+
+# Translation table that keeps the digits, minus signs and newlines, and
+# turns every other character into a space.
+_SEPARATORS = bytes(
+    character if character in b'0123456789-\n' else ord(' ')
+    for character in range(256)
+)
+
+# The most digits of an integer that always fits in 64 bits
+_MAX_DIGITS = 18
+
+
+def _as_bytes(data: bytes | memoryview) -> bytes:
+    """Get input data as `bytes`, copying it only when needed.
+
+    `translate` and `split` are only available on `bytes`; a memory map and
+    a `memoryview` have neither, and `bytes.translate` does not accept them.
+    So a view on a memory map is copied here. The copy only lives until it
+    is translated, and the translated text is a new object anyway. A view
+    on a whole `bytes` object, like the data of `InputSource.from_bytes`,
+    is not copied.
+
+    Args:
+        data: the input data.
+
+    Returns:
+        The data as bytes.
+    """
+    if isinstance(data, memoryview):
+        source = data.obj
+        if isinstance(source, bytes) and data.nbytes == len(source):
+            return source
+    return bytes(data)
+
+
+class IntegerTable:
+    """The integers of an input, per line.
+
+    All integers are stored in one flat array of signed 64-bit values, with
+    the offset of the first integer of every line in a second array. This
+    takes far less memory than a list of lists and a line can be taken as a
+    view on the values, without copying them.
+
+    Every line of the input is a row, also the lines without integers. So an
+    empty line stays an (empty) row, which can be used to find the sections
+    of an input.
+    """
+
+    def __init__(
+        self, values: array | list[int], offsets: Sequence[int]
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            values: all integers, as `array('q')`. A list is used for
+                integers that do not fit in 64 bits.
+            offsets: the index of the first value of every row, followed by
+                the number of values.
+        """
+        self._values = values
+        self._offsets = offsets
+        self._view: Sequence[int] = (
+            memoryview(values) if isinstance(values, array) else values
+        )
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes | memoryview, backend: str = 'python'
+    ) -> 'IntegerTable':
+        """Find all integers in input data.
+
+        Everything that is not part of an integer separates the integers;
+        every line gives one row. The separators are replaced in a single
+        pass with `bytes.translate`, so the integers can be split and
+        converted by the builtins instead of matching them one by one.
+
+        With the `numpy` backend, the data is read with `numpy.frombuffer`
+        without copying it, and the integers are found and converted with
+        array operations, so no Python object is made per integer. The
+        table is the same for both backends.
+
+        Args:
+            data: the input data.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
+
+        Returns:
+            The table with the integers.
+        """
+        if select_backend(backend) == 'numpy':
+            table = cls._from_bytes_numpy(data)
+            if table is not None:
+                return table
+
+        text = _as_bytes(data).translate(_SEPARATORS)
+        try:
+            numbers = list(map(int, text.split()))
+            counts = map(len, map(bytes.split, text.splitlines()))
+        except ValueError:
+            # A minus sign that is not part of an integer, like in `a - b`
+            rows = [
+                _INTEGER.findall(line) for line in _as_bytes(data).splitlines()
+            ]
+            numbers = list(map(int, chain.from_iterable(rows)))
+            counts = map(len, rows)
+
+        offsets = array('q', [0])
+        offsets.extend(accumulate(counts))
+        try:
+            values: array | list[int] = array('q', numbers)
+        except OverflowError:
+            values = numbers
+        return cls(values, offsets)
+
+    @classmethod
+    def _from_bytes_numpy(
+        cls, data: bytes | memoryview
+    ) -> 'IntegerTable | None':
+        """Find all integers in input data with NumPy.
+
+        Args:
+            data: the input data.
+
+        Returns:
+            The table with the integers, or None when an integer can have
+            more than 64 bits.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        characters = np.frombuffer(data, dtype=np.uint8)
+        is_digit = (characters >= ord('0')) & (characters <= ord('9'))
+        # 1 at the first digit of an integer, -1 after the last digit
+        edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        lengths = np.flatnonzero(edges == -1) - starts
+        if len(starts) and lengths.max() > _MAX_DIGITS:
+            return None
+
+        # Every digit times the power of ten of its place in the integer,
+        # summed per integer
+        digits = np.flatnonzero(is_digit)
+        places = np.repeat(starts + lengths, lengths) - digits - 1
+        powers = 10 ** np.arange(_MAX_DIGITS, dtype=np.int64)
+        terms = (characters[digits] - ord('0')) * powers[places]
+        numbers = np.zeros(len(starts), dtype=np.int64)
+        if len(starts):
+            numbers = np.add.reduceat(terms, np.cumsum(lengths) - lengths)
+        previous = characters[np.maximum(starts - 1, 0)]
+        numbers[(starts > 0) & (previous == ord('-'))] *= -1
+
+        # The number of integers that start before the end of every line
+        ends = np.searchsorted(starts, np.flatnonzero(characters == 10))
+        values = array('q')
+        values.frombytes(numbers.tobytes())
+        offsets = array('q', [0])
+        offsets.frombytes(ends.astype(np.int64).tobytes())
+        if len(characters) and characters[-1] != 10:
+            offsets.append(len(values))
+        return cls(values, offsets)
+
+    @property
+    def values(self) -> array | list[int]:
+        """Get all integers of all rows.
+
+        Returns:
+            The integers as `array('q')`, or as list when they do not fit in
+            64 bits.
+        """
+        return self._values
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        """Get the offsets of the rows in the values.
+
+        Returns:
+            The index of the first value of every row, followed by the number
+            of values.
+        """
+        return self._offsets
+
+    def __len__(self) -> int:
+        """Get the number of rows.
+
+        Returns:
+            The number of rows.
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row: int) -> Sequence[int]:
+        """Get the integers of one row, without copying them.
+
+        Args:
+            row: the index of the row.
+
+        Returns:
+            A view on the integers of the row, or a copy when the values are
+            stored in a list.
+        """
+        if row < 0:
+            row += len(self)
+        return self._view[self._offsets[row] : self._offsets[row + 1]]
+
+    def __iter__(self) -> Iterator[Sequence[int]]:
+        """Iterate over the rows.
+
+        Yields:
+            A view on the integers of every row.
+        """
+        view = self._view
+        offsets = self._offsets
+        for start, end in zip(offsets, islice(offsets, 1, None), strict=False):
+            yield view[start:end]
+
+    def sections(self) -> Iterator[list[Sequence[int]]]:
+        """Iterate over the sections of the input.
+
+        A section is a group of rows between rows without integers, like the
+        blocks of an input that are separated by empty lines.
+
+        Yields:
+            The rows of every section.
+        """
+        section: list[Sequence[int]] = []
+        for row in self:
+            if row:
+                section.append(row)
+            elif section:
+                yield section
+                section = []
+        if section:
+            yield section
@@ -0,0 +1,221 @@
+"""Module with classes and functions to measure the memory of solutions."""
+
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+from .benchmark import PHASES
+from .day_solution import DaySolution
+
+# Allocations that are made by the measurement itself
+_IGNORED_FILES = (
+    __file__,
+    tracemalloc.__file__,
+    '<frozen importlib._bootstrap>',
+    '<frozen importlib._bootstrap_external>',
+    '<unknown>',
+)
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    """Line of code that allocated memory during a phase.
+
+    Attributes:
+        filename: the file with the line.
+        lineno: the line number.
+        size: the memory allocated by the line that was still in use at the
+            end of the phase, in bytes.
+        count: the number of memory blocks of that memory.
+    """
+
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the site to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'filename': self.filename,
+            'lineno': self.lineno,
+            'size': self.size,
+            'count': self.count,
+        }
+
+
+@dataclass(frozen=True)
+class PhaseMemory:
+    """Memory used by one phase of a solution.
+
+    Attributes:
+        peak: the highest amount of memory that was allocated during the
+            phase at the same time, in bytes.
+        retained: the memory allocated during the phase that was still in
+            use at the end of it, in bytes. For the load and prepare phases,
+            this is the data that is kept for the next phases.
+        sites: the lines that allocated most of the retained memory, from
+            large to small.
+    """
+
+    peak: int
+    retained: int
+    sites: tuple[AllocationSite, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the measurement to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'peak': self.peak,
+            'retained': self.retained,
+            'sites': [site.to_dict() for site in self.sites],
+        }
+
+
+@dataclass
+class DayMemory:
+    """Memory used by the phases of the solution for a day.
+
+    Attributes:
+        day: the day of the solution.
+        phases: the measurement per phase, in the order of `PHASES`.
+    """
+
+    day: int
+    phases: dict[str, PhaseMemory] = field(default_factory=dict)
+
+    @property
+    def peak(self) -> int:
+        """Get the highest amount of memory used by the solution.
+
+        The data that is retained by a phase is still in use during the
+        next phases, so it is added to their peaks.
+
+        Returns:
+            The highest memory use of all phases, in bytes.
+        """
+        peak = 0
+        retained = 0
+        for phase in self.phases.values():
+            peak = max(peak, retained + phase.peak)
+            retained += phase.retained
+        return peak
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the measurements to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'peak': self.peak,
+            'phases': {
+                phase: memory.to_dict()
+                for phase, memory in self.phases.items()
+            },
+        }
+
+
+def _run_phase(solution: DaySolution, phase: str) -> None:
+    """Run one phase of a solution.
+
+    Args:
+        solution: the solution to run the phase of.
+        phase: the phase to run.
+    """
+    if phase == 'load':
+        solution.load_data()
+    elif phase == 'prepare':
+        solution.prepare()
+    elif phase == 'part1':
+        solution.solve_puzzle_one()
+    else:
+        solution.solve_puzzle_two()
+
+
+def _top_sites(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int
+) -> tuple[AllocationSite, ...]:
+    """Find the lines that allocated the most memory between two snapshots.
+
+    Args:
+        before: the snapshot at the start of the phase.
+        after: the snapshot at the end of the phase.
+        top: the maximum number of lines to give.
+
+    Returns:
+        The lines with the most memory that was allocated between the
+        snapshots and not freed, from large to small.
+    """
+    filters = [
+        tracemalloc.Filter(inclusive=False, filename_pattern=filename)
+        for filename in _IGNORED_FILES
+    ]
+    differences = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), 'lineno'
+    )
+    sites: list[AllocationSite] = []
+    for difference in differences:
+        if len(sites) == top:
+            break
+        if difference.size_diff <= 0:
+            continue
+        frame = difference.traceback[0]
+        sites.append(
+            AllocationSite(
+                filename=frame.filename,
+                lineno=frame.lineno,
+                size=difference.size_diff,
+                count=difference.count_diff,
+            )
+        )
+    return tuple(sites)
+
+
+def measure_memory(day: int, solution: DaySolution, top: int = 5) -> DayMemory:
+    """Measure the memory of every phase of a solution with `tracemalloc`.
+
+    The phases are run one after another on the same object, like in a
+    normal run, so the memory retained by the load and prepare phases is not
+    counted again for the parts. `tracemalloc` makes the code several times
+    slower, so the times of this run are not useful.
+
+    Args:
+        day: the day of the solution.
+        solution: a new solution object, that did not load its data yet.
+        top: the number of allocation sites to give per phase.
+
+    Returns:
+        The peak and retained memory per phase, with the lines that
+        allocated the retained memory.
+    """
+    result = DayMemory(day=day)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        for phase in PHASES:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+            _run_phase(solution, phase)
+            end_memory, peak_memory = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+
+            result.phases[phase] = PhaseMemory(
+                peak=peak_memory - start_memory,
+                retained=end_memory - start_memory,
+                sites=_top_sites(before, after, top),
+            )
+            del before, after
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result
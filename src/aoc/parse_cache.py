@@ -0,0 +1,133 @@
+"""Module with the ParseCache class."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import TYPE_CHECKING
+
+from .input_source import InputSource
+
+if TYPE_CHECKING:
+    from .day_solution import DaySolution
+
+# Version of the layout of the cache files. Changing it makes all existing
+# cache files stale.
+CACHE_VERSION = 1
+
+
+class ParseCache:
+    """Cache for the parsed input data of solutions.
+
+    The attributes that a solution lists in `PARSED_ATTRIBUTES` are pickled
+    to a file in the cache directory after parsing. The next time the same
+    input is loaded, they are read from that file and parsing is skipped.
+
+    The file name is a hash of the content of the input, the solution class,
+    its `PARSER_VERSION` and its backend. A changed input gives a new file,
+    and so does a changed parser, as long as its version is raised. Files
+    that cannot be loaded, for instance because a pickled class was renamed,
+    are treated as missing. Stale files are not
+    removed; the cache directory can be deleted at any time.
+
+    Only the directory is pickled, so a cache can be sent to a process pool
+    together with the solution.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Set internal values.
+
+        Args:
+            directory: the directory for the cache files. It is created when
+                the first file is stored.
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        """Get the directory with the cache files.
+
+        Returns:
+            The directory.
+        """
+        return self._directory
+
+    def _path(self, solution: 'DaySolution', source: InputSource) -> str:
+        """Get the path of the cache file for a solution and input.
+
+        Args:
+            solution: the solution that parsed the input.
+            source: the input that was parsed.
+
+        Returns:
+            The path of the cache file.
+        """
+        solution_class = type(solution)
+        key = hashlib.sha256(
+            f'{CACHE_VERSION}:{solution_class.__module__}.'
+            f'{solution_class.__qualname__}:{solution_class.PARSER_VERSION}:'
+            f'{solution.backend}:{source.sha256}'.encode()
+        ).hexdigest()
+        return os.path.join(
+            self._directory, f'{solution_class.__name__.lower()}-{key}.pickle'
+        )
+
+    def load(self, solution: 'DaySolution', source: InputSource) -> bool:
+        """Restore the parsed attributes of a solution from the cache.
+
+        Args:
+            solution: the solution to restore the attributes of.
+            source: the input of the solution.
+
+        Returns:
+            True when the attributes were restored, False when the input is
+            not in the cache (or the cache file cannot be read).
+        """
+        try:
+            with open(self._path(solution, source), 'rb') as file:
+                attributes = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False
+        except (AttributeError, ImportError):
+            # A pickled class that was renamed or moved
+            return False
+
+        if set(attributes) != set(solution.PARSED_ATTRIBUTES):
+            return False
+        for name, value in attributes.items():
+            setattr(solution, name, value)
+        return True
+
+    def store(self, solution: 'DaySolution', source: InputSource) -> None:
+        """Store the parsed attributes of a solution in the cache.
+
+        The file is written under a temporary name first, so other processes
+        never read a half-written file.
+
+        Args:
+            solution: the solution with the parsed attributes.
+            source: the input of the solution.
+        """
+        attributes = {
+            name: getattr(solution, name)
+            for name in solution.PARSED_ATTRIBUTES
+        }
+        os.makedirs(self._directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory, suffix='.tmp'
+        )
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                pickle.dump(attributes, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self._path(solution, source))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def __repr__(self) -> str:
+        """Get a representation of the cache.
+
+        Returns:
+            The representation, with the directory.
+        """
+        return f'ParseCache({self._directory!r})'
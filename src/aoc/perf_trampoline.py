@@ -0,0 +1,54 @@
+"""Module with functions to profile solutions with Linux `perf`."""
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+def perf_supported() -> bool:
+    """Check if this Python can make its frames visible to `perf`.
+
+    Returns:
+        True when the perf trampoline can be used; this needs Linux and a
+        CPython build with support for it.
+    """
+    if not hasattr(sys, 'activate_stack_trampoline'):
+        return False
+    if sys.is_stack_trampoline_active():
+        return True
+    try:
+        sys.activate_stack_trampoline('perf')
+    except ValueError:
+        return False
+    sys.deactivate_stack_trampoline()
+    return True
+
+
+@contextmanager
+def perf_trampoline() -> Iterator[None]:
+    """Make the Python functions visible to `perf` in a `with` block.
+
+    While the trampoline is active, every Python function that runs gets a
+    small piece of native code, and its name is written to the perf map file
+    `/tmp/perf-<pid>.map`. `perf record` and `perf report` then show the
+    Python functions between the interpreter and C functions. The map file
+    is needed by `perf report`, so it is not removed.
+
+    When the trampoline is already active, for example with `python -X
+    perf`, it is left active.
+
+    Yields:
+        Nothing; the trampoline is active inside the block.
+
+    Raises:
+        ValueError: when this Python or platform has no perf support.
+    """
+    if sys.is_stack_trampoline_active():
+        yield
+        return
+
+    sys.activate_stack_trampoline('perf')
+    try:
+        yield
+    finally:
+        sys.deactivate_stack_trampoline()
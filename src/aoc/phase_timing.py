@@ -0,0 +1,202 @@
+"""Module with the PhaseTiming class and the `timed` decorator."""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .day_solution import DaySolution
+
+# Protects the timings of solutions that are used from several threads.
+# Phases are coarse, so it is hardly ever contended.
+_timings_lock = threading.Lock()
+
+# The collectors of `collect_phases`, per thread
+_collecting = threading.local()
+
+
+@dataclass
+class PhaseTiming:
+    """Time spent in a named phase inside a solution.
+
+    Attributes:
+        calls: how many times the phase was run.
+        wall_time: the total wall time of all runs, in seconds.
+        cpu_time: the total CPU time of all runs, in seconds.
+    """
+
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+
+    def __add__(self, other: 'PhaseTiming') -> 'PhaseTiming':
+        """Add the runs of another timing to these runs.
+
+        Args:
+            other: the timing to add.
+
+        Returns:
+            A new timing with the runs of both.
+        """
+        return PhaseTiming(
+            calls=self.calls + other.calls,
+            wall_time=self.wall_time + other.wall_time,
+            cpu_time=self.cpu_time + other.cpu_time,
+        )
+
+    def __sub__(self, other: 'PhaseTiming') -> 'PhaseTiming':
+        """Get the runs that were done since an earlier copy of this timing.
+
+        Args:
+            other: the earlier copy.
+
+        Returns:
+            A new timing with only the later runs.
+        """
+        return PhaseTiming(
+            calls=self.calls - other.calls,
+            wall_time=self.wall_time - other.wall_time,
+            cpu_time=self.cpu_time - other.cpu_time,
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert the timing to a dictionary.
+
+        Returns:
+            The calls and times, so they can be written as JSON.
+        """
+        return {
+            'calls': self.calls,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+        }
+
+
+def timing_enabled() -> bool:
+    """Check if the phases of solutions are recorded in this thread.
+
+    Timing is opt-in: the phases are only recorded inside `collect_phases`,
+    so solutions run at full speed when nobody asks for their phases.
+
+    Returns:
+        True when a `collect_phases` block is active in this thread.
+    """
+    return bool(getattr(_collecting, 'collectors', None))
+
+
+def _collectors() -> list[dict[str, PhaseTiming]]:
+    """Get the collectors of `collect_phases` of this thread.
+
+    Returns:
+        The timings that collect the phases, from outer to inner.
+    """
+    collectors = getattr(_collecting, 'collectors', None)
+    if collectors is None:
+        collectors = _collecting.collectors = []
+    return collectors
+
+
+@contextmanager
+def collect_phases() -> Iterator[dict[str, PhaseTiming]]:
+    """Collect the phases that run in this thread in a `with` block.
+
+    Phases of solutions are only recorded inside this block; see
+    `timing_enabled`. The timings of a solution add up the phases of all
+    threads that use it. This gives the phases of one thread, for instance
+    those of one part when both parts of a solution are solved at the same
+    time.
+
+    Yields:
+        The timings of the phases, by phase name. They are filled in while
+        the block runs; a phase that was running when the block raised is
+        included.
+    """
+    collectors = _collectors()
+    collected: dict[str, PhaseTiming] = {}
+    collectors.append(collected)
+    try:
+        yield collected
+    finally:
+        collectors.pop()
+
+
+@contextmanager
+def record_phase(timings: dict[str, PhaseTiming], name: str) -> Iterator[None]:
+    """Record the time of the code in a `with` block.
+
+    This always records the time; solutions use `DaySolution.timing`,
+    which only does so when timing is enabled. The run is also added to the
+    phases collected by `collect_phases` in this thread. The CPU time is
+    that of this thread.
+
+    Args:
+        timings: the timings to add the run to.
+        name: the name of the phase.
+
+    Yields:
+        Nothing; the block is timed when it ends, also when it raises.
+    """
+    # Added before running, so outer phases come before inner ones
+    with _timings_lock:
+        timing = timings.get(name)
+        if timing is None:
+            timing = timings[name] = PhaseTiming()
+    collected = [
+        collector.setdefault(name, PhaseTiming())
+        for collector in _collectors()
+    ]
+
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - start_wall
+        cpu_time = time.thread_time() - start_cpu
+        with _timings_lock:
+            timing.calls += 1
+            timing.wall_time += wall_time
+            timing.cpu_time += cpu_time
+        # Only used by this thread
+        for collected_timing in collected:
+            collected_timing.calls += 1
+            collected_timing.wall_time += wall_time
+            collected_timing.cpu_time += cpu_time
+
+
+def timed[R](
+    name: str | None = None,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Record the time of every call of a method of a solution.
+
+    The time is added to the `timings` of the solution when timing is
+    enabled; otherwise the method is called directly. Use it for coarse
+    methods that run once or a few times per part, not for helpers that run
+    in a loop: timing costs about a microsecond per call. Recursive methods
+    are counted once per call, so their time would be counted more than
+    once.
+
+    Args:
+        name: the name of the phase. The name of the method when not given.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(method: Callable[..., R]) -> Callable[..., R]:
+        phase_name = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self: 'DaySolution', *args: object, **kwargs: object) -> R:
+            if not timing_enabled():
+                return method(self, *args, **kwargs)
+            with self.timing(phase_name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
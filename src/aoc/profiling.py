@@ -0,0 +1,127 @@
+"""Module with functions to profile solutions with `cProfile`."""
+
+import cProfile
+import os
+import pstats
+
+from .day_solution import DaySolution
+
+# A function in the statistics: the file, the line and the name
+type _Function = tuple[str, int, str]
+
+# Call paths that add less time than this are left out of the stacks, to
+# keep the number of paths through the call graph small
+_MINIMUM_TIME = 1e-6
+
+
+def profile_solution(
+    solution: DaySolution, part: int | None = None
+) -> pstats.Stats:
+    """Run a solution under `cProfile`.
+
+    Args:
+        solution: the solution to profile.
+        part: the part to profile; 1 or 2. The data is loaded and prepared
+            before profiling starts, so only the part itself is profiled.
+            When not given, the loading, preparing and both parts are
+            profiled.
+
+    Returns:
+        The statistics of the profiled functions.
+    """
+    if part is not None:
+        solution.prepare()
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        if part is None:
+            solution.prepare()
+        if part in (None, 1):
+            solution.solve_puzzle_one()
+        if part in (None, 2):
+            solution.solve_puzzle_two()
+    finally:
+        profile.disable()
+    return pstats.Stats(profile)
+
+
+def _frame_name(function: _Function) -> str:
+    """Get the name of a function for a collapsed stack.
+
+    Args:
+        function: the function as it is stored in the statistics.
+
+    Returns:
+        The name of the function with its file and line, without the
+        semicolons that separate the frames.
+    """
+    filename, line, name = function
+    if filename == '~':
+        # Builtins, like `<built-in method builtins.sorted>`
+        frame = name
+    else:
+        frame = f'{name} ({os.path.basename(filename)}:{line})'
+    return frame.replace(';', ':')
+
+
+def collapsed_stacks(stats: pstats.Stats) -> list[str]:
+    """Convert profile statistics to collapsed stacks.
+
+    Every line is a call path with the frames separated by semicolons,
+    followed by the time spent in the last frame in microseconds. This is
+    the input format of flamegraph tools like `flamegraph.pl`, `inferno` and
+    speedscope.
+
+    `cProfile` only records which function called which, not the full call
+    paths. The paths are rebuilt from the callers: the time of a function
+    is divided over its callers in the same ratio as the cumulative time
+    of the calls. Recursive calls are not repeated in the paths; their time
+    is counted in the outermost call.
+
+    Args:
+        stats: the statistics of a profile.
+
+    Returns:
+        The collapsed stacks, one line per call path.
+    """
+    functions = stats.stats
+    callees: dict[_Function, list[tuple[_Function, float]]] = {}
+    # Cumulative time of the calls from other functions
+    called_time: dict[_Function, float] = {}
+    roots: list[_Function] = []
+    for function, (_, _, _, _, callers) in functions.items():
+        called_time[function] = 0.0
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            if caller == function:
+                continue
+            called_time[function] += cumulative_time
+            callees.setdefault(caller, []).append((function, cumulative_time))
+        if called_time[function] == 0 and not callers.keys() - {function}:
+            roots.append(function)
+
+    lines: list[str] = []
+    # Paths to visit, with the share of the time of the last function
+    # that was spent on that path
+    paths: list[tuple[tuple[_Function, ...], float]] = [
+        ((root,), 1.0) for root in reversed(roots)
+    ]
+    while paths:
+        path, share = paths.pop()
+        function = path[-1]
+        own_time = functions[function][2]
+
+        microseconds = round(own_time * share * 1_000_000)
+        if microseconds > 0:
+            stack = ';'.join(_frame_name(frame) for frame in path)
+            lines.append(f'{stack} {microseconds}')
+
+        for callee, call_time in reversed(callees.get(function, [])):
+            if callee in path:
+                continue
+            if call_time * share < _MINIMUM_TIME:
+                continue
+            paths.append(
+                ((*path, callee), share * call_time / called_time[callee])
+            )
+    return lines
@@ -0,0 +1,132 @@
+"""Module with the result classes for a run of solutions."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .phase_timing import PhaseTiming
+
+
+@dataclass(frozen=True)
+class PartResult:
+    """Result of solving one part of the puzzle for a day.
+
+    A result that comes from the answer cache has `cached` set; its times are
+    the times it took to look it up.
+
+    A part that was stopped because it took longer than its time budget has
+    `timed_out` set, `TIMEOUT` as answer, and the time until it was stopped.
+
+    The `timings` are the phases inside the solution that were recorded
+    while solving this part; for a stopped part, the phases that ran until
+    then.
+    """
+
+    day: int
+    part: int
+    answer: str
+    wall_time: float
+    cpu_time: float
+    cached: bool = False
+    timed_out: bool = False
+    timings: dict[str, PhaseTiming] = field(default_factory=dict, hash=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a dictionary.
+
+        Returns:
+            A dictionary that can be serialized to JSON.
+        """
+        return {
+            'day': self.day,
+            'part': self.part,
+            'answer': self.answer,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'cached': self.cached,
+            'timed_out': self.timed_out,
+            'timings': {
+                name: timing.to_dict() for name, timing in self.timings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'PartResult':
+        """Create the result from a dictionary.
+
+        Args:
+            data: a dictionary as created by `to_dict`.
+
+        Returns:
+            The part result.
+        """
+        return cls(
+            day=data['day'],
+            part=data['part'],
+            answer=data['answer'],
+            wall_time=data['wall_time'],
+            cpu_time=data['cpu_time'],
+            cached=data['cached'],
+            timed_out=data.get('timed_out', False),
+            timings={
+                name: PhaseTiming(**timing)
+                for name, timing in data['timings'].items()
+            },
+        )
+
+
+@dataclass
+class RunResult:
+    """Result of solving all parts for all registered days."""
+
+    parts: list[PartResult] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def cpu_time(self) -> float:
+        """Get the summed CPU time for all parts.
+
+        Returns:
+            The CPU time of all parts together, in seconds.
+        """
+        return sum(part.cpu_time for part in self.parts)
+
+    @property
+    def timed_out(self) -> list[PartResult]:
+        """Get the parts that were stopped because of their time budget.
+
+        Returns:
+            The results of the stopped parts, in day and part order.
+        """
+        return [part for part in self.parts if part.timed_out]
+
+    @property
+    def days(self) -> dict[int, list[PartResult]]:
+        """Get the results grouped per day.
+
+        Returns:
+            A dictionary with the day as key and the part results, in part
+            order, as value. The days are in order.
+        """
+        days: dict[int, list[PartResult]] = {}
+        for part in self.parts:
+            days.setdefault(part.day, []).append(part)
+        return days
+
+    @property
+    def timings(self) -> dict[int, dict[str, PhaseTiming]]:
+        """Get the recorded phases inside the solutions, per day.
+
+        Returns:
+            A dictionary with the day as key and the timings of both parts
+            together as value. Days without recorded phases are left out.
+        """
+        timings: dict[int, dict[str, PhaseTiming]] = {}
+        for part in self.parts:
+            if not part.timings:
+                continue
+            day_timings = timings.setdefault(part.day, {})
+            for name, timing in part.timings.items():
+                day_timings[name] = (
+                    day_timings.get(name, PhaseTiming()) + timing
+                )
+        return timings
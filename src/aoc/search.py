@@ -0,0 +1,259 @@
+"""Module with iterative graph searches on flat grid indices.
+
+The searches keep their own stack or queue instead of calling themselves,
+so they work on graphs of any size without hitting the recursion limit of
+Python, and cost a loop iteration per node instead of a function call.
+
+Nodes are integers from 0 up to a maximum, like the flat indices of a
+`Grid`. The edges are given by a function that gives the neighbours of a
+node.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+
+from .grid import Grid
+
+# A function that gives the nodes that can be reached from a node
+type Neighbours = Callable[[int], Iterable[int]]
+
+
+class Visited:
+    """Set of visited nodes, for nodes from 0 up to a maximum.
+
+    Instead of a `set` with an integer object per node, every node has one
+    byte in a `bytearray`. That is far smaller for the dense flat indices of
+    a grid, and the searches in this module check nodes by indexing `flags`,
+    without hashing or method calls.
+
+    The visited nodes are also kept in order, so `clear` only resets those
+    nodes. One `Visited` can be reused for many small searches on a large
+    grid.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Set internal values.
+
+        Args:
+            size: the number of nodes; nodes go from 0 up to this size.
+        """
+        self._flags = bytearray(size)
+        self._nodes: list[int] = []
+        self._view = memoryview(self._flags).toreadonly()
+
+    @classmethod
+    def for_grid(cls, grid: Grid) -> 'Visited':
+        """Create a set for the flat indices of a grid.
+
+        Args:
+            grid: the grid.
+
+        Returns:
+            An empty set with room for all cells, including the border.
+        """
+        return cls(len(grid.cells))
+
+    @property
+    def flags(self) -> memoryview:
+        """Get the visited flag of every node.
+
+        Checking a flag is faster than `in` in the inner loop of a search.
+        Nodes are marked with `add`, which also keeps them in order.
+
+        Returns:
+            A read-only view with one byte per node; 1 when it is visited.
+        """
+        return self._view
+
+    def add(self, node: int) -> None:
+        """Mark a node as visited.
+
+        Args:
+            node: the node.
+        """
+        if not self._flags[node]:
+            self._flags[node] = 1
+            self._nodes.append(node)
+
+    def __contains__(self, node: int) -> bool:
+        """Check if a node is visited.
+
+        Args:
+            node: the node.
+
+        Returns:
+            True when the node is visited.
+        """
+        return self._flags[node] == 1
+
+    def __len__(self) -> int:
+        """Get the number of visited nodes.
+
+        Returns:
+            The number of nodes.
+        """
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the visited nodes.
+
+        Returns:
+            An iterator over the nodes, in the order they were visited.
+        """
+        return iter(self._nodes)
+
+    def clear(self) -> None:
+        """Forget all visited nodes."""
+        flags = self._flags
+        for node in self._nodes:
+            flags[node] = 0
+        self._nodes.clear()
+
+
+def bfs(
+    starts: Iterable[int], neighbours: Neighbours, visited: Visited
+) -> Iterator[tuple[int, int]]:
+    """Search breadth first.
+
+    Args:
+        starts: the nodes to start from, at distance 0.
+        neighbours: the function that gives the neighbours of a node.
+        visited: the nodes that are already visited; they are skipped. The
+            visited nodes are added to it.
+
+    Yields:
+        Every reachable node with its distance to the nearest start, in the
+        order of that distance.
+    """
+    flags = visited.flags
+    mark = visited.add
+    queue: deque[tuple[int, int]] = deque()
+    for start in starts:
+        if not flags[start]:
+            mark(start)
+            queue.append((start, 0))
+
+    while queue:
+        node, distance = queue.popleft()
+        yield node, distance
+        for neighbour in neighbours(node):
+            if not flags[neighbour]:
+                mark(neighbour)
+                queue.append((neighbour, distance + 1))
+
+
+def dfs(
+    starts: Iterable[int], neighbours: Neighbours, visited: Visited
+) -> Iterator[int]:
+    """Search depth first.
+
+    Args:
+        starts: the nodes to start from.
+        neighbours: the function that gives the neighbours of a node.
+        visited: the nodes that are already visited; they are skipped. The
+            visited nodes are added to it.
+
+    Yields:
+        Every reachable node, once, when it is visited.
+    """
+    flags = visited.flags
+    mark = visited.add
+    stack = list(starts)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if flags[node]:
+            continue
+        mark(node)
+        yield node
+        for neighbour in neighbours(node):
+            if not flags[neighbour]:
+                stack.append(neighbour)
+
+
+def flood_fill(
+    grid: Grid, start: int, visited: Visited | None = None
+) -> list[int]:
+    """Find the area of connected cells with the same value.
+
+    Cells are connected when they are next to each other horizontally or
+    vertically. The border around the map is never part of the area.
+
+    Args:
+        grid: the grid.
+        start: the flat index of a cell in the area.
+        visited: the cells that are already visited; they are skipped. The
+            cells of the area are added to it. A new set is used when not
+            given.
+
+    Returns:
+        The flat indices of the cells in the area; the start first.
+    """
+    if visited is None:
+        visited = Visited.for_grid(grid)
+    flags = visited.flags
+    mark = visited.add
+    cells = grid.cells
+    value = cells[start]
+    if value == grid.padding or flags[start]:
+        return []
+
+    north, east, south, west = grid.offsets
+    mark(start)
+    area = [start]
+    # The area itself is the stack: every cell is taken once, in order
+    for node in area:
+        for neighbour in (
+            node + north,
+            node + east,
+            node + south,
+            node + west,
+        ):
+            if cells[neighbour] == value and not flags[neighbour]:
+                mark(neighbour)
+                area.append(neighbour)
+    return area
+
+
+def count_paths(
+    starts: Iterable[int],
+    neighbours: Neighbours,
+    is_target: Callable[[int], bool],
+) -> list[int]:
+    """Count the paths from nodes to any target in a directed acyclic graph.
+
+    The number of paths from every node is counted once, and used for all
+    paths that go through it. A path ends at the first target it reaches.
+    The graph must not have cycles.
+
+    Args:
+        starts: the nodes to count the paths from.
+        neighbours: the function that gives the next nodes of a node.
+        is_target: the function that checks if a node is a target.
+
+    Returns:
+        The number of paths from every start, in the order of the starts.
+    """
+    paths: dict[int, int] = {}
+    counts: list[int] = []
+    for start in starts:
+        # A node with its next nodes is counted when those are counted
+        stack: list[tuple[int, list[int] | None]] = [(start, None)]
+        while stack:
+            node, next_nodes = stack.pop()
+            if next_nodes is not None:
+                paths[node] = sum(
+                    [paths[next_node] for next_node in next_nodes]
+                )
+            elif node in paths:
+                continue
+            elif is_target(node):
+                paths[node] = 1
+            else:
+                next_nodes = list(neighbours(node))
+                stack.append((node, next_nodes))
+                for next_node in next_nodes:
+                    if next_node not in paths:
+                        stack.append((next_node, None))
+        counts.append(paths[start])
+    return counts
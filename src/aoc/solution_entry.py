@@ -0,0 +1,201 @@
+"""Module with the SolutionEntry class."""
+
+import functools
+import hashlib
+import importlib
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass, field
+
+from .day_solution import DaySolution
+from .input_source import InputSource
+
+
+def _package_files(directory: str) -> tuple[tuple[str, int, int], ...]:
+    """Get the Python files of a package, with their time and size.
+
+    Args:
+        directory: the directory of the package.
+
+    Returns:
+        The path relative to the directory, the modification time in
+        nanoseconds and the size of every file, in a fixed order.
+    """
+    files: list[tuple[str, int, int]] = []
+    for root, subdirectories, filenames in os.walk(directory):
+        # Walked in a fixed order, so the hash does not depend on the disk
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            path = os.path.join(root, filename)
+            status = os.stat(path)
+            files.append(
+                (
+                    os.path.relpath(path, directory),
+                    status.st_mtime_ns,
+                    status.st_size,
+                )
+            )
+    return tuple(files)
+
+
+@functools.lru_cache(maxsize=1)
+def _hash_files(
+    directory: str, files: tuple[tuple[str, int, int], ...]
+) -> bytes:
+    """Hash the names and contents of the files of a package.
+
+    The files are only read again when one of them was added, removed or
+    changed in time or size.
+
+    Args:
+        directory: the directory of the package.
+        files: the files, as given by `_package_files`.
+
+    Returns:
+        The hash.
+    """
+    digest = hashlib.sha256()
+    for relative_path, _, _ in files:
+        digest.update(relative_path.encode() + b'\0')
+        with open(os.path.join(directory, relative_path), 'rb') as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.digest()
+
+
+def _package_digest() -> bytes:
+    """Get a hash of the source files of the `aoc` package.
+
+    Every solution is built on this package, so its code is part of the
+    fingerprint of every solution. The files are checked on every call, so
+    long-running commands like `watch` and `serve` see changes.
+
+    Returns:
+        The hash of the names and contents of all Python files in it.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    return _hash_files(directory, _package_files(directory))
+
+
+@dataclass(frozen=True)
+class SolutionEntry:
+    """Registration of a solution that can create new solution objects.
+
+    Attributes:
+        solution_class: the class of the solution, or the location of the
+            class as `"module:Class"` string.
+        input_file: the input file, or input source, to give to the
+            solution.
+        arguments: extra keyword arguments for the constructor.
+    """
+
+    solution_class: type[DaySolution] | str
+    input_file: InputSource | str
+    arguments: dict[str, object] = field(default_factory=dict)
+
+    def resolve(self) -> type[DaySolution]:
+        """Get the class of the solution.
+
+        When the class is registered as `"module:Class"` string, the module
+        is imported.
+
+        Returns:
+            The class of the solution.
+
+        Raises:
+            ValueError: when the string is not in the `"module:Class"`
+                format.
+        """
+        if not isinstance(self.solution_class, str):
+            return self.solution_class
+
+        module_name, _, class_name = self.solution_class.partition(':')
+        if not module_name or not class_name:
+            raise ValueError(
+                f'Invalid solution class {self.solution_class!r}; '
+                'expected "module:Class".'
+            )
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def create(
+        self, input_file: InputSource | str | None = None
+    ) -> DaySolution:
+        """Create a new solution object.
+
+        Args:
+            input_file: an input file to use instead of the registered one.
+
+        Returns:
+            A new, not yet loaded, solution object.
+        """
+        return self.resolve()(input_file or self.input_file, **self.arguments)
+
+    @property
+    def module_name(self) -> str:
+        """Get the name of the module of the solution.
+
+        Returns:
+            The name of the module.
+        """
+        if isinstance(self.solution_class, str):
+            return self.solution_class.partition(':')[0]
+        return self.solution_class.__module__
+
+    def module_file(self) -> str | None:
+        """Find the source file of the module of the solution.
+
+        For a `"module:Class"` string, the module is found without importing
+        it.
+
+        Returns:
+            The path of the source file, or None if it cannot be found.
+        """
+        module = sys.modules.get(self.module_name)
+        if module is None and isinstance(self.solution_class, str):
+            spec = importlib.util.find_spec(self.module_name)
+            return None if spec is None else spec.origin
+        return getattr(module, '__file__', None)
+
+    def reload(self) -> None:
+        """Import the module of the solution again, to use its changed code.
+
+        Only objects created after this use the new code, and only for a
+        class registered as `"module:Class"` string; a registered class
+        object stays the old class. A module that is not imported yet is
+        left alone, since it is imported with the new code when it is used.
+        """
+        module = sys.modules.get(self.module_name)
+        if module is not None:
+            importlib.reload(module)
+
+    def fingerprint(self) -> str | None:
+        """Get a hash of the code and the arguments of the solution.
+
+        The hash changes when the source file of the solution module, any
+        source file of the `aoc` package that the solutions are built on, or
+        the constructor arguments change, so it can be used as key for
+        cached answers.
+
+        Returns:
+            The hash as hexadecimal string, or None when the source file of
+            the solution cannot be found.
+        """
+        module_file = self.module_file()
+        if module_file is None:
+            return None
+        try:
+            with open(module_file, 'rb') as file:
+                source = file.read()
+        except OSError:
+            return None
+
+        digest = hashlib.sha256(source)
+        digest.update(_package_digest())
+        digest.update(repr(sorted(self.arguments.items())).encode())
+        if isinstance(self.solution_class, str):
+            digest.update(self.solution_class.encode())
+        else:
+            digest.update(self.solution_class.__qualname__.encode())
+        return digest.hexdigest()
@@ -0,0 +1,208 @@
+"""Module with the SolverServer class and a client for it."""
+
+import json
+import urllib.error
+import urllib.request
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from .advent_of_code import PARTS, AdventOfCode
+from .input_source import InputSource
+from .run_result import PartResult
+from .solution_entry import SolutionEntry
+
+# Port of the server when no other port is given
+DEFAULT_PORT = 8024
+
+
+def _import_solutions(entries: list[SolutionEntry]) -> None:
+    """Import the solution modules in a worker process.
+
+    Args:
+        entries: the registrations of the solutions.
+    """
+    for entry in entries:
+        entry.resolve()
+
+
+class _SolveHandler(BaseHTTPRequestHandler):
+    """Handler for the requests to a `SolverServer`."""
+
+    server: 'SolverServer'
+
+    def _send_json(self, status: HTTPStatus, data: dict[str, Any]) -> None:
+        """Send a response with a JSON body.
+
+        Args:
+            status: the status of the response.
+            data: the data to send.
+        """
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Give the days that the server can solve."""
+        if urlsplit(self.path).path != '/days':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found.'})
+            return
+        self._send_json(
+            HTTPStatus.OK, {'days': self.server.advent_of_code.days}
+        )
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Solve the input in the body of the request.
+
+        The day is given as `day` in the query string. Both parts are solved,
+        unless one `part` is given.
+        """
+        url = urlsplit(self.path)
+        if url.path != '/solve':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found.'})
+            return
+
+        query = parse_qs(url.query)
+        try:
+            day = int(query['day'][0])
+            parts = [int(part) for part in query.get('part', PARTS)]
+            if any(part not in PARTS for part in parts):
+                raise ValueError
+        except (KeyError, ValueError):
+            self._send_json(
+                HTTPStatus.BAD_REQUEST,
+                {'error': 'Give a valid day and optionally a part.'},
+            )
+            return
+        if day not in self.server.advent_of_code.entries:
+            self._send_json(
+                HTTPStatus.NOT_FOUND, {'error': f'Day {day} has no solution.'}
+            )
+            return
+
+        data = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            results = self.server.advent_of_code.solve_input(
+                day,
+                InputSource.from_bytes(data),
+                parts,
+                self.server.executor,
+            )
+        except Exception as exc:  # noqa: BLE001
+            self._send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {'error': f'{type(exc).__name__}: {exc}'},
+            )
+            return
+        self._send_json(
+            HTTPStatus.OK,
+            {'results': [result.to_dict() for result in results]},
+        )
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Log a request, unless the server is quiet.
+
+        Args:
+            format: the format of the message.
+            *args: the values for the format.
+        """
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class SolverServer(ThreadingHTTPServer):
+    """Local HTTP server that solves inputs on warm worker processes.
+
+    The worker processes are started, and import all registered solutions,
+    when the server is created. So a request only costs the solving itself,
+    not the startup of Python and the imports. The answer and parse caches
+    of the AdventOfCode object are used.
+
+    Requests:
+    -   `POST /solve?day=N` with the input as body solves both parts; add
+        `&part=1` or `&part=2` for one part. The response is JSON with the
+        `results` of the parts, as created by `PartResult.to_dict`.
+    -   `GET /days` gives the days that can be solved.
+
+    Errors are given as JSON with an `error` message. The server has no
+    authentication, so it should only listen on a local address.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        advent_of_code: AdventOfCode,
+        address: tuple[str, int] = ('127.0.0.1', DEFAULT_PORT),
+        workers: int | None = None,
+        quiet: bool = False,
+    ) -> None:
+        """Set internal values and start the worker processes.
+
+        Args:
+            advent_of_code: the AdventOfCode object with the registered
+                solutions.
+            address: the host and port to listen on.
+            workers: the number of worker processes. The number of CPUs when
+                not given.
+            quiet: whether to leave out the log line of every request.
+        """
+        super().__init__(address, _SolveHandler)
+        self.advent_of_code = advent_of_code
+        self.quiet = quiet
+        self.executor = ProcessPoolExecutor(
+            workers,
+            initializer=_import_solutions,
+            initargs=(list(advent_of_code.entries.values()),),
+        )
+        # Start the workers now, instead of on the first request
+        self.executor.submit(int).result()
+
+    def server_close(self) -> None:
+        """Stop listening and stop the worker processes."""
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def solve_remote(
+    url: str,
+    day: int,
+    data: bytes,
+    parts: Iterable[int] = PARTS,
+    timeout: float | None = None,
+) -> list[PartResult]:
+    """Solve an input on a `SolverServer`.
+
+    Args:
+        url: the URL of the server, like `http://127.0.0.1:8024`.
+        day: the day to solve.
+        data: the input data.
+        parts: the parts to solve.
+        timeout: the maximum time to wait for the server, in seconds.
+
+    Returns:
+        The results of the parts, in part order.
+
+    Raises:
+        RuntimeError: when the server gives an error.
+    """
+    query = '&'.join([f'day={day}', *(f'part={part}' for part in parts)])
+    request = urllib.request.Request(
+        f'{url.rstrip("/")}/solve?{query}', data=data, method='POST'
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = json.load(response)
+    except urllib.error.HTTPError as exc:
+        try:
+            message = json.load(exc)['error']
+        except (ValueError, KeyError):
+            message = exc.reason
+        raise RuntimeError(f'Server error {exc.code}: {message}') from exc
+    return [PartResult.from_dict(result) for result in body['results']]
@@ -0,0 +1,267 @@
+"""Module with functions to solve parts within a time budget.
+
+A process pool cannot stop a task that is already running, so a part that
+runs for minutes holds up the run. Here every part is solved in its own
+worker process instead, which is stopped when the part takes longer than
+its time budget. The other parts are not affected.
+
+A worker is stopped in two steps. First it gets `SIGTERM`, which stops the
+solution between two Python instructions; the worker then sends back the
+time it took and the phases that ran, including the unfinished one. A
+worker that does not answer in time, for instance because it is inside a
+long call into C code, is killed, and only the elapsed time is reported.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING
+
+from .advent_of_code import _solve_part
+from .phase_timing import PhaseTiming, collect_phases
+from .run_result import PartResult
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from types import FrameType
+
+    from .day_solution import DaySolution
+
+# The answer of a part that was stopped
+TIMEOUT = 'TIMEOUT'
+
+# Seconds a worker gets to report its timings after it is stopped
+GRACE_PERIOD = 1.0
+
+
+class _StopSolving(BaseException):  # noqa: N818
+    """Raised in a worker when its time budget is used up.
+
+    It is a `BaseException`, so solutions that catch `Exception` do not
+    catch it.
+    """
+
+
+def _stop_solving(signal_number: int, frame: 'FrameType | None') -> None:
+    """Stop the solution in a worker; the handler for `SIGTERM`.
+
+    Args:
+        signal_number: the number of the signal.
+        frame: the frame that was running.
+
+    Raises:
+        _StopSolving: always.
+    """
+    raise _StopSolving
+
+
+def _solve_in_worker(
+    connection: 'Connection',
+    day: int,
+    part: int,
+    solution: 'DaySolution',
+    *,
+    perf: bool,
+    timings: bool,
+) -> None:
+    """Solve a part in a worker process and send back the result.
+
+    Args:
+        connection: the connection to send the result over.
+        day: the day for which the solution is.
+        part: the part to solve; 1 or 2.
+        solution: the solution to solve the part with.
+        perf: whether to make the Python functions visible to Linux `perf`
+            while solving.
+        timings: whether to record the phases inside the solution.
+    """
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    result: PartResult | Exception
+    # Collected here as well, to keep the phases of a stopped part
+    phases: AbstractContextManager[dict[str, PhaseTiming]] = (
+        collect_phases() if timings else nullcontext({})
+    )
+    with phases as collected:
+        signal.signal(signal.SIGTERM, _stop_solving)
+        try:
+            result = _solve_part(day, part, solution, perf, timings)
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        except _StopSolving:
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            result = PartResult(
+                day=day,
+                part=part,
+                answer=TIMEOUT,
+                wall_time=time.perf_counter() - start_wall,
+                cpu_time=time.process_time() - start_cpu,
+                timed_out=True,
+                timings=collected,
+            )
+        except Exception as exc:  # noqa: BLE001
+            # Raised again in the main process, like a process pool does
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            result = exc
+    connection.send(result)
+    connection.close()
+
+
+@dataclass
+class _Worker:
+    """A worker process that solves one part.
+
+    Attributes:
+        day: the day of the part.
+        part: the part.
+        process: the worker process.
+        connection: the connection to receive the result over.
+        started: the `perf_counter` time when the worker was started.
+        deadline: the `perf_counter` time when the worker is stopped, or
+            killed when it is stopping.
+        stopping: whether the worker got `SIGTERM`.
+    """
+
+    day: int
+    part: int
+    process: 'BaseProcess'
+    connection: 'Connection'
+    started: float
+    deadline: float
+    stopping: bool = False
+
+    def receive(self) -> PartResult:
+        """Receive the result of a worker that is done.
+
+        Returns:
+            The result that the worker sent.
+
+        Raises:
+            Exception: the exception of the part, when it failed.
+            RuntimeError: when the worker stopped without giving a result.
+        """
+        try:
+            result = self.connection.recv()
+        except EOFError:
+            result = None
+        self.connection.close()
+        self.process.join()
+        if isinstance(result, Exception):
+            raise result
+        if result is None and self.stopping:
+            # Where `terminate` kills right away, like on Windows
+            return self.timed_out(time.perf_counter())
+        if result is None:
+            raise RuntimeError(
+                f'The worker for day {self.day} part {self.part} stopped '
+                f'with exit code {self.process.exitcode}.'
+            )
+        return result
+
+    def kill(self) -> None:
+        """Kill the worker process."""
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def timed_out(self, now: float) -> PartResult:
+        """Create the result of a worker that was killed.
+
+        Args:
+            now: the `perf_counter` time.
+
+        Returns:
+            The result with the elapsed time since the worker was started.
+        """
+        return PartResult(
+            day=self.day,
+            part=self.part,
+            answer=TIMEOUT,
+            wall_time=now - self.started,
+            cpu_time=0.0,
+            timed_out=True,
+        )
+
+
+def solve_parts(
+    tasks: Iterable[tuple[int, int, 'DaySolution']],
+    timeout: float,
+    workers: int | None = None,
+    perf: bool = False,
+    timings: bool = False,
+) -> Iterator[PartResult]:
+    """Solve parts in worker processes that are stopped after a timeout.
+
+    Every part gets a new worker process with its own copy of the solution,
+    and at most `workers` parts are solved at the same time. A part that
+    takes longer than the timeout is stopped and reported with `TIMEOUT` as
+    answer and `timed_out` set; see the module documentation.
+
+    Args:
+        tasks: the day, part and solution of every part to solve.
+        timeout: the time budget of every part, in seconds.
+        workers: the number of parts to solve at the same time. The number
+            of CPUs when not given.
+        perf: whether to make the Python functions visible to Linux `perf`
+            while the parts are solved.
+        timings: whether to record the phases inside the solutions.
+
+    Yields:
+        The result of every part, in the order in which they are ready.
+
+    Raises:
+        Exception: the exception of a part that failed; the workers that
+            are still running are killed.
+        RuntimeError: when a worker stopped without giving a result.
+    """
+    context = multiprocessing.get_context()
+    pending = list(tasks)
+    pending.reverse()
+    workers = workers or os.cpu_count() or 1
+    running: dict[Connection, _Worker] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                day, part, solution = pending.pop()
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_solve_in_worker,
+                    args=(sender, day, part, solution),
+                    kwargs={'perf': perf, 'timings': timings},
+                    daemon=True,
+                )
+                process.start()
+                # Only the worker writes to it; closing it here makes the
+                # receiver see the end when the worker dies
+                sender.close()
+                started = time.perf_counter()
+                running[receiver] = _Worker(
+                    day, part, process, receiver, started, started + timeout
+                )
+
+            deadline = min(worker.deadline for worker in running.values())
+            ready = wait(list(running), max(deadline - time.perf_counter(), 0))
+            for receiver in ready:
+                yield running.pop(receiver).receive()
+
+            now = time.perf_counter()
+            for receiver, worker in list(running.items()):
+                if now < worker.deadline:
+                    continue
+                if worker.stopping:
+                    del running[receiver]
+                    worker.kill()
+                    yield worker.timed_out(now)
+                else:
+                    worker.process.terminate()
+                    worker.stopping = True
+                    worker.deadline += GRACE_PERIOD
+    finally:
+        # When a part failed, or the caller stopped early
+        for worker in running.values():
+            worker.kill()
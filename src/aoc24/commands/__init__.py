@@ -0,0 +1 @@
+"""Commands for the `aoc24` command line interface."""
@@ -0,0 +1,38 @@
+"""The `batch` command: solve one day for many input files."""
+
+import json
+import sys
+from argparse import Namespace
+
+from aoc.advent_of_code import AdventOfCode
+
+
+def batch(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Solve a day for all given input files and print the answers.
+
+    Every answer is printed as a line of JSON, in the order of the input
+    files, as soon as it is ready.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application; 1 when an input failed.
+    """
+    try:
+        results = aoc24.solve_many(
+            arguments.day,
+            arguments.input_files,
+            arguments.workers,
+            arguments.chunksize,
+        )
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    failed = False
+    for result in results:
+        failed = failed or result.error is not None
+        print(json.dumps(result.to_dict()), flush=True)
+    return 1 if failed else 0
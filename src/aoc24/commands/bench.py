@@ -0,0 +1,373 @@
+"""The `bench` command: time the loading and solving of the puzzles."""
+
+import json
+import math
+import os
+import tempfile
+from argparse import Namespace
+
+from rich.console import Console
+from rich.table import Table
+
+from aoc.advent_of_code import AdventOfCode
+from aoc.benchmark import (
+    BenchmarkReport,
+    ExecutorComparison,
+    PhaseComparison,
+    ScalingResult,
+    compare_reports,
+    measure_executors,
+)
+
+from ..generators import GENERATORS, generate_input
+from ..main import create_advent_of_code
+
+
+def _milliseconds(seconds: float) -> str:
+    """Format a time in seconds as milliseconds.
+
+    Args:
+        seconds: the time in seconds.
+
+    Returns:
+        The time in milliseconds, as string.
+    """
+    return f'{seconds * 1000:.3f}'
+
+
+def create_table(report: BenchmarkReport) -> Table:
+    """Create a table with the statistics of a benchmark.
+
+    Args:
+        report: the benchmark report.
+
+    Returns:
+        A Rich table with one row per day and phase.
+    """
+    table = Table(
+        title=f'Benchmark (warmup {report.warmup}, repeat {report.repeat})'
+    )
+    table.add_column('Day', justify='right')
+    table.add_column('Phase')
+    for column in ('Min (ms)', 'Median (ms)', 'P95 (ms)', 'Stddev (ms)'):
+        table.add_column(column, justify='right')
+
+    for day in report.days:
+        for phase, timing in day.phases.items():
+            table.add_row(
+                f'{day.day:02}',
+                phase,
+                _milliseconds(timing.min),
+                _milliseconds(timing.median),
+                _milliseconds(timing.p95),
+                _milliseconds(timing.stddev),
+            )
+        table.add_section()
+    return table
+
+
+def create_comparison_table(
+    comparisons: list[PhaseComparison], threshold: float
+) -> Table:
+    """Create a table with the comparison against a baseline.
+
+    Args:
+        comparisons: the comparisons per day and phase.
+        threshold: the allowed slowdown as fraction.
+
+    Returns:
+        A Rich table with one row per day and phase.
+    """
+    table = Table(
+        title=f'Comparison with baseline (threshold {threshold:.0%})'
+    )
+    table.add_column('Day', justify='right')
+    table.add_column('Phase')
+    table.add_column('Baseline (ms)', justify='right')
+    table.add_column('Current (ms)', justify='right')
+    table.add_column('Change', justify='right')
+    table.add_column('Status')
+
+    for comparison in comparisons:
+        if comparison.baseline is None:
+            table.add_row(
+                f'{comparison.day:02}',
+                comparison.phase,
+                '-',
+                _milliseconds(comparison.current),
+                '-',
+                '[red]MISSING[/red]',
+            )
+            continue
+        if comparison.is_regression(threshold):
+            status = '[red]SLOWER[/red]'
+        elif comparison.change < -threshold:
+            status = '[green]FASTER[/green]'
+        else:
+            status = 'OK'
+        table.add_row(
+            f'{comparison.day:02}',
+            comparison.phase,
+            _milliseconds(comparison.baseline),
+            _milliseconds(comparison.current),
+            f'{comparison.change:+.1%}',
+            status,
+        )
+    return table
+
+
+def _exponent(exponent: float) -> str:
+    """Format a complexity exponent, highlighting super-linear ones.
+
+    Args:
+        exponent: the estimated exponent.
+
+    Returns:
+        The exponent as string with Rich markup.
+    """
+    if math.isnan(exponent):
+        return '-'
+    if exponent >= 1.5:
+        return f'[red]{exponent:.2f}[/red]'
+    if exponent >= 1.15:
+        return f'[yellow]{exponent:.2f}[/yellow]'
+    return f'{exponent:.2f}'
+
+
+def create_scaling_table(
+    results: list[ScalingResult], input_scales: list[float]
+) -> Table:
+    """Create a table with the scaling behaviour of the solutions.
+
+    Args:
+        results: the scaling measurements per day.
+        input_scales: the scales of the generated inputs.
+
+    Returns:
+        A Rich table with one row per day and phase.
+    """
+    table = Table(title='Scaling (value = c * input size ^ exponent)')
+    table.add_column('Day', justify='right')
+    table.add_column('Phase')
+    for scale in input_scales:
+        table.add_column(f'x{scale:g} (ms)', justify='right')
+    table.add_column('Time exp.', justify='right')
+    table.add_column('Peak memory (KiB)', justify='right')
+    table.add_column('Memory exp.', justify='right')
+
+    for result in results:
+        for phase, points in result.phases.items():
+            table.add_row(
+                f'{result.day:02}',
+                phase,
+                *(_milliseconds(point.time) for point in points),
+                _exponent(result.time_exponent(phase)),
+                f'{points[-1].peak_memory / 1024:,.1f}',
+                _exponent(result.memory_exponent(phase)),
+            )
+        table.add_section()
+    return table
+
+
+def bench_scaling(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Measure how the solutions scale with generated inputs.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    console = Console(stderr=arguments.json == '-')
+    results: list[ScalingResult] = []
+    selection = arguments.days or aoc24.days
+    with tempfile.TemporaryDirectory() as directory:
+        for day in aoc24.days:
+            if day not in selection or day not in GENERATORS:
+                continue
+
+            input_files: list[str] = []
+            for scale in arguments.scales:
+                input_file = os.path.join(
+                    directory, f'day{day:02}-x{scale:g}.txt'
+                )
+                generate_input(day, input_file, scale, arguments.seed)
+                input_files.append(input_file)
+
+            console.print(f'Measuring day {day:02}...')
+            result = aoc24.measure_scaling(day, input_files, arguments.repeat)
+            if result is not None:
+                results.append(result)
+
+    data = {
+        'scales': arguments.scales,
+        'days': {str(result.day): result.to_dict() for result in results},
+    }
+    if arguments.json == '-':
+        print(json.dumps(data, indent=2))
+    elif arguments.json:
+        with open(arguments.json, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=2)
+
+    console.print(create_scaling_table(results, arguments.scales))
+    return 0
+
+
+def create_executor_table(comparison: ExecutorComparison) -> Table:
+    """Create a table with the wall times of the executors.
+
+    Args:
+        comparison: the measurements per input size.
+
+    Returns:
+        A Rich table with one row per input size.
+    """
+    mode = 'GIL enabled' if comparison.gil_enabled else 'free-threaded'
+    table = Table(title=f'Executors ({mode})')
+    table.add_column('Scale', justify='right')
+    table.add_column('Input (KiB)', justify='right')
+    executors = list(comparison.points[0].times) if comparison.points else []
+    for executor in executors:
+        table.add_column(f'{executor.capitalize()} (ms)', justify='right')
+    table.add_column('Fastest')
+
+    crossover = comparison.crossover
+    for point in comparison.points:
+        fastest = point.fastest
+        if point is crossover:
+            fastest = f'[bold]{fastest}[/bold] (crossover)'
+        table.add_row(
+            f'x{point.scale:g}',
+            f'{point.size / 1024:,.1f}',
+            *(_milliseconds(point.times[executor]) for executor in executors),
+            fastest,
+        )
+    return table
+
+
+def bench_executors(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Compare solving on processes and on threads, with generated inputs.
+
+    All selected days are solved at every scale in `--scales`, on every
+    executor, and the median wall time of `--repeat` runs is shown.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    console = Console(stderr=arguments.json == '-')
+    days = [
+        day
+        for day in aoc24.days
+        if day in GENERATORS
+        and (arguments.days is None or day in arguments.days)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        inputs: list[tuple[float, str]] = []
+        for scale in arguments.scales:
+            scale_directory = os.path.join(directory, f'x{scale:g}')
+            os.mkdir(scale_directory)
+            for day in days:
+                generate_input(
+                    day,
+                    os.path.join(scale_directory, f'day{day:02}-input.txt'),
+                    scale,
+                    arguments.seed,
+                )
+            inputs.append((scale, scale_directory))
+
+        console.print(f'Measuring {len(days)} days...')
+        comparison = measure_executors(
+            lambda data: create_advent_of_code(
+                data, backend=arguments.backend
+            ),
+            inputs,
+            days,
+            arguments.repeat,
+        )
+
+    if arguments.json == '-':
+        print(json.dumps(comparison.to_dict(), indent=2))
+    elif arguments.json:
+        with open(arguments.json, 'w', encoding='utf-8') as file:
+            json.dump(comparison.to_dict(), file, indent=2)
+
+    console.print(create_executor_table(comparison))
+    crossover = comparison.crossover
+    if crossover is not None:
+        console.print(
+            f'{crossover.fastest.capitalize()} are the fastest from '
+            f'x{crossover.scale:g} ({crossover.size / 1024:,.1f} KiB of '
+            'input) on.'
+        )
+    elif comparison.points:
+        console.print(
+            f'No crossover: {comparison.points[0].fastest} are the fastest '
+            'on all sizes.'
+        )
+    return 0
+
+
+def bench(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Benchmark the solutions for the selected days.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    if arguments.scaling:
+        return bench_scaling(aoc24, arguments)
+    if arguments.executors:
+        return bench_executors(aoc24, arguments)
+
+    report = aoc24.benchmark(
+        arguments.days, arguments.warmup, arguments.repeat
+    )
+
+    # With JSON on stdout, the tables go to stderr
+    console = Console(stderr=arguments.json == '-')
+    if arguments.json == '-':
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        if arguments.json:
+            with open(arguments.json, 'w', encoding='utf-8') as file:
+                json.dump(report.to_dict(), file, indent=2)
+        console.print(create_table(report))
+
+    if not arguments.compare:
+        return 0
+
+    with open(arguments.compare, encoding='utf-8') as file:
+        baseline = BenchmarkReport.from_dict(json.load(file))
+    comparisons = compare_reports(report, baseline)
+    console.print(create_comparison_table(comparisons, arguments.threshold))
+
+    missing = [comparison for comparison in comparisons if comparison.missing]
+    regressions = [
+        comparison
+        for comparison in comparisons
+        if comparison.is_regression(arguments.threshold)
+    ]
+    if missing:
+        console.print(
+            f'[red][bold]{len(missing)} phase(s) are missing from the '
+            f'baseline:[/bold] '
+            + ', '.join(
+                f'day {comparison.day:02} {comparison.phase}'
+                for comparison in missing
+            )
+            + '[/red]'
+        )
+    if regressions:
+        console.print(
+            f'[red][bold]{len(regressions)} phase(s) got slower than the '
+            f'baseline by more than {arguments.threshold:.0%}[/bold][/red]'
+        )
+    return 1 if missing or regressions else 0
@@ -0,0 +1,34 @@
+"""The `generate` command: write synthetic inputs for the puzzles."""
+
+import os
+from argparse import Namespace
+
+from rich.console import Console
+
+from ..generators import GENERATORS, generate_input
+
+
+def generate(arguments: Namespace) -> int:
+    """Generate input files for the selected days.
+
+    The files are named like the official inputs, so the output directory
+    can be given as `--data` to the other commands.
+
+    Args:
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    console = Console()
+    os.makedirs(arguments.output, exist_ok=True)
+    for day in sorted(GENERATORS):
+        if arguments.days and day not in arguments.days:
+            continue
+        input_file = os.path.join(arguments.output, f'day{day:02}-input.txt')
+        generate_input(day, input_file, arguments.scale, arguments.seed)
+        console.print(
+            f'[bold]Day {day:02}[/bold]: {input_file} '
+            f'({os.path.getsize(input_file):,} bytes)'
+        )
+    return 0
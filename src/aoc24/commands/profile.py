@@ -0,0 +1,43 @@
+"""The `profile` command: profile a solution with cProfile."""
+
+import sys
+from argparse import Namespace
+from pstats import SortKey
+
+from aoc.advent_of_code import AdventOfCode
+from aoc.profiling import collapsed_stacks
+
+
+def profile(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Profile the solution for a day and write the results.
+
+    The statistics are written as `.pstats` file, which can be opened with
+    `pstats` or tools like snakeviz, and as collapsed stacks, which can be
+    rendered by flamegraph tools like `flamegraph.pl`, inferno and
+    speedscope. The functions with the highest cumulative time are printed.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    stats = aoc24.profile(arguments.day, arguments.part)
+    if stats is None:
+        print(f'Day {arguments.day:02} has no solution.', file=sys.stderr)
+        return 1
+
+    prefix = arguments.output or f'profile-day{arguments.day:02}'
+    if arguments.output is None and arguments.part is not None:
+        prefix += f'-part{arguments.part}'
+    stats.dump_stats(f'{prefix}.pstats')
+    with open(f'{prefix}.collapsed', 'w', encoding='utf-8') as file:
+        for line in collapsed_stacks(stats):
+            file.write(f'{line}\n')
+
+    stats.strip_dirs().sort_stats(SortKey.CUMULATIVE).print_stats(
+        arguments.top
+    )
+    print(f'Wrote {prefix}.pstats and {prefix}.collapsed')
+    return 0
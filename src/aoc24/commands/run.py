@@ -0,0 +1,541 @@
+"""The `run` command: solve the puzzles and print the answers."""
+
+import json
+import os
+import sys
+import time
+from argparse import Namespace
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
+
+from aoc.advent_of_code import PARTS, AdventOfCode
+from aoc.executor import create_executor, select_executor
+from aoc.run_result import PartResult, RunResult
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from rich.table import Table
+
+    from aoc.memory_report import AllocationSite, DayMemory
+
+# Number of allocation sites to print per phase for `--memory`
+MEMORY_SITES = 3
+
+
+def _summary(result: RunResult) -> str:
+    """Get the summary line of a run.
+
+    Args:
+        result: the result of the run.
+
+    Returns:
+        The wall and CPU time, and the number of cached answers if any.
+    """
+    summary = (
+        f'Wall time: {result.wall_time:.3f}s, CPU time: {result.cpu_time:.3f}s'
+    )
+    cached = sum(part.cached for part in result.parts)
+    if cached:
+        summary += f' ({cached} of {len(result.parts)} answers from cache)'
+    return summary
+
+
+def _format_answer(result: PartResult) -> str:
+    """Format the answer of a part.
+
+    Args:
+        result: the result of the part.
+
+    Returns:
+        The answer, or `TIMEOUT` with the time until the part was stopped.
+    """
+    if result.timed_out:
+        return f'{result.answer} after {result.wall_time:.3f}s'
+    return result.answer
+
+
+def _print_timeouts(result: RunResult) -> None:
+    """Print the parts that were stopped, with the phases they finished.
+
+    They are printed to stderr, so they end up in the logs of scheduled
+    runs next to other errors.
+
+    Args:
+        result: the result of the run.
+    """
+    for part in result.timed_out:
+        print(
+            f'Day {part.day:02} puzzle {part.part} stopped after '
+            f'{part.wall_time:.3f}s (CPU {part.cpu_time:.3f}s)',
+            file=sys.stderr,
+        )
+        for name, timing in part.timings.items():
+            print(
+                f'  {name}: {timing.calls} call(s), '
+                f'wall {timing.wall_time * 1000:.3f}ms, '
+                f'CPU {timing.cpu_time * 1000:.3f}ms',
+                file=sys.stderr,
+            )
+
+
+def _print_timings_plain(result: RunResult) -> None:
+    """Print the recorded phases inside the solutions as plain text.
+
+    Args:
+        result: the result of the run.
+    """
+    for day, timings in result.timings.items():
+        print(f'Day {day:02} phases:')
+        for name, timing in timings.items():
+            print(
+                f'  {name}: {timing.calls} call(s), '
+                f'wall {timing.wall_time * 1000:.3f}ms, '
+                f'CPU {timing.cpu_time * 1000:.3f}ms'
+            )
+
+
+def _print_plain(result: RunResult) -> None:
+    """Print the answers as plain text.
+
+    Args:
+        result: the result of the run.
+    """
+    for day, parts in result.days.items():
+        print(f'Day {day:02}: Puzzle 1: {_format_answer(parts[0])}')
+        print(' ' * 8, f'Puzzle 2: {_format_answer(parts[1])}', sep='')
+    print(_summary(result))
+
+
+def _print_pretty(result: RunResult) -> None:
+    """Print the answers with colors, using Rich.
+
+    Args:
+        result: the result of the run.
+    """
+    from rich.console import Console  # noqa: PLC0415
+
+    console = Console()
+    console.print(
+        '[yellow][bold]Advent of Code 2024 - Python version[/bold][/yellow]'
+    )
+    console.print('[gray]By Daryl Stark[/gray]')
+    console.print('')
+
+    for day, parts in result.days.items():
+        console.print(f'[bold]Day {day:02}[/bold]: ', end='')
+        console.print(f'Puzzle 1: {_format_answer(parts[0])}')
+        console.print(' ' * 8, f'Puzzle 2: {_format_answer(parts[1])}', sep='')
+
+    console.print('')
+    console.print(_summary(result))
+
+
+def _print_timings_pretty(result: RunResult) -> None:
+    """Print the recorded phases inside the solutions as a table.
+
+    Args:
+        result: the result of the run.
+    """
+    from rich.console import Console  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title='Phases')
+    table.add_column('Day', justify='right')
+    table.add_column('Phase')
+    table.add_column('Calls', justify='right')
+    table.add_column('Wall (ms)', justify='right')
+    table.add_column('CPU (ms)', justify='right')
+    for day, timings in result.timings.items():
+        for name, timing in timings.items():
+            table.add_row(
+                f'{day:02}',
+                name,
+                str(timing.calls),
+                f'{timing.wall_time * 1000:.3f}',
+                f'{timing.cpu_time * 1000:.3f}',
+            )
+        table.add_section()
+    Console().print(table)
+
+
+def _format_size(size: int) -> str:
+    """Format an amount of memory.
+
+    Args:
+        size: the amount of memory, in bytes.
+
+    Returns:
+        The amount in KiB or MiB.
+    """
+    if abs(size) >= 1024 * 1024:
+        return f'{size / (1024 * 1024):.1f} MiB'
+    return f'{size / 1024:.1f} KiB'
+
+
+def _format_site(site: 'AllocationSite') -> str:
+    """Format an allocation site.
+
+    Args:
+        site: the site to format.
+
+    Returns:
+        The directory and name of the file with the line number, the memory
+        and the number of blocks.
+    """
+    filename = os.path.join(
+        os.path.basename(os.path.dirname(site.filename)),
+        os.path.basename(site.filename),
+    )
+    return (
+        f'{filename}:{site.lineno} {_format_size(site.size)} '
+        f'({site.count} blocks)'
+    )
+
+
+def _print_memory_plain(reports: list['DayMemory']) -> None:
+    """Print the memory of the phases as plain text.
+
+    Args:
+        reports: the memory per day.
+    """
+    for report in reports:
+        print(f'Day {report.day:02}: peak {_format_size(report.peak)}')
+        for phase, memory in report.phases.items():
+            print(
+                f'  {phase}: peak {_format_size(memory.peak)}, '
+                f'retained {_format_size(memory.retained)}'
+            )
+            for site in memory.sites:
+                print(f'    {_format_site(site)}')
+
+
+def _print_memory_pretty(reports: list['DayMemory']) -> None:
+    """Print the memory of the phases as a table.
+
+    Args:
+        reports: the memory per day.
+    """
+    from rich.console import Console  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title='Memory')
+    table.add_column('Day', justify='right')
+    table.add_column('Phase')
+    table.add_column('Peak', justify='right')
+    table.add_column('Retained', justify='right')
+    table.add_column('Top allocation sites (retained)')
+    for report in reports:
+        for phase, memory in report.phases.items():
+            table.add_row(
+                f'{report.day:02}',
+                phase,
+                _format_size(memory.peak),
+                _format_size(memory.retained),
+                '\n'.join(_format_site(site) for site in memory.sites),
+            )
+        table.add_row(
+            f'{report.day:02}',
+            '[bold]total[/bold]',
+            f'[bold]{_format_size(report.peak)}[/bold]',
+            '',
+            '',
+        )
+        table.add_section()
+    Console().print(table)
+
+
+def _create_stream_table(
+    days: list[int], results: dict[tuple[int, int], PartResult]
+) -> 'Table':
+    """Create the table with the answers that are ready.
+
+    Args:
+        days: the days that are solved.
+        results: the results that are ready, by day and part.
+
+    Returns:
+        A Rich table with one row per day.
+    """
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title='Advent of Code 2024 - Python version')
+    table.add_column('Day', justify='right')
+    for part in PARTS:
+        table.add_column(f'Puzzle {part}')
+        table.add_column(f'Time {part} (ms)', justify='right')
+    for day in days:
+        row = [f'{day:02}']
+        for part in PARTS:
+            result = results.get((day, part))
+            if result is None:
+                row.extend(('[dim]solving...[/dim]', ''))
+            else:
+                answer = str(result.answer)
+                time = f'{result.wall_time * 1000:.3f}'
+                if result.cached:
+                    time = f'[dim]{time} (cached)[/dim]'
+                elif result.timed_out:
+                    answer = f'[red]{answer}[/red]'
+                row.extend((answer, time))
+        table.add_row(*row)
+    return table
+
+
+def _record_timings(arguments: Namespace) -> bool:
+    """Check whether the phases inside the solutions are to be recorded.
+
+    They are only printed with `--timings`, part of the JSON lines, and
+    printed for the parts that run out of time.
+
+    Args:
+        arguments: the parsed command line arguments.
+
+    Returns:
+        Whether to record the phases.
+    """
+    return (
+        arguments.timings
+        or arguments.json_lines
+        or arguments.timeout is not None
+    )
+
+
+async def _stream(
+    aoc24: AdventOfCode, executor: 'Executor | None', arguments: Namespace
+) -> RunResult:
+    """Solve the puzzles and print every answer as soon as it is ready.
+
+    With `--json-lines`, every answer is printed as a line of JSON. With
+    `--plain`, it is printed as a line of text. Otherwise a live table is
+    filled in, in the order in which the parts finish.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        executor: the executor to solve the parts on.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The results of all parts.
+    """
+    start_wall = time.perf_counter()
+    results: dict[tuple[int, int], PartResult] = {}
+    stream = aoc24.stream(
+        executor,
+        arguments.days,
+        arguments.perf,
+        arguments.timeout,
+        timings=_record_timings(arguments),
+    )
+
+    if arguments.json_lines or arguments.plain:
+        async for result in stream:
+            results[result.day, result.part] = result
+            if arguments.json_lines:
+                print(json.dumps(result.to_dict()), flush=True)
+            else:
+                print(
+                    f'Day {result.day:02}: Puzzle {result.part}: '
+                    f'{result.answer} ({result.wall_time * 1000:.3f}ms)',
+                    flush=True,
+                )
+    else:
+        from rich.console import Console  # noqa: PLC0415
+        from rich.live import Live  # noqa: PLC0415
+
+        days = [
+            day
+            for day in aoc24.days
+            if arguments.days is None or day in arguments.days
+        ]
+        console = Console()
+        with Live(
+            _create_stream_table(days, results), console=console
+        ) as live:
+            async for result in stream:
+                results[result.day, result.part] = result
+                live.update(_create_stream_table(days, results))
+        if not console.is_terminal:
+            # Without a terminal, the table is printed without line ending
+            console.line()
+
+    return RunResult(
+        parts=[results[key] for key in sorted(results)],
+        wall_time=time.perf_counter() - start_wall,
+    )
+
+
+def _run_remote(aoc24: AdventOfCode, arguments: Namespace) -> RunResult:
+    """Solve the puzzles on a running `aoc24 serve` server.
+
+    The input files are read here and sent to the server, one request per
+    day, all at the same time.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The results of all parts.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    from aoc.input_source import InputSource  # noqa: PLC0415
+    from aoc.solver_server import solve_remote  # noqa: PLC0415
+
+    entries = aoc24.entries
+    days = [
+        day
+        for day in entries
+        if arguments.days is None or day in arguments.days
+    ]
+
+    def solve(day: int) -> list[PartResult]:
+        with InputSource.of(entries[day].input_file) as source:
+            data = source.read_bytes()
+        return solve_remote(arguments.server, day, data)
+
+    start_wall = time.perf_counter()
+    with ThreadPoolExecutor(max(len(days), 1)) as executor:
+        parts = [part for day in executor.map(solve, days) for part in day]
+    return RunResult(parts=parts, wall_time=time.perf_counter() - start_wall)
+
+
+def _print_result(result: RunResult, arguments: Namespace) -> None:
+    """Print the answers, or only the summary when they were streamed.
+
+    Args:
+        result: the result of the run.
+        arguments: the parsed command line arguments.
+    """
+    if arguments.stream and arguments.plain:
+        print(_summary(result))
+    elif arguments.stream:
+        from rich.console import Console  # noqa: PLC0415
+
+        Console().print(_summary(result))
+    elif arguments.plain:
+        _print_plain(result)
+    else:
+        _print_pretty(result)
+
+    if arguments.timings:
+        if arguments.plain:
+            _print_timings_plain(result)
+        else:
+            _print_timings_pretty(result)
+
+
+def _check_arguments(arguments: Namespace) -> bool:
+    """Check if the options for solving can be used together.
+
+    The reason is printed when they cannot.
+
+    Args:
+        arguments: the parsed command line arguments.
+
+    Returns:
+        True when the parts can be solved with these options.
+    """
+    if arguments.perf:
+        from aoc.perf_trampoline import perf_supported  # noqa: PLC0415
+
+        if not perf_supported():
+            print(
+                'The perf trampoline needs Linux and a Python build with '
+                'perf support.',
+                file=sys.stderr,
+            )
+            return False
+
+    if arguments.server and arguments.timeout is not None:
+        print(
+            'A timeout cannot be used with a server; the server solves the '
+            'parts.',
+            file=sys.stderr,
+        )
+        return False
+    return True
+
+
+def run(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Solve the puzzles for the selected days and print the answers.
+
+    A single day is solved in this process; starting a process pool would
+    take longer than solving the day. With `--stream` or `--json-lines`,
+    every answer is printed as soon as its part is solved. With `--memory`,
+    the memory of the phases is measured and printed instead of the
+    answers.
+
+    With `--executor threads` on a free-threaded Python build, the days are
+    solved on a thread pool, which shares the loaded data of a day between
+    its parts instead of sending it to processes.
+
+    With `--timeout`, every part is solved in its own worker process that
+    is stopped when the part takes too long. The stopped parts are reported
+    as `TIMEOUT`, with the phases they finished on stderr, and give exit
+    code 1.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    if arguments.memory:
+        reports = aoc24.measure_memory(arguments.days, MEMORY_SITES)
+        if arguments.plain:
+            _print_memory_plain(reports)
+        else:
+            _print_memory_pretty(reports)
+        return 0
+
+    if not _check_arguments(arguments):
+        return 2
+
+    if arguments.server:
+        try:
+            result = _run_remote(aoc24, arguments)
+        except (OSError, RuntimeError) as exc:
+            print(
+                f'Cannot solve on {arguments.server}: {exc}', file=sys.stderr
+            )
+            return 1
+        _print_result(result, arguments)
+        return 0
+
+    executor_name = select_executor(arguments.executor)
+    if arguments.timeout is not None or (
+        executor_name == 'processes'
+        and arguments.days is not None
+        and len(set(arguments.days)) == 1
+    ):
+        # With a timeout, the parts get their own worker processes
+        executor_context: AbstractContextManager[Executor | None] = (
+            nullcontext()
+        )
+    else:
+        executor_context = create_executor(executor_name)
+
+    with executor_context as executor:
+        if arguments.stream or arguments.json_lines:
+            import asyncio  # noqa: PLC0415
+
+            result = asyncio.run(_stream(aoc24, executor, arguments))
+        else:
+            result = aoc24.run_all(
+                executor,
+                arguments.days,
+                arguments.perf,
+                arguments.timeout,
+                timings=_record_timings(arguments),
+            )
+
+    if not arguments.json_lines:
+        # The timings are already part of every line of JSON
+        _print_result(result, arguments)
+    if result.timed_out:
+        _print_timeouts(result)
+        return 1
+    return 0
@@ -0,0 +1,49 @@
+"""The `serve` command: solve requests on a local HTTP server."""
+
+import signal
+import sys
+from argparse import Namespace
+from contextlib import suppress
+from types import FrameType
+
+from aoc.advent_of_code import AdventOfCode
+from aoc.solver_server import SolverServer
+
+
+def _stop(signal_number: int, frame: FrameType | None) -> None:
+    """Stop the server when it gets a termination signal.
+
+    Args:
+        signal_number: the number of the signal.
+        frame: the frame that was running when the signal came.
+
+    Raises:
+        KeyboardInterrupt: always, to stop the server like with Ctrl+C.
+    """
+    raise KeyboardInterrupt
+
+
+def serve(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Run the solver server until it is interrupted or terminated.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    with SolverServer(
+        aoc24,
+        (arguments.host, arguments.port),
+        arguments.workers,
+        arguments.quiet,
+    ) as server:
+        # Set after the workers are started, so only this process stops
+        # the server and the workers are stopped by it
+        signal.signal(signal.SIGTERM, _stop)
+        host, port = server.server_address[:2]
+        print(f'Serving on http://{host}:{port}', file=sys.stderr, flush=True)
+        with suppress(KeyboardInterrupt):
+            server.serve_forever()
+    return 0
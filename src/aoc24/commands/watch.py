@@ -0,0 +1,173 @@
+"""The `watch` command: solve the puzzles again when files change."""
+
+import os
+import time
+import traceback
+from argparse import Namespace
+from contextlib import suppress
+
+from rich.console import Console
+
+from aoc.advent_of_code import AdventOfCode
+from aoc.input_source import InputSource
+from aoc.run_result import PartResult
+
+
+def _modified_time(path: str | None) -> int | None:
+    """Get the time a file was last changed.
+
+    Args:
+        path: the path of the file.
+
+    Returns:
+        The time in nanoseconds, or None when the file does not exist.
+    """
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _format_part(result: PartResult, previous: PartResult | None) -> str:
+    """Format the answer and time of a part.
+
+    Args:
+        result: the result of the part.
+        previous: the result of the run before, if any.
+
+    Returns:
+        The answer and time, with the change of the time and a marker for a
+        changed answer when there is an earlier result.
+    """
+    line = f'{result.answer} ({result.wall_time * 1000:.3f}ms'
+    if previous is not None:
+        change = (result.wall_time - previous.wall_time) * 1000
+        color = 'green' if change <= 0 else 'red'
+        line += f', [{color}]{change:+.3f}ms[/{color}]'
+    line += ')'
+    if previous is not None and previous.answer != result.answer:
+        line += f' [yellow]changed from {previous.answer}[/yellow]'
+    return line
+
+
+class _Watcher:
+    """Solves the days again when their input or solution changes."""
+
+    def __init__(self, aoc24: AdventOfCode, days: list[int]) -> None:
+        """Set internal values.
+
+        Args:
+            aoc24: the AdventOfCode object with the registered solutions.
+            days: the days to watch.
+        """
+        self._aoc24 = aoc24
+        self._entries = {day: aoc24.entries[day] for day in days}
+        self._console = Console(highlight=False)
+        self._results: dict[tuple[int, int], PartResult] = {}
+        self._input_times = {
+            day: _modified_time(InputSource.of(entry.input_file).path)
+            for day, entry in self._entries.items()
+        }
+        self._code_times = {
+            day: _modified_time(entry.module_file())
+            for day, entry in self._entries.items()
+        }
+
+    def solve(self, day: int) -> None:
+        """Solve a day and print the answers with the changes in time.
+
+        Errors are printed instead of raised, so the watching goes on.
+
+        Args:
+            day: the day to solve.
+        """
+        entry = self._entries[day]
+        try:
+            results = self._aoc24.solve_input(day, entry.input_file)
+        except Exception:  # noqa: BLE001
+            self._console.print(
+                f'[bold]Day {day:02}[/bold]: [red]failed[/red]'
+            )
+            self._console.print(traceback.format_exc(), markup=False)
+            return
+
+        for result in results:
+            previous = self._results.get((day, result.part))
+            prefix = f'[bold]Day {day:02}[/bold]: ' if result.part == 1 else ''
+            self._console.print(
+                f'{prefix or " " * 8}Puzzle {result.part}: '
+                f'{_format_part(result, previous)}'
+            )
+            self._results[day, result.part] = result
+
+    def check(self) -> None:
+        """Solve the days with a changed input or solution again."""
+        for day, entry in self._entries.items():
+            input_time = _modified_time(InputSource.of(entry.input_file).path)
+            code_time = _modified_time(entry.module_file())
+            if (
+                input_time == self._input_times[day]
+                and code_time == self._code_times[day]
+            ):
+                continue
+
+            reasons: list[str] = []
+            if code_time != self._code_times[day]:
+                reasons.append('solution')
+                try:
+                    entry.reload()
+                except Exception:  # noqa: BLE001
+                    # Like a syntax error; solved again after the next change
+                    self._code_times[day] = code_time
+                    self._console.print(
+                        f'[bold]Day {day:02}[/bold]: [red]cannot import '
+                        'the solution[/red]'
+                    )
+                    self._console.print(traceback.format_exc(), markup=False)
+                    continue
+            if input_time != self._input_times[day]:
+                reasons.append('input')
+            self._input_times[day] = input_time
+            self._code_times[day] = code_time
+
+            self._console.print(
+                f'[dim]{time.strftime("%H:%M:%S")} {" and ".join(reasons)} '
+                f'of day {day:02} changed[/dim]'
+            )
+            self.solve(day)
+
+
+def watch(aoc24: AdventOfCode, arguments: Namespace) -> int:
+    """Solve the selected days, and solve them again when files change.
+
+    The input files and the solution modules are checked for changes every
+    `--interval` seconds. Only a day with a changed file is solved again.
+    When only its solution changed, the module is imported again and the
+    parsed input is taken from the parse cache. When only its input
+    changed, the module that is already imported is used.
+
+    Args:
+        aoc24: the AdventOfCode object with the registered solutions and a
+            parse cache.
+        arguments: the parsed command line arguments.
+
+    Returns:
+        The exit code for the application.
+    """
+    days = [
+        day
+        for day in aoc24.entries
+        if arguments.days is None or day in arguments.days
+    ]
+    watcher = _Watcher(aoc24, days)
+    for day in days:
+        watcher.solve(day)
+
+    Console().print('[dim]Watching for changes; press Ctrl+C to stop.[/dim]')
+    with suppress(KeyboardInterrupt):
+        while True:
+            time.sleep(arguments.interval)
+            watcher.check()
+    return 0
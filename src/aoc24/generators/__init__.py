@@ -0,0 +1,73 @@
+"""Generators for synthetic puzzle inputs.
+
+Every day has a generator that writes an input file in the exact format the
+solution for that day parses. The generators are seeded, so the same scale
+and seed always give the same file, and the size of the input can be scaled
+to load-test the solutions at many times the size of the official inputs.
+"""
+
+from collections.abc import Callable
+from random import Random
+from typing import TextIO
+
+from . import (
+    day01,
+    day02,
+    day03,
+    day04,
+    day05,
+    day06,
+    day07,
+    day08,
+    day09,
+    day10,
+    day11,
+    day12,
+    day13,
+    day14,
+)
+
+InputGenerator = Callable[[TextIO, float, Random], None]
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: day01.generate,
+    2: day02.generate,
+    3: day03.generate,
+    4: day04.generate,
+    5: day05.generate,
+    6: day06.generate,
+    7: day07.generate,
+    8: day08.generate,
+    9: day09.generate,
+    10: day10.generate,
+    11: day11.generate,
+    12: day12.generate,
+    13: day13.generate,
+    14: day14.generate,
+}
+
+
+def generate_input(
+    day: int, input_file: str, scale: float = 1.0, seed: int = 0
+) -> None:
+    """Generate an input file for a day.
+
+    Args:
+        day: the day to generate the input for.
+        input_file: the file to write the input to.
+        scale: the scale factor; 1 gives about the size of an official
+            input.
+        seed: the seed for the random generator.
+
+    Raises:
+        ValueError: when there is no generator for the day.
+    """
+    generator = GENERATORS.get(day)
+    if generator is None:
+        raise ValueError(f'No generator for day {day}.')
+
+    with open(input_file, 'w', encoding='utf-8') as file:
+        generator(file, scale, Random(seed))
+
+
+__all__ = ['GENERATORS', 'InputGenerator', 'generate_input']
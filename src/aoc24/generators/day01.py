@@ -0,0 +1,28 @@
+"""Generator for Day 1 inputs: two columns with location IDs."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a list of location ID pairs.
+
+    About a third of the IDs in the right column are copied from the left
+    column, so the similarity score of part two is not always zero.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 1000 lines.
+        rng: the random generator to use.
+    """
+    left: list[int] = []
+    for _ in range(scaled_count(1000, scale)):
+        first = rng.randint(10000, 99999)
+        left.append(first)
+        if rng.random() < 0.3:
+            second = rng.choice(left)
+        else:
+            second = rng.randint(10000, 99999)
+        file.write(f'{first}   {second}\n')
@@ -0,0 +1,32 @@
+"""Generator for Day 2 inputs: reports with levels."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a list of reports.
+
+    Every report is increasing or decreasing with steps of 1 to 3. Some of
+    the reports get one or two bad levels, so not all reports are safe.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 1000 reports.
+        rng: the random generator to use.
+    """
+    for _ in range(scaled_count(1000, scale)):
+        direction = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        levels: list[int] = []
+        for _ in range(rng.randint(5, 8)):
+            levels.append(level)
+            level += direction * rng.randint(1, 3)
+
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            index = rng.randrange(len(levels))
+            levels[index] += rng.choice((-5, -1, 0, 1, 5))
+
+        file.write(' '.join(str(max(1, level)) for level in levels) + '\n')
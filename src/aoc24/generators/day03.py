@@ -0,0 +1,59 @@
+"""Generator for Day 3 inputs: corrupted memory with instructions."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+NOISE = "#$%&'*+-./:;<=>?@[]^_{}~ !abcdefghijklmnopqrstuvwxyz"
+CORRUPTED_INSTRUCTIONS = (
+    'mul[{x},{y}]',
+    'mul({x}*{y})',
+    'mul ( {x} , {y} )',
+    'mul({x},{y}!',
+    'mul({x},',
+    'do_not_mul({x},{y})',
+    "don't",
+    'do(',
+)
+
+
+def _create_token(rng: Random) -> str:
+    """Create a random piece of corrupted memory.
+
+    Args:
+        rng: the random generator to use.
+
+    Returns:
+        A valid or corrupted instruction, or some noise.
+    """
+    kind = rng.random()
+    x = rng.randint(1, 999)
+    y = rng.randint(1, 999)
+    if kind < 0.25:
+        return f'mul({x},{y})'
+    if kind < 0.3:
+        return 'do()'
+    if kind < 0.35:
+        return "don't()"
+    if kind < 0.5:
+        return rng.choice(CORRUPTED_INSTRUCTIONS).format(x=x, y=y)
+    return ''.join(rng.choices(NOISE, k=rng.randint(1, 12)))
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write lines of corrupted memory.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 6 lines of about 3000 characters.
+        rng: the random generator to use.
+    """
+    for _ in range(scaled_count(6, scale)):
+        line: list[str] = []
+        length = 0
+        while length < 3000:
+            token = _create_token(rng)
+            line.append(token)
+            length += len(token)
+        file.write(''.join(line) + '\n')
@@ -0,0 +1,19 @@
+"""Generator for Day 4 inputs: a word search grid."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_side
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a square grid with the letters X, M, A and S.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the area; 1 gives 140 by 140 letters.
+        rng: the random generator to use.
+    """
+    side = scaled_side(140, scale)
+    for _ in range(side):
+        file.write(''.join(rng.choices('XMAS', k=side)) + '\n')
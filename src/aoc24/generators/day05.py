@@ -0,0 +1,38 @@
+"""Generator for Day 5 inputs: page ordering rules and updates."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write page ordering rules followed by updates.
+
+    The pages are put in a random order and there is a rule for every pair
+    of pages, so every update can be ordered. About half of the updates are
+    in the correct order already.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the amount of updates; 1 gives 200
+            updates.
+        rng: the random generator to use.
+    """
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        (first, second)
+        for index, first in enumerate(pages)
+        for second in pages[index + 1 :]
+    ]
+    rng.shuffle(rules)
+    for first, second in rules:
+        file.write(f'{first}|{second}\n')
+    file.write('\n')
+
+    order = {page: index for index, page in enumerate(pages)}
+    for _ in range(scaled_count(200, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=order.__getitem__)
+        file.write(','.join(str(page) for page in update) + '\n')
@@ -0,0 +1,112 @@
+"""Generator for Day 6 inputs: a lab map with a guard."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_side
+
+DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+OBSTRUCTION = ord('#')
+EMPTY = ord('.')
+
+
+def _guard_leaves_map(rows: list[bytearray], start: tuple[int, int]) -> bool:
+    """Check if the guard walks off the map instead of walking in a loop.
+
+    Args:
+        rows: the map.
+        start: the starting position of the guard.
+
+    Returns:
+        True when the guard leaves the map.
+    """
+    height = len(rows)
+    width = len(rows[0])
+    x, y = start
+    direction = 0
+    seen: set[tuple[int, int, int]] = set()
+    while (x, y, direction) not in seen:
+        seen.add((x, y, direction))
+        dx, dy = DIRECTIONS[direction]
+        new_x, new_y = x + dx, y + dy
+        if not (0 <= new_x < width and 0 <= new_y < height):
+            return True
+        if rows[new_y][new_x] == OBSTRUCTION:
+            direction = (direction + 1) % 4
+        else:
+            x, y = new_x, new_y
+    return False
+
+
+def _create_map(
+    side: int, rng: Random
+) -> tuple[list[bytearray], tuple[int, int]]:
+    """Create a map with a long route for the guard.
+
+    A map with random obstructions gives very short routes. Instead, the
+    route is laid out as a spiral with random gaps between the rounds, with
+    an obstruction at the end of every straight line. Random obstructions
+    are added next to the route.
+
+    Args:
+        side: the length of the sides of the map.
+        rng: the random generator to use.
+
+    Returns:
+        The map and the starting position of the guard.
+    """
+    rows = [
+        bytearray(
+            OBSTRUCTION if rng.random() < 0.05 else EMPTY for _ in range(side)
+        )
+        for _ in range(side)
+    ]
+    start = (side // 2, side // 2)
+    route: set[tuple[int, int]] = {start}
+    turns: list[tuple[int, int]] = []
+
+    x, y = start
+    lengths = [1, 1]
+    direction = 0
+    while True:
+        dx, dy = DIRECTIONS[direction]
+        for _ in range(lengths[direction % 2]):
+            if not (0 <= x + dx < side and 0 <= y + dy < side):
+                break
+            x, y = x + dx, y + dy
+            route.add((x, y))
+        else:
+            if 0 <= x + dx < side and 0 <= y + dy < side:
+                turns.append((x + dx, y + dy))
+                lengths[direction % 2] += rng.randint(2, 6)
+                direction = (direction + 1) % 4
+                continue
+        break
+
+    for x, y in route:
+        rows[y][x] = EMPTY
+    for x, y in turns:
+        rows[y][x] = OBSTRUCTION
+    return rows, start
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a square map with obstructions and a guard facing north.
+
+    The puzzle assumes the guard eventually leaves the map, so maps on which
+    the guard walks in a loop are thrown away and created again.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the area; 1 gives 130 by 130 positions.
+        rng: the random generator to use.
+    """
+    side = scaled_side(130, scale)
+    while True:
+        rows, start = _create_map(side, rng)
+        if _guard_leaves_map(rows, start):
+            break
+
+    rows[start[1]][start[0]] = ord('^')
+    for row in rows:
+        file.write(row.decode('ascii') + '\n')
@@ -0,0 +1,39 @@
+"""Generator for Day 7 inputs: calibration equations."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write calibration equations.
+
+    The test value is calculated from the numbers with random operators, so
+    most equations can be solved. Some only with the concatenation operator
+    of part two, and some of the test values are changed so they cannot be
+    solved at all.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 850 equations.
+        rng: the random generator to use.
+    """
+    for _ in range(scaled_count(850, scale)):
+        numbers = [
+            rng.randint(1, 999) if rng.random() < 0.2 else rng.randint(1, 99)
+            for _ in range(rng.randint(2, 12))
+        ]
+        operators = '+*|' if rng.random() < 0.5 else '+*'
+        result = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.choice(operators)
+            if operator == '+':
+                result += number
+            elif operator == '*':
+                result *= number
+            else:
+                result = int(f'{result}{number}')
+        if rng.random() < 0.3:
+            result += rng.randint(1, 10)
+        file.write(f'{result}: {" ".join(str(n) for n in numbers)}\n')
@@ -0,0 +1,30 @@
+"""Generator for Day 8 inputs: a map with antennas."""
+
+import string
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count, scaled_side
+
+FREQUENCIES = string.ascii_lowercase + string.ascii_uppercase + string.digits
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a square map with antennas on different frequencies.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the area; 1 gives 50 by 50 positions
+            with about 200 antennas.
+        rng: the random generator to use.
+    """
+    side = scaled_side(50, scale)
+    antenna_count = min(scaled_count(200, scale), side * side)
+    frequencies = FREQUENCIES[: min(len(FREQUENCIES), antenna_count // 4 + 1)]
+
+    rows = [['.'] * side for _ in range(side)]
+    for position in rng.sample(range(side * side), antenna_count):
+        rows[position // side][position % side] = rng.choice(frequencies)
+
+    for row in rows:
+        file.write(''.join(row) + '\n')
@@ -0,0 +1,27 @@
+"""Generator for Day 9 inputs: a disk map."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a disk map.
+
+    The disk map alternates between file sizes (1 to 9) and free space sizes
+    (0 to 9) and starts and ends with a file. It is written without a
+    trailing newline, since every character is parsed as a size.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 19999 digits.
+        rng: the random generator to use.
+    """
+    file_count = scaled_count(10000, scale)
+    digits: list[str] = []
+    for index in range(file_count):
+        digits.append(str(rng.randint(1, 9)))
+        if index < file_count - 1:
+            digits.append(str(rng.randint(0, 9)))
+    file.write(''.join(digits))
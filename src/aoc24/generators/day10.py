@@ -0,0 +1,41 @@
+"""Generator for Day 10 inputs: a topographic map."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_side
+
+BLOCK_SIZE = 10
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a square topographic map with heights from 0 to 9.
+
+    The map consists of blocks with a diagonal slope in a random direction,
+    so there are a lot of hiking trails. Some heights are replaced with
+    random heights to break up trails.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the area; 1 gives 45 by 45 positions.
+        rng: the random generator to use.
+    """
+    side = scaled_side(45, scale)
+    block_count = side // BLOCK_SIZE + 1
+    slopes = [
+        [
+            (rng.choice((-1, 1)), rng.choice((-1, 1)), rng.randrange(10))
+            for _ in range(block_count)
+        ]
+        for _ in range(block_count)
+    ]
+    for y in range(side):
+        row: list[str] = []
+        for x in range(side):
+            slope_x, slope_y, offset = slopes[y // BLOCK_SIZE][x // BLOCK_SIZE]
+            if rng.random() < 0.1:
+                height = rng.randrange(10)
+            else:
+                height = (slope_x * x + slope_y * y + offset) % 10
+            row.append(str(height))
+        file.write(''.join(row) + '\n')
@@ -0,0 +1,21 @@
+"""Generator for Day 11 inputs: numbers engraved on stones."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a line with stones.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 8 stones.
+        rng: the random generator to use.
+    """
+    stones = [
+        rng.choice((0, rng.randint(1, 99), rng.randint(100, 9_999_999)))
+        for _ in range(scaled_count(8, scale))
+    ]
+    file.write(' '.join(str(stone) for stone in stones) + '\n')
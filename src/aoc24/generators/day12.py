@@ -0,0 +1,38 @@
+"""Generator for Day 12 inputs: a garden with plots of plants."""
+
+import string
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_side
+
+REGION_SIZE = 6
+JITTER = 2
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write a square garden map with irregular regions.
+
+    The garden is divided in blocks with a random plant. Every plot takes
+    the plant of a block near it, which gives regions with ragged borders.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor for the area; 1 gives 140 by 140 plots.
+        rng: the random generator to use.
+    """
+    side = scaled_side(140, scale)
+    block_count = side // REGION_SIZE + 1
+    blocks = [
+        rng.choices(string.ascii_uppercase, k=block_count)
+        for _ in range(block_count)
+    ]
+    for y in range(side):
+        row: list[str] = []
+        for x in range(side):
+            block_x = (x + rng.randint(-JITTER, JITTER)) // REGION_SIZE
+            block_y = (y + rng.randint(-JITTER, JITTER)) // REGION_SIZE
+            block_x = min(max(block_x, 0), block_count - 1)
+            block_y = min(max(block_y, 0), block_count - 1)
+            row.append(blocks[block_y][block_x])
+        file.write(''.join(row) + '\n')
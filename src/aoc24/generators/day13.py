@@ -0,0 +1,36 @@
+"""Generator for Day 13 inputs: claw machines."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write claw machine descriptions, separated by empty lines.
+
+    For most machines the prize is put on a position that can be reached
+    with the buttons; for the others the prize position is random.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 320 machines.
+        rng: the random generator to use.
+    """
+    machines: list[str] = []
+    for _ in range(scaled_count(320, scale)):
+        a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.6:
+            presses_a = rng.randint(1, 100)
+            presses_b = rng.randint(1, 100)
+            prize_x = presses_a * a_x + presses_b * b_x
+            prize_y = presses_a * a_y + presses_b * b_y
+        else:
+            prize_x = rng.randint(1000, 20000)
+            prize_y = rng.randint(1000, 20000)
+        machines.append(
+            f'Button A: X+{a_x}, Y+{a_y}\n'
+            f'Button B: X+{b_x}, Y+{b_y}\n'
+            f'Prize: X={prize_x}, Y={prize_y}\n'
+        )
+    file.write('\n'.join(machines))
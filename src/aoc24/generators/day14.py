@@ -0,0 +1,26 @@
+"""Generator for Day 14 inputs: robots with positions and velocities."""
+
+from random import Random
+from typing import TextIO
+
+from .sizes import scaled_count
+
+MAP_SIZE = (101, 103)
+
+
+def generate(file: TextIO, scale: float, rng: Random) -> None:
+    """Write robots for a map of 101 by 103 tiles.
+
+    Args:
+        file: the file to write to.
+        scale: the scale factor; 1 gives 500 robots.
+        rng: the random generator to use.
+    """
+    for _ in range(scaled_count(500, scale)):
+        position_x = rng.randrange(MAP_SIZE[0])
+        position_y = rng.randrange(MAP_SIZE[1])
+        velocity_x = rng.randint(-99, 99)
+        velocity_y = rng.randint(-99, 99)
+        file.write(
+            f'p={position_x},{position_y} v={velocity_x},{velocity_y}\n'
+        )
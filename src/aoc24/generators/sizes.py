@@ -0,0 +1,32 @@
+"""Helpers to scale the size of generated inputs."""
+
+import math
+
+
+def scaled_count(base: int, scale: float) -> int:
+    """Scale an amount of items, like lines or records.
+
+    Args:
+        base: the amount at scale 1; roughly the size of an official input.
+        scale: the scale factor.
+
+    Returns:
+        The scaled amount; at least 1.
+    """
+    return max(1, round(base * scale))
+
+
+def scaled_side(base: int, scale: float) -> int:
+    """Scale the side of a square grid.
+
+    The area of the grid grows with the scale factor, so the side grows with
+    the square root of it.
+
+    Args:
+        base: the length of the side at scale 1.
+        scale: the scale factor.
+
+    Returns:
+        The scaled length of the side; at least 1.
+    """
+    return max(1, round(base * math.sqrt(scale)))
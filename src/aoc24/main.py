@@ -4,60 +4,612 @@ This method is ran when the script is ran as a module and when it is ran as a
 executable script.
 """
 
-from rich.console import Console
+import argparse
+import os
+import sys
 
 from aoc.advent_of_code import AdventOfCode
+from aoc.backend import BACKENDS, numpy_available
+from aoc.executor import EXECUTORS, gil_enabled
 
-from .solutions import (
-    Day01,
-    Day02,
-    Day03,
-    Day04,
-    Day05,
-    Day06,
-    Day07,
-    Day08,
-    Day09,
-    Day10,
-    Day11,
-    Day12,
-    Day13,
-    Day14,
-)
+
+def default_answer_cache() -> str:
+    """Get the default location of the answer cache.
+
+    Returns:
+        The path of the database in the user cache directory.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(cache_home, 'aoc24', 'answers.sqlite3')
+
+
+def create_advent_of_code(
+    data_directory: str,
+    parse_cache_directory: str | None = None,
+    answer_cache_path: str | None = None,
+    backend: str = 'python',
+) -> AdventOfCode:
+    """Create the AdventOfCode object with all solutions registered.
+
+    The solutions are registered by name, so a solution module is only
+    imported when the solution for that day is used.
+
+    Args:
+        data_directory: the directory with the `dayNN-input.txt` files.
+        parse_cache_directory: the directory to cache parsed input data in.
+            Parsed data is not cached when not given.
+        answer_cache_path: the database to cache the answers in. Answers
+            are not cached when not given.
+        backend: the backend for the solutions that have a NumPy version;
+            `python` or `numpy`.
+
+    Returns:
+        The AdventOfCode object.
+    """
+    parse_cache = None
+    if parse_cache_directory is not None:
+        from aoc.parse_cache import ParseCache  # noqa: PLC0415
+
+        parse_cache = ParseCache(parse_cache_directory)
+    answer_cache = None
+    if answer_cache_path is not None:
+        from aoc.answer_cache import AnswerCache  # noqa: PLC0415
+
+        answer_cache = AnswerCache(answer_cache_path)
+    aoc24 = AdventOfCode(parse_cache, answer_cache)
+
+    def input_file(day: int) -> str:
+        return f'{data_directory}/day{day:02}-input.txt'
+
+    aoc24.register_solution(
+        1,
+        'aoc24.solutions.day01:Day01',
+        input_file(1),
+        backend=backend,
+    )
+    aoc24.register_solution(
+        2,
+        'aoc24.solutions.day02:Day02',
+        input_file(2),
+        backend=backend,
+    )
+    aoc24.register_solution(3, 'aoc24.solutions.day03:Day03', input_file(3))
+    aoc24.register_solution(
+        4,
+        'aoc24.solutions.day04:Day04',
+        input_file(4),
+        backend=backend,
+    )
+    aoc24.register_solution(5, 'aoc24.solutions.day05:Day05', input_file(5))
+    aoc24.register_solution(6, 'aoc24.solutions.day06:Day06', input_file(6))
+    aoc24.register_solution(7, 'aoc24.solutions.day07:Day07', input_file(7))
+    aoc24.register_solution(8, 'aoc24.solutions.day08:Day08', input_file(8))
+    aoc24.register_solution(9, 'aoc24.solutions.day09:Day09', input_file(9))
+    aoc24.register_solution(10, 'aoc24.solutions.day10:Day10', input_file(10))
+    aoc24.register_solution(11, 'aoc24.solutions.day11:Day11', input_file(11))
+    aoc24.register_solution(12, 'aoc24.solutions.day12:Day12', input_file(12))
+    aoc24.register_solution(
+        13,
+        'aoc24.solutions.day13:Day13',
+        input_file(13),
+        backend=backend,
+    )
+    aoc24.register_solution(
+        14,
+        'aoc24.solutions.day14:Day14',
+        input_file(14),
+        map_size=(101, 103),
+        backend=backend,
+    )
+    return aoc24
+
+
+def threshold(value: str) -> float:
+    """Parse a threshold given on the command line.
+
+    Args:
+        value: the threshold as percentage (`10%`) or fraction (`0.1`).
+
+    Returns:
+        The threshold as fraction.
+
+    Raises:
+        ArgumentTypeError: when the value is not a valid threshold.
+    """
+    try:
+        if value.endswith('%'):
+            return float(value[:-1]) / 100
+        return float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f'invalid threshold: {value!r}'
+        ) from exc
+
+
+def scales(value: str) -> list[float]:
+    """Parse a list of scales given on the command line.
+
+    Args:
+        value: comma separated scales, like `0.5,1,2`.
+
+    Returns:
+        The scales, from small to large.
+
+    Raises:
+        ArgumentTypeError: when the value is not a valid list of scales.
+    """
+    try:
+        parsed = sorted(float(scale) for scale in value.split(','))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f'invalid scales: {value!r}') from exc
+    if len(parsed) < 2 or parsed[0] <= 0:
+        raise argparse.ArgumentTypeError(
+            'at least two positive scales are needed'
+        )
+    return parsed
+
+
+def seconds(value: str) -> float:
+    """Parse a duration given on the command line.
+
+    Args:
+        value: the duration in seconds, like `30` or `2.5`.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        ArgumentTypeError: when the value is not a positive duration.
+    """
+    try:
+        parsed = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f'invalid duration: {value!r}'
+        ) from exc
+    if not parsed > 0:
+        raise argparse.ArgumentTypeError('the duration must be positive')
+    return parsed
+
+
+def _add_backend_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the `--backend` option to a parser.
+
+    Args:
+        parser: the parser to add the option to.
+    """
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='python',
+        help='implementation for the days that have a vectorized version; '
+        'numpy falls back to python when NumPy is not installed (default: '
+        '%(default)s)',
+    )
+
+
+def _add_server_parsers(
+    subparsers: 'argparse._SubParsersAction[argparse.ArgumentParser]',
+) -> None:
+    """Add the parsers for the serve, batch and profile commands.
+
+    Args:
+        subparsers: the subparsers of the main parser.
+    """
+    serve_parser = subparsers.add_parser(
+        'serve', help='solve requests on a local HTTP server'
+    )
+    serve_parser.set_defaults(command='serve')
+    serve_parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='address to listen on (default: %(default)s)',
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=8024,
+        help='port to listen on (default: %(default)s)',
+    )
+    serve_parser.add_argument(
+        '--workers',
+        type=int,
+        help='number of worker processes (default: number of CPUs)',
+    )
+    serve_parser.add_argument(
+        '--parse-cache',
+        metavar='DIR',
+        help='cache the parsed input data in DIR',
+    )
+    serve_parser.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        help='solve all requests, instead of using cached answers',
+    )
+    serve_parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='do not log every request',
+    )
+    _add_backend_argument(serve_parser)
+
+    batch_parser = subparsers.add_parser(
+        'batch', help='solve one day for many input files'
+    )
+    batch_parser.set_defaults(command='batch')
+    batch_parser.add_argument(
+        '--day', type=int, required=True, help='day to solve'
+    )
+    batch_parser.add_argument(
+        '--workers',
+        type=int,
+        help='number of worker processes (default: number of CPUs)',
+    )
+    batch_parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=16,
+        help='inputs sent to a worker at once (default: %(default)s)',
+    )
+    batch_parser.add_argument(
+        '--parse-cache',
+        metavar='DIR',
+        help='cache the parsed input data in DIR',
+    )
+    _add_backend_argument(batch_parser)
+    batch_parser.add_argument(
+        'input_files', nargs='+', metavar='FILE', help='input files to solve'
+    )
+
+    profile_parser = subparsers.add_parser(
+        'profile', help='profile a solution with cProfile'
+    )
+    profile_parser.set_defaults(command='profile')
+    profile_parser.add_argument(
+        '--data',
+        default='data',
+        help='directory with the input files (default: %(default)s)',
+    )
+    profile_parser.add_argument(
+        '--day', type=int, required=True, help='day to profile'
+    )
+    profile_parser.add_argument(
+        '--part',
+        type=int,
+        choices=(1, 2),
+        help='part to profile, after loading the data (default: loading '
+        'and both parts)',
+    )
+    profile_parser.add_argument(
+        '--top',
+        type=int,
+        default=20,
+        help='number of functions to print (default: %(default)s)',
+    )
+    profile_parser.add_argument(
+        '--output',
+        metavar='PREFIX',
+        help='write PREFIX.pstats and PREFIX.collapsed (default: '
+        'profile-dayNN or profile-dayNN-partN)',
+    )
+    _add_backend_argument(profile_parser)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser for the command line arguments.
+
+    Returns:
+        The argument parser.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--data',
+        default='data',
+        help='directory with the input files (default: %(default)s)',
+    )
+    common.add_argument(
+        '--day',
+        dest='days',
+        type=int,
+        action='append',
+        help='day to run; can be given multiple times (default: all days)',
+    )
+    common.add_argument(
+        '--parse-cache',
+        metavar='DIR',
+        help='cache the parsed input data in DIR, so later runs on the same '
+        'input skip parsing',
+    )
+    _add_backend_argument(common)
+
+    parser = argparse.ArgumentParser(
+        prog='aoc24', description='Advent of Code 2024 - Python version'
+    )
+    parser.set_defaults(
+        command='run',
+        data='data',
+        days=None,
+        parse_cache=None,
+        backend='python',
+        plain=False,
+        cache=True,
+        timings=False,
+        memory=False,
+        perf=False,
+        stream=False,
+        json_lines=False,
+        server=None,
+        timeout=None,
+        executor='processes',
+    )
+    subparsers = parser.add_subparsers(title='commands')
+
+    run_parser = subparsers.add_parser(
+        'run', parents=[common], help='solve the puzzles (default)'
+    )
+    run_parser.set_defaults(command='run')
+    run_parser.add_argument(
+        '--plain',
+        action='store_true',
+        help='print the answers as plain text, without colors',
+    )
+    run_parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='print the time of the phases inside the solutions',
+    )
+    run_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='show the answers in a live table as soon as every part is '
+        'solved, instead of after all days',
+    )
+    run_parser.add_argument(
+        '--json-lines',
+        action='store_true',
+        help='print every answer as a line of JSON as soon as its part is '
+        'solved',
+    )
+    run_parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='measure the peak and retained memory of every phase with '
+        'tracemalloc, instead of printing the answers; the days are run '
+        'one after another and much slower',
+    )
+    run_parser.add_argument(
+        '--perf',
+        action='store_true',
+        help='make the Python functions visible to Linux perf while '
+        'solving; run under `perf record` (implies --no-cache)',
+    )
+    run_parser.add_argument(
+        '--executor',
+        choices=EXECUTORS,
+        default='processes',
+        help='solve the days on worker processes, or on threads that share '
+        'the loaded data; threads need a free-threaded Python build and '
+        'fall back to processes otherwise (default: %(default)s)',
+    )
+    run_parser.add_argument(
+        '--timeout',
+        type=seconds,
+        metavar='SECONDS',
+        help='stop every part that takes longer than SECONDS and report it '
+        'as TIMEOUT; the other parts are still solved, and the exit code is '
+        '1 when a part was stopped. Parts are always solved on processes '
+        'then, since threads cannot be stopped',
+    )
+    run_parser.add_argument(
+        '--server',
+        metavar='URL',
+        help='solve on a running `aoc24 serve` server, like '
+        'http://127.0.0.1:8024',
+    )
+    run_parser.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        help='solve all parts, instead of using the answers cached by '
+        'earlier runs on the same input and code',
+    )
+
+    bench_parser = subparsers.add_parser(
+        'bench', parents=[common], help='benchmark the solutions'
+    )
+    bench_parser.set_defaults(command='bench')
+    bench_parser.add_argument(
+        '--warmup',
+        type=int,
+        default=1,
+        help='untimed repetitions per phase (default: %(default)s)',
+    )
+    bench_parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='timed repetitions per phase (default: %(default)s)',
+    )
+    bench_parser.add_argument(
+        '--json',
+        metavar='FILE',
+        help='write the results as JSON to FILE; use - for stdout',
+    )
+    bench_parser.add_argument(
+        '--compare',
+        metavar='FILE',
+        help='compare the medians against a baseline JSON file and exit '
+        'with a non-zero code when a phase got slower',
+    )
+    bench_parser.add_argument(
+        '--threshold',
+        type=threshold,
+        default='10%',
+        help='allowed slowdown for --compare, like 10%% or 0.1 '
+        '(default: %(default)s)',
+    )
+    bench_parser.add_argument(
+        '--scaling',
+        action='store_true',
+        help='measure how time and memory scale with generated inputs '
+        'instead of timing the inputs in --data',
+    )
+    bench_parser.add_argument(
+        '--executors',
+        action='store_true',
+        help='compare the wall time of solving all parts on processes and '
+        'on threads, with generated inputs of the sizes in --scales, to '
+        'find where one gets faster than the other',
+    )
+    bench_parser.add_argument(
+        '--scales',
+        type=scales,
+        default='0.125,0.25,0.5,1',
+        help='comma separated input sizes for --scaling and --executors, '
+        'compared to the '
+        'official inputs (default: %(default)s)',
+    )
+    bench_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='seed for the generated inputs of --scaling and --executors '
+        '(default: %(default)s)',
+    )
+
+    _add_server_parsers(subparsers)
+
+    watch_parser = subparsers.add_parser(
+        'watch',
+        parents=[common],
+        help='solve the puzzles again when an input or solution changes',
+    )
+    watch_parser.set_defaults(command='watch')
+    watch_parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.5,
+        help='seconds between the checks for changes (default: %(default)s)',
+    )
+
+    generate_parser = subparsers.add_parser(
+        'generate', help='generate synthetic input files'
+    )
+    generate_parser.set_defaults(command='generate')
+    generate_parser.add_argument(
+        '--output',
+        required=True,
+        help='directory to write the dayNN-input.txt files to',
+    )
+    generate_parser.add_argument(
+        '--day',
+        dest='days',
+        type=int,
+        action='append',
+        help='day to generate; can be given multiple times (default: all)',
+    )
+    generate_parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        help='size compared to the official inputs (default: %(default)s)',
+    )
+    generate_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='seed for the random generator (default: %(default)s)',
+    )
+
+    return parser
 
 
 def main() -> None:
     """Main function for the application."""
-    aoc24 = AdventOfCode()
-    console = Console()
-
-    # Add solutions
-    # aoc24.add_solution(1, Day01('data/day01-input.txt'))
-    # aoc24.add_solution(2, Day02('data/day02-input.txt'))
-    # aoc24.add_solution(3, Day03('data/day03-input.txt'))
-    # aoc24.add_solution(4, Day04('data/day04-input.txt'))
-    # aoc24.add_solution(5, Day05('data/day05-input.txt'))
-    # aoc24.add_solution(6, Day06('data/day06-input.txt'))
-    # aoc24.add_solution(7, Day07('data/day07-input.txt'))
-    # aoc24.add_solution(8, Day08('data/day08-input.txt'))
-    # aoc24.add_solution(9, Day09('data/day09-input.txt'))
-    # aoc24.add_solution(10, Day10('data/day10-input.txt'))
-    # aoc24.add_solution(11, Day11('data/day11-input.txt'))
-    # aoc24.add_solution(12, Day12('data/day12-input.txt'))
-    # aoc24.add_solution(13, Day13('data/day13-input.txt'))
-    aoc24.add_solution(13, Day14('data/day14-input.txt', (101, 103)))
-
-    # Print solutions
-    console.print(
-        '[yellow][bold]Advent of Code 2024 - Python version[/bold][/yellow]'
-    )
-    console.print('[gray]By Daryl Stark[/gray]')
-    console.print('')
-    for day in range(1, 25):
-        solution = aoc24.get_solution(day)
-        if solution is not None:
-            console.print(f'[bold]Day {day:02}[/bold]: ', end='')
-            console.print(f'Puzzle 1: {solution.solve_puzzle_one()}')
-            console.print(
-                ' ' * 8, f'Puzzle 2: {solution.solve_puzzle_two()}', sep=''
+    arguments = create_parser().parse_args()
+    if arguments.backend == 'numpy' and not numpy_available():
+        print(
+            'NumPy is not installed; using the python backend. Install the '
+            '`numpy` extra to use it.',
+            file=sys.stderr,
+        )
+    if arguments.executor == 'threads' and gil_enabled():
+        print(
+            'This Python build runs one thread at a time (the GIL is '
+            'enabled); using processes instead of threads.',
+            file=sys.stderr,
+        )
+
+    # The commands are imported here, so only the modules for the given
+    # command are imported.
+    if arguments.command == 'generate':
+        from .commands import generate  # noqa: PLC0415
+
+        sys.exit(generate.generate(arguments))
+
+    if arguments.command == 'bench':
+        from .commands import bench  # noqa: PLC0415
+
+        aoc24 = create_advent_of_code(
+            arguments.data, arguments.parse_cache, backend=arguments.backend
+        )
+
+        sys.exit(bench.bench(aoc24, arguments))
+
+    if arguments.command == 'watch':
+        import tempfile  # noqa: PLC0415
+
+        from .commands import watch  # noqa: PLC0415
+
+        # Parsed inputs are reused when only a solution changes, so a
+        # parse cache is always used
+        with tempfile.TemporaryDirectory() as directory:
+            aoc24 = create_advent_of_code(
+                arguments.data,
+                arguments.parse_cache or directory,
+                backend=arguments.backend,
             )
+            sys.exit(watch.watch(aoc24, arguments))
+
+    if arguments.command == 'serve':
+        from .commands import serve  # noqa: PLC0415
+
+        aoc24 = create_advent_of_code(
+            arguments.data,
+            arguments.parse_cache,
+            default_answer_cache() if arguments.cache else None,
+            arguments.backend,
+        )
+        sys.exit(serve.serve(aoc24, arguments))
+
+    if arguments.command == 'batch':
+        from .commands import batch  # noqa: PLC0415
+
+        aoc24 = create_advent_of_code(
+            arguments.data, arguments.parse_cache, backend=arguments.backend
+        )
+        sys.exit(batch.batch(aoc24, arguments))
+
+    if arguments.command == 'profile':
+        from .commands import profile  # noqa: PLC0415
+
+        aoc24 = create_advent_of_code(
+            arguments.data, backend=arguments.backend
+        )
+        sys.exit(profile.profile(aoc24, arguments))
+
+    from .commands import run  # noqa: PLC0415
+
+    aoc24 = create_advent_of_code(
+        arguments.data,
+        arguments.parse_cache,
+        # A server uses its own answer cache
+        default_answer_cache()
+        if arguments.cache and not arguments.perf and not arguments.server
+        else None,
+        arguments.backend,
+    )
+    sys.exit(run.run(aoc24, arguments))
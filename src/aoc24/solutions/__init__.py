@@ -1,19 +1,47 @@
-"""Solutions for Advent of Code 2024."""
-
-from .day01 import Day01
-from .day02 import Day02
-from .day03 import Day03
-from .day04 import Day04
-from .day05 import Day05
-from .day06 import Day06
-from .day07 import Day07
-from .day08 import Day08
-from .day09 import Day09
-from .day10 import Day10
-from .day11 import Day11
-from .day12 import Day12
-from .day13 import Day13
-from .day14 import Day14
+"""Solutions for Advent of Code 2024.
+
+The solutions are imported when they are used for the first time, so
+running the solution for one day does not import the solutions for all
+days.
+"""
+
+import importlib
+
+_SOLUTION_MODULES = {
+    'Day01': '.day01',
+    'Day02': '.day02',
+    'Day03': '.day03',
+    'Day04': '.day04',
+    'Day05': '.day05',
+    'Day06': '.day06',
+    'Day07': '.day07',
+    'Day08': '.day08',
+    'Day09': '.day09',
+    'Day10': '.day10',
+    'Day11': '.day11',
+    'Day12': '.day12',
+    'Day13': '.day13',
+    'Day14': '.day14',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a solution on first use.
+
+    Args:
+        name: the name of the solution class.
+
+    Returns:
+        The solution class.
+
+    Raises:
+        AttributeError: when there is no solution with that name.
+    """
+    module_name = _SOLUTION_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module_name, __name__), name)
+
 
 __all__ = [
     'Day01',
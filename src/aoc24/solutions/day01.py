@@ -1,6 +1,8 @@
 """Solutions for Advent of Code 2024 - Day 1."""
 
-from aoc import DaySolution
+from collections import Counter
+
+from aoc import DaySolution, InputSource, select_backend
 
 
 class Day01(DaySolution):
@@ -12,46 +14,103 @@ class Day01(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    With the `numpy` backend, both parts are vectorized with NumPy.
     """
 
-    def __init__(self, input_file: str) -> None:
-        """Set internal values."""
-        self._input_file = input_file
+    PARSER_VERSION = 2
+    PARSED_ATTRIBUTES = ('_list_a', '_list_b')
+
+    def __init__(
+        self, input_file: InputSource | str, backend: str = 'python'
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            input_file: the file with the input data, or an input source.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
+        """
+        self._input_source = InputSource.of(input_file)
+        self._backend = select_backend(backend)
         self._loaded_data = False
-        self._list_a: list[int] = []
-        self._list_b: list[int] = []
+        self._list_a: tuple[int, ...] = ()
+        self._list_b: tuple[int, ...] = ()
 
     def _load_data(self) -> None:
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            for line in file:
-                splitted = line.strip().split()
-                self._list_a.append(int(splitted[0]))
-                self._list_b.append(int(splitted[1]))
+        rows = list(self._input_source.integers(self._backend))
+        self._list_a = tuple(row[0] for row in rows)
+        self._list_b = tuple(row[1] for row in rows)
+        self._store_parsed(self._input_source)
         self._loaded_data = True
 
+    def _solve_puzzle_one_numpy(self) -> str:
+        """Solve puzzle one with NumPy.
+
+        Returns:
+            The total distance between the sorted lists.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        list_a = np.sort(np.array(self._list_a, dtype=np.int64))
+        list_b = np.sort(np.array(self._list_b, dtype=np.int64))
+        return str(int(np.abs(list_a - list_b).sum()))
+
+    def _solve_puzzle_two_numpy(self) -> str:
+        """Solve puzzle two with NumPy.
+
+        Every number of the first list is looked up in the distinct numbers
+        of the second list, with their counts, instead of counting it in the
+        whole second list.
+
+        Returns:
+            The similarity score.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        list_a = np.array(self._list_a, dtype=np.int64)
+        numbers, counts = np.unique(
+            np.array(self._list_b, dtype=np.int64), return_counts=True
+        )
+        if len(numbers) == 0:
+            return '0'
+        indices = np.minimum(
+            np.searchsorted(numbers, list_a), len(numbers) - 1
+        )
+        found = numbers[indices] == list_a
+        return str(int((list_a * counts[indices] * found).sum()))
+
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
-        self._list_a.sort()
-        self._list_b.sort()
+        self.load_data()
+        if self._backend == 'numpy':
+            return self._solve_puzzle_one_numpy()
+
+        list_a = sorted(self._list_a)
+        list_b = sorted(self._list_b)
 
         distance: int = 0
-        for item in enumerate(self._list_a):
-            items = [item[1], self._list_b[item[0]]]
+        for item in enumerate(list_a):
+            items = [item[1], list_b[item[0]]]
             distance += max(items) - min(items)
 
         return str(distance)
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return self._solve_puzzle_two_numpy()
 
+        counts = Counter(self._list_b)
         similarity: int = 0
         for item in self._list_a:
-            similarity += item * self._list_b.count(item)
+            similarity += item * counts[item]
 
         return str(similarity)
@@ -1,6 +1,12 @@
 """Solutions for Advent of Code 2024 - Day 1."""
 
-from aoc import DaySolution
+from typing import TYPE_CHECKING
+
+from aoc import DaySolution, InputSource, select_backend
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 class Day02(DaySolution):
@@ -12,11 +18,24 @@ class Day02(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    With the `numpy` backend, the reports are checked with NumPy, all
+    reports of the same length at once.
     """
 
-    def __init__(self, input_file: str) -> None:
-        """Set internal values."""
-        self._input_file = input_file
+    PARSED_ATTRIBUTES = ('_list',)
+
+    def __init__(
+        self, input_file: InputSource | str, backend: str = 'python'
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            input_file: the file with the input data, or an input source.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
+        """
+        self._input_source = InputSource.of(input_file)
+        self._backend = select_backend(backend)
         self._loaded_data = False
         self._list: list[list[int]] = []
 
@@ -24,10 +43,16 @@ class Day02(DaySolution):
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            for line in file:
-                self._list.append([int(x) for x in line.split()])
+        self._list = [
+            list(row)
+            for row in self._input_source.integers(self._backend)
+            if row
+        ]
+        self._store_parsed(self._input_source)
         self._loaded_data = True
 
     def _is_increasing(self, numbers: list[int]) -> bool:
@@ -99,9 +124,54 @@ class Day02(DaySolution):
 
         return self._adjecent_numbers(report, max_difference)
 
+    def _are_safe(
+        self, reports: 'NDArray[np.int64]', max_difference: int = 3
+    ) -> 'NDArray[np.bool_]':
+        """Check which reports are safe, with NumPy.
+
+        Args:
+            reports: the reports, one per row, all with the same length.
+            max_difference: the max two numbers can be apart from each other.
+
+        Returns:
+            For every report, True when it is safe.
+        """
+        differences = reports[:, 1:] - reports[:, :-1]
+        increasing = (differences >= 1) & (differences <= max_difference)
+        decreasing = (differences <= -1) & (differences >= -max_difference)
+        return increasing.all(axis=1) | decreasing.all(axis=1)
+
+    def _count_safe_numpy(self, dampener: bool) -> int:
+        """Count the safe reports with NumPy.
+
+        Args:
+            dampener: whether a report is also safe when it is safe without
+                one of its levels.
+
+        Returns:
+            The number of safe reports.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        by_length: dict[int, list[list[int]]] = {}
+        for report in self._list:
+            by_length.setdefault(len(report), []).append(report)
+
+        safe_reports = 0
+        for length, reports in by_length.items():
+            levels = np.array(reports, dtype=np.int64)
+            safe = self._are_safe(levels)
+            if dampener:
+                for index in range(length):
+                    safe |= self._are_safe(np.delete(levels, index, axis=1))
+            safe_reports += int(safe.sum())
+        return safe_reports
+
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._count_safe_numpy(dampener=False))
 
         safe_reports = 0
         for report in self._list:
@@ -111,7 +181,9 @@ class Day02(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._count_safe_numpy(dampener=True))
 
         safe_reports = 0
         for report in self._list:
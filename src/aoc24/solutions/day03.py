@@ -1,8 +1,13 @@
 """Solutions for Advent of Code 2024 - Day 3."""
 
-from aoc import DaySolution
 import re
 
+from aoc import DaySolution, InputSource
+
+# Compiled once, when the module is imported
+_MULTIPLY = re.compile(r'mul\((\d+),(\d+)\)')
+_INSTRUCTION = re.compile(r'mul\((\d+),(\d+)\)|(do\(\))|(don\'t\(\))')
+
 
 class Day03(DaySolution):
     """Solution for Day 03.
@@ -15,9 +20,9 @@ class Day03(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
         self._file_data: str = ''
 
@@ -26,17 +31,15 @@ class Day03(DaySolution):
         if self._loaded_data:
             return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            self._file_data = file.read()
+        self._file_data = self._input_source.read_text()
         self._loaded_data = True
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
 
         instructions = [
-            (int(x[0]), int(x[1]))
-            for x in re.findall(r'mul\((\d+),(\d+)\)', self._file_data)
+            (int(x[0]), int(x[1])) for x in _MULTIPLY.findall(self._file_data)
         ]
 
         total = 0
@@ -46,12 +49,9 @@ class Day03(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
 
-        all_instructions = re.findall(
-            r'mul\((\d+),(\d+)\)|(do\(\))|(don\'t\(\))',
-            self._file_data,
-        )
+        all_instructions = _INSTRUCTION.findall(self._file_data)
 
         enabled = True
         total = 0
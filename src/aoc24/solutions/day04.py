@@ -1,6 +1,8 @@
 """Solutions for Advent of Code 2024 - Day 4."""
 
-from aoc import DaySolution
+from collections.abc import Iterable
+
+from aoc import DaySolution, Grid, InputSource, select_backend
 
 
 class Day04(DaySolution):
@@ -12,170 +14,154 @@ class Day04(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    With the `numpy` backend, the letters around all X's or A's are checked
+    at once with NumPy.
     """
 
-    def __init__(self, input_file: str) -> None:
-        """Set internal values."""
-        self._input_file = input_file
+    def __init__(
+        self, input_file: InputSource | str, backend: str = 'python'
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            input_file: the file with the input data, or an input source.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
+        """
+        self._input_source = InputSource.of(input_file)
+        self._backend = select_backend(backend)
         self._loaded_data = False
-        self._letter_grid: list[list[str]] = []
+        self._letter_grid = Grid.from_lines([])
 
     def _load_data(self) -> None:
         """Load data from the input file."""
         if self._loaded_data:
             return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            for line in file:
-                self._letter_grid.append(list(line.strip()))
+        self._letter_grid = self._input_source.grid()
         self._loaded_data = True
 
-    def _count_horizontal(self) -> int:
-        """Find the count of occurences horizontal.
+    def _count_in_lines(self, lines: Iterable[bytes]) -> int:
+        """Find the count of occurences in lines of the grid.
+
+        Args:
+            lines: the rows, columns or diagonals of the grid.
 
         Returns:
             The count of the word XMAS or SAMX in the lines.
         """
-        count = 0
-        for line in self._letter_grid:
-            line_joined = ''.join(line)
-            count += line_joined.count('XMAS')
-            count += line_joined.count('SAMX')
-        return count
+        return sum(line.count(b'XMAS') + line.count(b'SAMX') for line in lines)
 
-    def _count_vertical(self) -> int:
-        """Find the count of occurences vertical.
+    def _count_x_mas(self) -> int:
+        """Find the count of occurences of X-MAS.
 
-        Returns:
-            The count of the word XMAS or SAMX in the columns.
-        """
-        count = 0
-        for row_index in range(0, len(self._letter_grid[0])):
-            row_joined = ''.join([r[row_index] for r in self._letter_grid])
-            count += row_joined.count('XMAS')
-            count += row_joined.count('SAMX')
+        This means we have to find all occurences of:
 
-        return count
+            .M.S.
+            ..A..
+            .M.S.
 
-    def _count_diagonal(self) -> int:
-        """Find the count of occurences diagonal.
+        It basically means it's two MAS'es in a X. So for every A, the
+        corners around it must be an M and a S on both diagonals. The grid
+        has a border, so the corners of an A at the edge are on the border
+        and never an M or a S.
 
         Returns:
-            The count of the word XMAS or SAMX in the columns.
+            The count of the word word MAS in a X.
         """
-        all_words: list[str] = []
+        cells = self._letter_grid.cells
+        north_east, south_east, south_west, north_west = (
+            self._letter_grid.diagonal_offsets
+        )
+        m_and_s = ord('M') + ord('S')
+
         count = 0
+        for index in self._letter_grid.find_all(ord('A')):
+            if (
+                cells[index + north_west] + cells[index + south_east]
+                == m_and_s
+                and cells[index + north_east] + cells[index + south_west]
+                == m_and_s
+                and cells[index + north_west] in b'MS'
+                and cells[index + north_east] in b'MS'
+            ):
+                count += 1
+        return count
 
-        # Left to right downwards
-        for y in range(0, len(self._letter_grid) - 3):
-            for x in range(0, len(self._letter_grid[y]) - 3):
-                new_x = x
-                new_y = y
-                word = ''
-                while len(word) < 4:
-                    word += self._letter_grid[new_y][new_x]
-                    new_x += 1
-                    new_y += 1
-                if word in ('XMAS', 'SAMX'):
-                    all_words.append(word)
-
-        # Right to left downwards
-        for y in range(0, len(self._letter_grid) - 3):
-            for x in range(len(self._letter_grid[y]) - 1, 2, -1):
-                new_x = x
-                new_y = y
-                word = ''
-                while len(word) < 4:
-                    word += self._letter_grid[new_y][new_x]
-                    new_x -= 1
-                    new_y += 1
-                if word in ('XMAS', 'SAMX'):
-                    all_words.append(word)
-
-        return len(all_words)
-
-    def _get_diagonal_to_right(self, x: int, y: int, length: int) -> str:
-        """Get the diagonal word from a starting position to the right.
+    def _count_xmas_numpy(self) -> int:
+        """Find the count of occurences of XMAS with NumPy.
 
-        Args:
-            x: the x position.
-            y: the y position.
-            length: the amount of characters to get
-        """
-        new_x = x
-        new_y = y
-        word = ''
-        while len(word) < length:
-            try:
-                word += self._letter_grid[new_y][new_x]
-            except IndexError:
-                break
-            new_x += 1
-            new_y += 1
-        return word
-
-    def _get_diagonal_to_left(self, x: int, y: int, length: int) -> str:
-        """Get the diagonal word from a starting position to the left.
+        From every X, the next three letters are checked in all eight
+        directions. A word that goes off the map hits the border around it;
+        the cells are padded with three more rows of zeros on both ends, so
+        no index goes beyond the cells.
 
-        Args:
-            x: the x position.
-            y: the y position.
-            length: the amount of characters to get
+        Returns:
+            The count of the word XMAS in all directions.
         """
-        new_x = x
-        new_y = y
-        word = ''
-        while len(word) < length:
-            try:
-                word += self._letter_grid[new_y][new_x]
-            except IndexError:
-                break
-            new_x -= 1
-            if new_x < 0:
-                break
-            new_y += 1
-        return word
+        import numpy as np  # noqa: PLC0415
 
-    def _count_x_mas(self) -> int:
-        """Find the count of occurences of X-MAS.
+        grid = self._letter_grid
+        padding = 3 * (grid.stride + 1)
+        cells = np.pad(np.frombuffer(grid.cells, dtype=np.uint8), padding)
+        x_positions = np.flatnonzero(cells == ord('X'))
 
-        This means we have to find all occurences of:
+        count = 0
+        for offset in grid.offsets + grid.diagonal_offsets:
+            count += int(
+                (
+                    (cells[x_positions + offset] == ord('M'))
+                    & (cells[x_positions + 2 * offset] == ord('A'))
+                    & (cells[x_positions + 3 * offset] == ord('S'))
+                ).sum()
+            )
+        return count
 
-            .M.S.
-            ..A..
-            .M.S.
+    def _count_x_mas_numpy(self) -> int:
+        """Find the count of occurences of X-MAS with NumPy.
 
-        It basically means it's two MAS'es in a X.
+        Like `_count_x_mas`, but with the corners of all A's at once.
 
         Returns:
             The count of the word word MAS in a X.
         """
-        count = 0
-
-        # Left to right downwards
-        for y in range(0, len(self._letter_grid)):
-            for x in range(0, len(self._letter_grid[y])):
-                word_r = self._get_diagonal_to_right(x, y, 3)
-                if word_r in ('MAS', 'SAM'):
-                    word_l = self._get_diagonal_to_left(x + 2, y, 3)
-                    if word_l in ('MAS', 'SAM'):
-                        count += 1
-
-        return count
+        import numpy as np  # noqa: PLC0415
+
+        grid = self._letter_grid
+        cells = np.frombuffer(grid.cells, dtype=np.uint8)
+        a_positions = np.flatnonzero(cells == ord('A'))
+        north_east, south_east, south_west, north_west = (
+            cells[a_positions + offset].astype(np.int16)
+            for offset in grid.diagonal_offsets
+        )
+        m_and_s = ord('M') + ord('S')
+        return int(
+            (
+                (north_west + south_east == m_and_s)
+                & (north_east + south_west == m_and_s)
+                & ((north_west == ord('M')) | (north_west == ord('S')))
+                & ((north_east == ord('M')) | (north_east == ord('S')))
+            ).sum()
+        )
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._count_xmas_numpy())
 
         count = 0
 
-        count += self._count_horizontal()
-        count += self._count_vertical()
-        count += self._count_diagonal()
+        count += self._count_in_lines(self._letter_grid.rows())
+        count += self._count_in_lines(self._letter_grid.columns())
+        count += self._count_in_lines(self._letter_grid.diagonals())
+        count += self._count_in_lines(self._letter_grid.anti_diagonals())
 
         return str(count)
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._count_x_mas_numpy())
         return str(self._count_x_mas())
@@ -1,9 +1,8 @@
 """Solutions for Advent of Code 2024 - Day 5."""
 
 from functools import cmp_to_key
-import re
 
-from aoc import DaySolution
+from aoc import DaySolution, InputSource
 
 
 class Day05(DaySolution):
@@ -17,9 +16,11 @@ class Day05(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    PARSED_ATTRIBUTES = ('_rules', '_updates')
+
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
         self._rules: list[tuple[int, int]] = []
         self._updates: list[list[int]] = []
@@ -28,17 +29,15 @@ class Day05(DaySolution):
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            data = file.read()
-        self._rules = [
-            (int(first), int(second))
-            for first, second in re.findall(r'(\d+)\|(\d+)', data)
-        ]
-        self._updates = [
-            [int(page) for page in update[0].split(',')]
-            for update in re.findall(r'^(\d+(,\d+)*)$', data, re.MULTILINE)
-        ]
+        # The rules and the updates are separated by an empty line
+        rules, updates = self._input_source.integers().sections()
+        self._rules = [(rule[0], rule[1]) for rule in rules]
+        self._updates = [list(update) for update in updates]
+        self._store_parsed(self._input_source)
         self._loaded_data = True
 
     def _is_valid_update(self, update: list[int]) -> bool:
@@ -81,7 +80,7 @@ class Day05(DaySolution):
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
 
         sum = 0
 
@@ -96,7 +95,7 @@ class Day05(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
 
         sum = 0
 
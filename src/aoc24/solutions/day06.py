@@ -1,11 +1,19 @@
 """Solutions for Advent of Code 2024 - Day 6."""
 
-from aoc import DaySolution
 from enum import Enum
 
+from aoc import DaySolution, Grid, InputSource, timed
+
+# The map is bytes, so the cells are character codes
+GUARD = ord('^')
+FREE = frozenset(b'.^')
+
 
 class GuardDirection(int, Enum):
-    """Walking direction for a guard."""
+    """Walking direction for a guard.
+
+    The values are the order of the offsets of a `Grid`.
+    """
 
     NORTH = 0
     EAST = 1
@@ -13,7 +21,7 @@ class GuardDirection(int, Enum):
     WEST = 3
 
 
-class Day06(DaySolution):
+class Day06(DaySolution[frozenset[int]]):
     """Solution for Day 06.
 
     Link: https://adventofcode.com/2024/day/5
@@ -22,148 +30,110 @@ class Day06(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    The map is a `Grid`, so positions are flat indices in its cells and a
+    step is adding the offset of the direction. The guard leaves the map by
+    stepping on the border around it.
     """
 
-    def __init__(self, input_file: str) -> None:
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
-        self._map: list[list[str]] = []
-        self._guard_position: tuple[int, int] = (0, 0)
-        self._guard_direction: GuardDirection = GuardDirection.NORTH
-        self._updates: list[list[int]] = []
+        self._input_source = InputSource.of(input_file)
+        self._loaded_data = False
+        self._map = Grid.from_lines([])
+        self._guard_position = 0
 
     def _load_data(self) -> None:
         """Load data from the input file."""
-        with open(self._input_file, encoding='utf-8') as file:
-            self._map = [list(line.strip()) for line in file.readlines()]
-
-        self._get_current_position()
-        self._guard_direction: GuardDirection = GuardDirection.NORTH
-
-    def _get_current_position(self) -> None:
-        """Get the current position of the guard."""
-        for y in range(len(self._map)):
-            for x in range(0, len(self._map[y])):
-                if self._map[y][x] == '^':
-                    self._guard_position = (x, y)
-                    return
+        if self._loaded_data:
+            return
 
-    def _is_valid_position(self, x: int, y: int) -> bool:
-        """Check if the given position is valid.
+        self._map = self._input_source.grid()
+        self._guard_position = self._map.find(GUARD)
+        self._loaded_data = True
 
-        Args:
-            x: the x position.
-            y: the y position.
-
-        Returns:
-            True if we are on the map, False if we aren't.
-        """
-        return (
-            x >= 0 and y >= 0 and y < len(self._map) and x < len(self._map[y])
-        )
+    @timed()
+    def _get_all_visited_positions(self) -> set[int]:
+        """Get all positions that are visited."""
+        cells = self._map.cells
+        offsets = self._map.offsets
+        padding = self._map.padding
+        position = self._guard_position
+        direction = int(GuardDirection.NORTH)
+        visited_positions: set[int] = set()
+        while True:
+            new_position = position + offsets[direction]
+            cell = cells[new_position]
+            if cell == padding:
+                break
+            if cell in FREE:
+                position = new_position
+                visited_positions.add(position)
+            else:
+                direction = (direction + 1) % 4
 
-    def _one_step_forward(self) -> bool:
-        """Move the guard one step forward.
+        return visited_positions
 
-        Moves on step in the current direction.
+    def _prepare(self) -> frozenset[int]:
+        """Walk the route of the guard, for both parts.
 
         Returns:
-            True if the move was successful. False if the move wasn't due to
-            a obstruction.
+            All positions that are visited.
         """
-        new_x, new_y = self._guard_position
-        if self._guard_direction == GuardDirection.NORTH:
-            new_y -= 1
-        elif self._guard_direction == GuardDirection.SOUTH:
-            new_y += 1
-        elif self._guard_direction == GuardDirection.WEST:
-            new_x -= 1
-        elif self._guard_direction == GuardDirection.EAST:
-            new_x += 1
-
-        if self._is_valid_position(new_x, new_y):
-            character_on_new_position = self._map[new_y][new_x]
-            if character_on_new_position not in ('.', '^'):
-                return False
-            self._map[self._guard_position[1]][self._guard_position[0]] = '.'
-            self._map[new_y][new_x] = '^'
-
-        self._guard_position = (new_x, new_y)
-        return True
-
-    def _turn(self) -> None:
-        """Turn the direction of the guard."""
-        self._guard_direction = GuardDirection(
-            (int(self._guard_direction) + 1) % 4
-        )
-        pass
-
-    def _get_all_visited_positions(self) -> set[tuple[int, int]]:
-        """Get all positions that are visited."""
-        visited_positions: set[tuple[int, int]] = set()
-        while self._is_valid_position(*self._guard_position):
-            if self._one_step_forward() and self._is_valid_position(
-                *self._guard_position
-            ):
-                visited_positions.add(self._guard_position)
-            else:
-                self._turn()
-
-        return visited_positions
+        return frozenset(self._get_all_visited_positions())
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
-        return str(len(self._get_all_visited_positions()))
+        return str(len(self.prepare()))
 
-    def _is_loop(self) -> bool:
+    def _is_loop(self, obstruction: int) -> bool:
         """Check if there is a loop by walking around.
 
         If we get at the same position in the same direction again, we are in
         a loop.
 
+        Args:
+            obstruction: the position of the extra obstruction.
+
         Returns:
             True if we are in loop, False if we aren't.
         """
-        visited_positions: list[tuple[int, int, GuardDirection]] = []
+        cells = self._map.cells
+        offsets = self._map.offsets
+        padding = self._map.padding
+        position = self._guard_position
+        direction = int(GuardDirection.NORTH)
+        # Positions and directions as one number: position * 4 + direction
+        visited_states: set[int] = set()
         turns = 0
-        while self._is_valid_position(*self._guard_position):
-            if self._one_step_forward() and self._is_valid_position(
-                *self._guard_position
-            ):
+        while True:
+            new_position = position + offsets[direction]
+            cell = cells[new_position]
+            if cell == padding:
+                return False
+            if cell in FREE and new_position != obstruction:
+                position = new_position
                 turns = 0
-                new_pos = (
-                    self._guard_position[0],
-                    self._guard_position[1],
-                    self._guard_direction,
-                )
-                visited_positions.append(new_pos)
-                if visited_positions.count(new_pos) > 1:
+                state = position * 4 + direction
+                if state in visited_states:
                     return True
+                visited_states.add(state)
             else:
-                self._turn()
+                direction = (direction + 1) % 4
                 turns += 1
                 if turns == 4:
                     return True
 
-        return False
-
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
-        start_position = self._guard_position
-        start_direction = self._guard_direction
-        loops: set[tuple[int, int]] = set()
-
-        check_positions = self._get_all_visited_positions()
-        i = 0
-        for x, y in check_positions:
-            if self._map[y][x] in ('.', '^'):
-                self._guard_position = start_position
-                self._guard_direction = start_direction
-                self._map[y][x] = '#'
-                if self._is_loop():
-                    loops.add((x, y))
-                self._map[y][x] = '.'
-
-        return str(len(loops))
+        check_positions = self.prepare()
+        cells = self._map.cells
+
+        with self.timing('find_loops'):
+            loops = sum(
+                1
+                for position in check_positions
+                if cells[position] in FREE and self._is_loop(position)
+            )
+
+        return str(loops)
@@ -1,6 +1,6 @@
 """Solutions for Advent of Code 2024 - Day 7."""
 
-from aoc import DaySolution
+from aoc import DaySolution, InputSource
 
 
 class Day07(DaySolution):
@@ -14,9 +14,11 @@ class Day07(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    PARSED_ATTRIBUTES = ('_calibrations',)
+
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
         self._calibrations: list[tuple[int, list[int]]] = []
 
@@ -24,15 +26,14 @@ class Day07(DaySolution):
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            lines = file.readlines()
-            for line in lines:
-                splitted = line.split(':')
-                result = int(splitted[0].strip())
-                equations = [int(eq) for eq in splitted[1].strip().split(' ')]
-                self._calibrations.append((result, equations))
+        for row in self._input_source.integers():
+            self._calibrations.append((row[0], list(row[1:])))
 
+        self._store_parsed(self._input_source)
         self._loaded_data = True
 
     def _is_correct_calibration(
@@ -94,7 +95,7 @@ class Day07(DaySolution):
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
 
         # Loop through each calibration and find the correct operators
         correct = 0
@@ -108,7 +109,7 @@ class Day07(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
 
         # Loop through each calibration and find the correct operators
         correct = 0
@@ -1,6 +1,9 @@
 """Solutions for Advent of Code 2024 - Day 8."""
 
-from aoc import DaySolution
+from aoc import DaySolution, Grid, InputSource
+
+# The map is bytes, so the cells are character codes
+EMPTY = ord('.')
 
 
 class Day08(DaySolution):
@@ -14,36 +17,38 @@ class Day08(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    PARSED_ATTRIBUTES = ('_map', '_antenna_map', '_pairs')
+    PARSER_VERSION = 2
+
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
-        self._map: list[list[str]] = []
-        self._antenna_map: dict[str, list[tuple[int, int]]] = {}
+        self._map = Grid.from_lines([])
+        self._antenna_map: dict[int, list[tuple[int, int]]] = {}
         self._pairs: list[tuple[tuple[int, int], tuple[int, int]]] = []
 
     def _load_data(self) -> None:
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            rows = file.readlines()
-            self._map = [list(x.strip()) for x in rows]
+        self._map = self._input_source.grid()
 
         # Get all locations of the antennas
-        for y in range(0, len(self._map)):
-            for x in range(0, len(self._map[y])):
-                if self._map[y][x] != '.':
-                    if self._antenna_map.get(self._map[y][x]):
-                        self._antenna_map[self._map[y][x]].append((x, y))
-                    else:
-                        self._antenna_map[self._map[y][x]] = [(x, y)]
+        for y, row in enumerate(self._map.rows()):
+            for x, cell in enumerate(row):
+                if cell != EMPTY:
+                    self._antenna_map.setdefault(cell, []).append((x, y))
 
         # Loop through all combinations per antenna and find pairs
         for locations in self._antenna_map.values():
-            self._pairs = self._pairs + self._get_possible_pairs(locations)
+            self._pairs.extend(self._get_possible_pairs(locations))
 
+        self._store_parsed(self._input_source)
         self._loaded_data = True
 
     def _get_possible_pairs(
@@ -105,12 +110,7 @@ class Day08(DaySolution):
         # First, find all antinodes above the first antinode
         new_x = pair[0][0]
         new_y = pair[0][1]
-        while (
-            new_x >= 0
-            and new_y >= 0
-            and new_x < len(self._map[0])
-            and new_y < len(self._map)
-        ):
+        while self._map.in_bounds(new_x, new_y):
             new_y -= diff_y
 
             if pair[0][0] < pair[1][0]:
@@ -124,12 +124,7 @@ class Day08(DaySolution):
         # Then, find all antinodes belowd the second antinode
         new_x = pair[1][0]
         new_y = pair[1][1]
-        while (
-            new_x >= 0
-            and new_y >= 0
-            and new_x < len(self._map[0])
-            and new_y < len(self._map)
-        ):
+        while self._map.in_bounds(new_x, new_y):
             new_y = new_y + diff_y
 
             if pair[0][0] < pair[1][0]:
@@ -144,38 +139,28 @@ class Day08(DaySolution):
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
 
         # Find all antinodes for each pair
         antinodes: set[tuple[int, int]] = set()
         for pair in self._pairs:
             pair_antinodes = self._get_antinode_for_pair(pair)
             for pair_antinode in pair_antinodes:
-                if (
-                    pair_antinode[0] < len(self._map[0])
-                    and pair_antinode[1] < len(self._map)
-                    and pair_antinode[0] >= 0
-                    and pair_antinode[1] >= 0
-                ):
+                if self._map.in_bounds(*pair_antinode):
                     antinodes.add(pair_antinode)
 
         return str(len(antinodes))
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
 
         # Find all antinodes for each pair
         antinodes: set[tuple[int, int]] = set()
         for pair in self._pairs:
             pair_antinodes = self._get_all_antinodes_for_pair(pair)
             for pair_antinode in pair_antinodes:
-                if (
-                    pair_antinode[0] < len(self._map[0])
-                    and pair_antinode[1] < len(self._map)
-                    and pair_antinode[0] >= 0
-                    and pair_antinode[1] >= 0
-                ):
+                if self._map.in_bounds(*pair_antinode):
                     antinodes.add(pair_antinode)
 
         antinode_count = len(antinodes)
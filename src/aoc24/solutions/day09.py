@@ -1,7 +1,11 @@
 """Solutions for Advent of Code 2024 - Day 9."""
 
-from operator import index
-from aoc import DaySolution
+import heapq
+
+from aoc import DaySolution, InputSource, timed
+
+# The largest size of a file or free span; sizes are single digits
+MAX_SIZE = 9
 
 
 class Day09(DaySolution):
@@ -15,167 +19,165 @@ class Day09(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
         self._drive: str = ''
-        self._drive_list: list[int | None] = []
-        self._drive_list_files: list[tuple[None | int, int]] = []
 
     def _load_data(self) -> None:
         """Load data from the input file."""
         if self._loaded_data:
             return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            self._drive = file.read()
+        self._drive = self._input_source.read_text()
+        self._loaded_data = True
 
-    def _create_drive_list(self) -> None:
-        """Create a Python list with the drive index."""
+    @timed()
+    def _create_drive_list(self) -> list[int | None]:
+        """Create a Python list with the drive index.
+
+        Returns:
+            The file id of every block on the drive; None for empty blocks.
+        """
+        drive_list: list[int | None] = []
         id = 0
         for idx, size in enumerate(self._drive):
             size_int = int(size)
             if idx % 2 == 0:
-                self._drive_list.extend([id] * size_int)
+                drive_list.extend([id] * size_int)
                 id += 1
             else:
-                self._drive_list.extend([None] * size_int)
+                drive_list.extend([None] * size_int)
+        return drive_list
 
-    def _get_first_empty_index(self) -> int:
+    def _get_first_empty_index(
+        self, drive_list: list[int | None], start: int = 0
+    ) -> int:
         """Get the fist emtpy place on the drive.
 
+        Args:
+            drive_list: the blocks of the drive.
+            start: the index to search from; no block before it is empty.
+
         Returns:
-            The index of the first empty block.
+            The index of the first empty block, or the length of the drive
+            when no block is empty.
         """
-        return self._drive_list.index(None)
+        try:
+            return drive_list.index(None, start)
+        except ValueError:
+            return len(drive_list)
 
-    def _defgrament_list(self) -> None:
-        """Defragment the file list."""
-        for block in range(len(self._drive_list), 0, -1):
-            block_value = self._drive_list[block - 1]
+    @timed()
+    def _defgrament_list(self, drive_list: list[int | None]) -> None:
+        """Defragment the file list.
+
+        Args:
+            drive_list: the blocks of the drive; changed in place.
+        """
+        # Blocks are only moved into the first empty block, and the blocks
+        # they leave are further on, so the search goes on from there
+        first_empty = 0
+        for block in range(len(drive_list), 0, -1):
+            block_value = drive_list[block - 1]
 
             if block_value:
                 # Find the first empty index
-                first_empty = self._get_first_empty_index()
+                first_empty = self._get_first_empty_index(
+                    drive_list, first_empty
+                )
                 if first_empty >= block:
                     break
 
                 # Move the block
-                self._drive_list[first_empty] = block_value
-                self._drive_list[block - 1] = None
+                drive_list[first_empty] = block_value
+                drive_list[block - 1] = None
 
-    def _get_checksum(self) -> int:
+    @timed()
+    def _get_checksum(self, drive_list: list[int | None]) -> int:
         """Calculate the checksum for the drive.
 
+        Args:
+            drive_list: the blocks of the drive.
+
         Returns:
             The checksum as integer.
         """
         checksum = 0
-        for idx, value in enumerate(self._drive_list):
+        for idx, value in enumerate(drive_list):
             if value:
                 checksum += idx * value
         return checksum
 
-    def _create_file_list(self) -> None:
-        """Create a list with all files and sizes.
+    @timed()
+    def _create_spans(self) -> tuple[list[tuple[int, int]], list[list[int]]]:
+        """Create the lists with the files and the free spans of the drive.
 
-        This list can be used to defragment the drive based on files instead of
-        sectors.
+        Returns:
+            The position and size of every file, in file id order, and the
+            positions of the free spans per size, as min-heaps.
         """
-        id = 0
+        files: list[tuple[int, int]] = []
+        free_spans: list[list[int]] = [[] for _ in range(MAX_SIZE + 1)]
+        position = 0
         for idx, size in enumerate(self._drive):
             size_int = int(size)
             if idx % 2 == 0:
-                self._drive_list_files.append((id, size_int))
-                id += 1
-            else:
-                self._drive_list_files.append((None, size_int))
-
-    def _get_first_empty_index_of_size(
-        self, size: int, max_index: int
-    ) -> tuple[int | None, tuple[None | int, int] | None]:
-        """Get the fist emtpy place on the drive with a specific space.
+                files.append((position, size_int))
+            elif size_int > 0:
+                # In increasing order, so the list is already a heap
+                free_spans[size_int].append(position)
+            position += size_int
+        return files, free_spans
+
+    def _get_first_free_span(
+        self, free_spans: list[list[int]], size: int, before: int
+    ) -> int | None:
+        """Get the size of the first free span that can hold a file.
 
         Args:
-            size: the size to search for.
-            max_index: the maximum index to search
+            free_spans: the positions of the free spans per size.
+            size: the size of the file.
+            before: the position of the file; the span must be before it.
 
         Returns:
-            The index of the first empty block with at least the correct amount
-            of space.
+            The size of the free span with the lowest position, or None when
+            no span before the file is large enough.
         """
-        for idx, fd in enumerate(self._drive_list_files):
-            if idx >= max_index:
-                break
-
-            if fd[0] is None and fd[1] >= size:
-                return (idx, fd)
-        return (None, None)
-
-    def _get_checksum_file_list(self) -> int:
-        """Calculate the checksum for the drive.
-
-        Returns:
-            The checksum as integer.
-        """
-        # Recreate the '_drive_list' array
-        self._drive_list = []
-        for idx, item in enumerate(self._drive_list_files):
-            size_int = item[1]
-            if item[0] is not None:
-                self._drive_list.extend([item[0]] * size_int)
-            else:
-                self._drive_list.extend([None] * size_int)
-
-        return self._get_checksum()
+        first_size = None
+        first_position = before
+        for span_size in range(max(size, 1), MAX_SIZE + 1):
+            spans = free_spans[span_size]
+            if spans and spans[0] < first_position:
+                first_size = span_size
+                first_position = spans[0]
+        return first_size
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
-        self._create_drive_list()
-        self._defgrament_list()
-        return str(self._get_checksum())
+        self.load_data()
+        drive_list = self._create_drive_list()
+        self._defgrament_list(drive_list)
+        return str(self._get_checksum(drive_list))
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
-        self._create_file_list()
-
-        indexes_done: list[int] = []
-
-        for file in range(len(self._drive_list_files), 0, -1):
-            current_block = self._drive_list_files[file - 1]
-            if current_block[0]:
-                if current_block[0] in indexes_done:
-                    continue
-                indexes_done.append(current_block[0])
-                block_to_fill = self._get_first_empty_index_of_size(
-                    current_block[1], file
-                )
-                if block_to_fill[0] and block_to_fill[1]:
-                    index_to_empty = file - 1
-                    # Check if we need to resize the current empty block
-                    if block_to_fill[1][1] > current_block[1]:
-                        self._drive_list_files[block_to_fill[0]] = (
-                            None,
-                            block_to_fill[1][1] - current_block[1],
-                        )
-                        self._drive_list_files.insert(
-                            block_to_fill[0],
-                            (current_block[0], current_block[1]),
-                        )
-                        index_to_empty = file
-                    else:
-                        # We can move it directly
-                        self._drive_list_files[block_to_fill[0]] = (
-                            current_block[0],
-                            current_block[1],
-                        )
-
-                    self._drive_list_files[index_to_empty] = (
-                        None,
-                        current_block[1],
+        self.load_data()
+        files, free_spans = self._create_spans()
+
+        # Every file is moved once, from the highest file id down, to the
+        # first free span before it that is large enough
+        checksum = 0
+        for file_id in range(len(files) - 1, -1, -1):
+            position, size = files[file_id]
+            span_size = self._get_first_free_span(free_spans, size, position)
+            if span_size is not None:
+                position = heapq.heappop(free_spans[span_size])
+                if span_size > size:
+                    heapq.heappush(
+                        free_spans[span_size - size], position + size
                     )
+            checksum += file_id * (size * position + size * (size - 1) // 2)
 
-        return str(self._get_checksum_file_list())
+        return str(checksum)
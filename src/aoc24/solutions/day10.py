@@ -2,9 +2,15 @@
 
 from dataclasses import dataclass, field
 
-from aoc import DaySolution
+from aoc import DaySolution, Grid, InputSource
+from aoc.search import Visited, count_paths, dfs
 
-MapLocation = tuple[int, int]
+# A location is a flat index in the cells of the map
+MapLocation = int
+
+# The map is bytes, so the elevations are character codes of digits
+TRAILHEAD = ord('0')
+SUMMIT = ord('9')
 
 
 @dataclass
@@ -12,12 +18,11 @@ class TrailStart:
     """Structure for a trail."""
 
     trailhead: MapLocation
-    possible_trails: int = 0
     all_endpoints: set[MapLocation] = field(default_factory=set)
     rating: int = 0
 
 
-class Day10(DaySolution):
+class Day10(DaySolution[list[TrailStart]]):
     """Solution for Day 10.
 
     Link: https://adventofcode.com/2024/day/10
@@ -28,94 +33,116 @@ class Day10(DaySolution):
         argument of the constructor for the object.
     """
 
-    def __init__(self, input_file: str) -> None:
+    def __init__(self, input_file: InputSource | str) -> None:
         """Set internal values."""
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
         self._loaded_data = False
-        self._map: list[list[int]] = []
-        self._trailstarts: list[TrailStart] = []
+        self._map = Grid.from_lines([])
 
     def _load_data(self) -> None:
         """Load data from the input file."""
         if self._loaded_data:
             return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            self._map = [
-                [int(elevation) for elevation in list(map_line.strip())]
-                for map_line in file.readlines()
-            ]
-
-    def _find_all_trail_starts(self) -> None:
-        """Create all TrailStart objects."""
-        self._trailstarts = []
-        for y in range(0, len(self._map)):
-            for x in range(0, len(self._map[y])):
-                if self._map[y][x] == 0:
-                    self._trailstarts.append(TrailStart(trailhead=(x, y)))
-
-    def _find_next_step_in_path(
-        self, current_location: MapLocation, trail_start: TrailStart
-    ) -> None:
-        """Find the next step in a specific trail.
+        self._map = self._input_source.grid()
+        self._loaded_data = True
 
-        Args:
-            current_location: the current location for the trail.
-            trail_start: the TrailStart object to update.
+    def _find_all_trail_starts(self) -> list[TrailStart]:
+        """Create all TrailStart objects.
+
+        Returns:
+            A new TrailStart object for every trailhead.
         """
-        current_elevation = self._map[current_location[1]][current_location[0]]
-        if current_elevation == 9:
-            trail_start.possible_trails += 1
-            trail_start.all_endpoints.add(current_location)
-            trail_start.rating += 1
-            return
+        return [
+            TrailStart(trailhead=location)
+            for location in self._map.find_all(TRAILHEAD)
+        ]
 
-        # Find the next step
-        next_elevation = current_elevation + 1
-        locations_to_check = [
-            (current_location[0] - 1, current_location[1]),
-            (current_location[0] + 1, current_location[1]),
-            (current_location[0], current_location[1] - 1),
-            (current_location[0], current_location[1] + 1),
+    def _next_steps(self, location: MapLocation) -> list[MapLocation]:
+        """Find the next steps of a trail.
+
+        Args:
+            location: the current location of the trail.
+
+        Returns:
+            The neighbouring locations that are one higher. The border around
+            the map is never the next elevation, so no bounds checks are
+            needed.
+        """
+        cells = self._map.cells
+        next_elevation = cells[location] + 1
+        return [
+            location + offset
+            for offset in self._map.offsets
+            if cells[location + offset] == next_elevation
         ]
-        for location_to_check in locations_to_check:
-            if (
-                location_to_check[0] >= 0
-                and location_to_check[0] < len(self._map[0])
-                and location_to_check[1] >= 0
-                and location_to_check[1] < len(self._map)
-            ):
-                elevation = self._map[location_to_check[1]][
-                    location_to_check[0]
-                ]
-                if elevation == next_elevation:
-                    self._find_next_step_in_path(
-                        location_to_check, trail_start
-                    )
-
-    def _find_all_trails(self) -> None:
-        """Fill in all trails in the TrailStart objects."""
-        for trailstart in self._trailstarts:
-            self._find_next_step_in_path(trailstart.trailhead, trailstart)
+
+    def _is_summit(self, location: MapLocation) -> bool:
+        """Check if a location is the end of a trail.
+
+        Args:
+            location: the location.
+
+        Returns:
+            True when the location has elevation 9.
+        """
+        return self._map.cells[location] == SUMMIT
+
+    def _find_all_trails(self, trailstarts: list[TrailStart]) -> None:
+        """Fill in all trails in the TrailStart objects.
+
+        The endpoints are the summits that a depth first search from the
+        trailhead reaches. The rating is the number of trails, which is the
+        number of paths to a summit; trails only go up, so the paths can be
+        counted once per location and shared between trails.
+
+        Args:
+            trailstarts: the TrailStart objects to update.
+        """
+        cells = self._map.cells
+        visited = Visited.for_grid(self._map)
+        for trailstart in trailstarts:
+            trailstart.all_endpoints = {
+                location
+                for location in dfs(
+                    [trailstart.trailhead], self._next_steps, visited
+                )
+                if cells[location] == SUMMIT
+            }
+            visited.clear()
+
+        ratings = count_paths(
+            [trailstart.trailhead for trailstart in trailstarts],
+            self._next_steps,
+            self._is_summit,
+        )
+        for trailstart, rating in zip(trailstarts, ratings, strict=True):
+            trailstart.rating = rating
+
+    def _prepare(self) -> list[TrailStart]:
+        """Find all trails, for both parts.
+
+        Returns:
+            The TrailStart objects with their trails filled in.
+        """
+        trailstarts = self._find_all_trail_starts()
+        self._find_all_trails(trailstarts)
+        return trailstarts
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
-        self._find_all_trail_starts()
-        self._find_all_trails()
+        trailstarts = self.prepare()
 
         # Find the sum of all endpoints for all trailstarts
-        count = sum([len(t.all_endpoints) for t in self._trailstarts])
+        count = sum([len(t.all_endpoints) for t in trailstarts])
 
         return str(count)
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
-        self._find_all_trail_starts()
-        self._find_all_trails()
+        trailstarts = self.prepare()
 
         # Find the sum of all endpoints for all trailstarts
-        count = sum([t.rating for t in self._trailstarts])
+        count = sum([t.rating for t in trailstarts])
 
         return str(count)
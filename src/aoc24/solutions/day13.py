@@ -1,14 +1,17 @@
 """Solutions for Advent of Code 2024 - Day 13."""
 
-import re
 from dataclasses import dataclass, field
+from math import gcd
 
-from aoc import DaySolution
+from aoc import DaySolution, InputSource, select_backend
 
 Movement = tuple[int, int]
 Position = list[int, int]
 Presses = tuple[int, int]
 
+# The distance that is added to the prizes in part two
+PRIZE_OFFSET = 10_000_000_000_000
+
 
 @dataclass
 class ClawMachine:
@@ -72,11 +75,24 @@ class Day13(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    With the `numpy` backend, the equations of all machines are solved at
+    once with NumPy.
     """
 
-    def __init__(self, input_file: str) -> None:
-        """Set internal values."""
-        self._input_file = input_file
+    PARSED_ATTRIBUTES = ('_claw_machines',)
+
+    def __init__(
+        self, input_file: InputSource | str, backend: str = 'python'
+    ) -> None:
+        """Set internal values.
+
+        Args:
+            input_file: the file with the input data, or an input source.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
+        """
+        self._input_source = InputSource.of(input_file)
+        self._backend = select_backend(backend)
         self._loaded_data = False
         self._claw_machines: list[ClawMachine] = []
 
@@ -84,25 +100,91 @@ class Day13(DaySolution):
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            all_matches = re.findall(
-                r'(^Button A: X\+(\d+), Y\+(\d+)$\n)(Button B: X\+(\d+), Y\+(\d+)$\n)(Prize: X\=(\d+), Y\=(\d+))',
-                file.read(),
-                re.MULTILINE,
-            )
-        for match in all_matches:
+        # Every machine is a section with the buttons A and B and the prize
+        for (
+            button_a,
+            button_b,
+            prize,
+        ) in self._input_source.integers(self._backend).sections():
             self._claw_machines.append(
                 ClawMachine(
-                    button_a=(int(match[1]), int(match[2])),
-                    button_b=(int(match[4]), int(match[5])),
-                    prize_position=[int(match[7]), int(match[8])],
+                    button_a=(button_a[0], button_a[1]),
+                    button_b=(button_b[0], button_b[1]),
+                    prize_position=[prize[0], prize[1]],
                 )
             )
+        self._store_parsed(self._input_source)
+        self._loaded_data = True
+
+    def _get_minimum_price_on_line(self, machine: ClawMachine) -> int:
+        """Get the minimum price when both buttons move in one direction.
+
+        The presses are then not fixed by the two equations: every press of
+        A can be swapped for presses of B that move the same distance. The
+        price changes by the same amount for every swap, so the cheapest is
+        the fewest presses of A, or the fewest presses of B.
+
+        The distances are taken along the x axis, or along the y axis when
+        the buttons only move up and down. A button that does not move at
+        all is never pressed.
+
+        Args:
+            machine: the machine object.
+
+        Returns:
+            0 if the game is unwinnable or a integer with the minimum price
+            to win the game.
+        """
+        (a_x, a_y), (b_x, b_y) = machine.button_a, machine.button_b
+        prize_x, prize_y = machine.prize_position
+        # The prize must be on the line of the buttons
+        if a_x * prize_y != a_y * prize_x or b_x * prize_y != b_y * prize_x:
+            return 0
+        if a_x or b_x:
+            move_a, move_b, distance = a_x, b_x, prize_x
+        else:
+            move_a, move_b, distance = a_y, b_y, prize_y
+
+        if not move_a or not move_b:
+            move, price = (move_a, 3) if move_a else (move_b, 1)
+            if not move:
+                return 0
+            presses, left = divmod(distance, move)
+            return 0 if left or presses < 0 else presses * price
+
+        divisor = gcd(move_a, move_b)
+        if distance % divisor:
+            return 0
+
+        # The fewest presses of A that leave a distance B can move
+        step_a, step_b = move_b // divisor, move_a // divisor
+        fewest_a = distance // divisor * pow(step_b, -1, step_a) % step_a
+        if fewest_a * move_a > distance:
+            return 0
+        most_b = (distance - fewest_a * move_a) // move_b
+
+        # The most presses of A that still leave a distance for B
+        swaps = most_b // step_b
+        most_a, fewest_b = fewest_a + swaps * step_a, most_b - swaps * step_b
+        return min(fewest_a * 3 + most_b, most_a * 3 + fewest_b)
 
     def get_minimum_price(self, machine: ClawMachine) -> int:
         """Get the minimum price to win a claw machine.
 
+        The presses `a` and `b` of the buttons must solve two equations, one
+        for every axis:
+
+            a * a_x + b * b_x = prize_x
+            a * a_y + b * b_y = prize_y
+
+        When the buttons move in different directions there is one solution,
+        found with Cramer's rule. The game can be won when that solution is
+        a whole, positive number of presses.
+
         Args:
             machine: the machine object.
 
@@ -110,29 +192,83 @@ class Day13(DaySolution):
             0 if the game is unwinnable or a integer with the minimum price
             to win the game.
         """
-        target = (
-            machine.prize_position[1] * machine.prize_position[0]
-        ) + machine.prize_position[0]
-        a_button = (
-            machine.button_a[1] * machine.prize_position[0]
-        ) + machine.button_a[0]
-        b_button = (
-            machine.button_b[1] * machine.prize_position[0]
-        ) + machine.button_b[0]
-
-        max_b = target // b_button
-        a_click = 0
-        for b_click in range(max_b, 0, -1):
-            a_click = (target - (b_click * b_button)) // a_button
-            left = target - (b_click * b_button) - (a_click * a_button)
-            if left == 0:
-                return b_click + (a_click * 3)
-
-        return 0
+        (a_x, a_y), (b_x, b_y) = machine.button_a, machine.button_b
+        prize_x, prize_y = machine.prize_position
+        determinant = a_x * b_y - a_y * b_x
+        if determinant == 0:
+            return self._get_minimum_price_on_line(machine)
+
+        a_presses, a_left = divmod(prize_x * b_y - prize_y * b_x, determinant)
+        b_presses, b_left = divmod(a_x * prize_y - a_y * prize_x, determinant)
+        if a_left or b_left or a_presses < 0 or b_presses < 0:
+            return 0
+        return a_presses * 3 + b_presses
+
+    def _get_total_price_numpy(self, prize_offset: int) -> int:
+        """Get the total minimum price of all machines with NumPy.
+
+        Like `get_minimum_price`, with Cramer's rule for all machines at
+        once. The few machines with buttons in one direction are solved one
+        by one.
+
+        Args:
+            prize_offset: the distance to add to the prize on both axes.
+
+        Returns:
+            The sum of the minimum prices to win every winnable machine.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        if not self._claw_machines:
+            return 0
+        a_x, a_y, b_x, b_y, prize_x, prize_y = np.array(
+            [
+                (
+                    *machine.button_a,
+                    *machine.button_b,
+                    *machine.prize_position,
+                )
+                for machine in self._claw_machines
+            ],
+            dtype=np.int64,
+        ).T
+        prize_x = prize_x + prize_offset
+        prize_y = prize_y + prize_offset
+
+        determinant = a_x * b_y - a_y * b_x
+        on_line = determinant == 0
+        # Divide by 1 instead of 0; those machines are solved separately
+        divisor = np.where(on_line, 1, determinant)
+        a_presses, a_left = np.divmod(prize_x * b_y - prize_y * b_x, divisor)
+        b_presses, b_left = np.divmod(a_x * prize_y - a_y * prize_x, divisor)
+        winnable = (
+            ~on_line
+            & (a_left == 0)
+            & (b_left == 0)
+            & (a_presses >= 0)
+            & (b_presses >= 0)
+        )
+        total = int((a_presses * 3 + b_presses)[winnable].sum())
+
+        for index in np.flatnonzero(on_line):
+            machine = self._claw_machines[index]
+            total += self._get_minimum_price_on_line(
+                ClawMachine(
+                    button_a=machine.button_a,
+                    button_b=machine.button_b,
+                    prize_position=[
+                        machine.prize_position[0] + prize_offset,
+                        machine.prize_position[1] + prize_offset,
+                    ],
+                )
+            )
+        return total
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._get_total_price_numpy(0))
 
         minimum_prices = [
             self.get_minimum_price(machine) for machine in self._claw_machines
@@ -142,15 +278,25 @@ class Day13(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
-
-        # Upgrade prize positions
-        for machine in self._claw_machines:
-            machine.prize_position[0] += 10_000_000_000_000
-            machine.prize_position[1] += 10_000_000_000_000
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._get_total_price_numpy(PRIZE_OFFSET))
+
+        # Upgrade prize positions, on copies of the machines
+        upgraded_machines = [
+            ClawMachine(
+                button_a=machine.button_a,
+                button_b=machine.button_b,
+                prize_position=[
+                    machine.prize_position[0] + PRIZE_OFFSET,
+                    machine.prize_position[1] + PRIZE_OFFSET,
+                ],
+            )
+            for machine in self._claw_machines
+        ]
 
         minimum_prices = [
-            self.get_minimum_price(machine) for machine in self._claw_machines
+            self.get_minimum_price(machine) for machine in upgraded_machines
         ]
 
         return str(sum(minimum_prices))
@@ -1,32 +1,37 @@
 """Solutions for Advent of Code 2024 - Day 14."""
 
-import re
-from aoc import DaySolution
 from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter
+
+from aoc import DaySolution, InputSource, select_backend
 
 Movement = tuple[int, int]
-Position = list[int, int]
+Position = tuple[int, int]
 Size = tuple[int, int]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Robot:
     """Model for a dataclass."""
 
     position: Position
     velocity: Movement
 
-    def move(self, count: int, map_size: Size) -> None:
-        """Move the robot.
+    def position_after(self, count: int, map_size: Size) -> Position:
+        """Get the position of the robot after moving.
 
         Args:
             count: how many times (seconds) to move the robot.
             map_size: the size of the map.
+
+        Returns:
+            The new position; the robot itself is not changed.
         """
-        for index in (0, 1):
-            self.position[index] = (
-                self.position[index] + (self.velocity[index] * count)
-            ) % map_size[index]
+        return (
+            (self.position[0] + (self.velocity[0] * count)) % map_size[0],
+            (self.position[1] + (self.velocity[1] * count)) % map_size[1],
+        )
 
 
 class Day14(DaySolution):
@@ -38,16 +43,28 @@ class Day14(DaySolution):
     -   A `input` file from the Advent of Code website. This can be found at
         the link above. Give the location of this file in the `input_file`
         argument of the constructor for the object.
+
+    With the `numpy` backend, all robots are moved at once with NumPy.
     """
 
-    def __init__(self, input_file: str, map_size: Size) -> None:
+    PARSER_VERSION = 2
+    PARSED_ATTRIBUTES = ('_robots',)
+
+    def __init__(
+        self,
+        input_file: InputSource | str,
+        map_size: Size,
+        backend: str = 'python',
+    ) -> None:
         """Set internal values.
 
         Args:
-            input_file: the file with the input data.
+            input_file: the file with the input data, or an input source.
             map_size: the size of the map.
+            backend: `python`, or `numpy` to use NumPy when it is installed.
         """
-        self._input_file = input_file
+        self._input_source = InputSource.of(input_file)
+        self._backend = select_backend(backend)
         self._loaded_data = False
         self._robots: list[Robot] = []
         self._map_size = map_size
@@ -56,25 +73,19 @@ class Day14(DaySolution):
         """Load data from the input file."""
         if self._loaded_data:
             return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
 
-        with open(self._input_file, encoding='utf-8') as file:
-            robots = file.readlines()
-        for robot in robots:
-            details = list(
-                map(
-                    int,
-                    re.findall(r'p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)', robot)[
-                        0
-                    ],
-                )
-            )
+        for details in self._input_source.integers(self._backend):
             self._robots.append(
                 Robot(
-                    position=[details[0], details[1]],
+                    position=(details[0], details[1]),
                     velocity=(details[2], details[3]),
                 )
             )
-            pass
+        self._store_parsed(self._input_source)
+        self._loaded_data = True
 
     def _get_quadrant_for_position(self, position: Position) -> int:
         """Retrieve a quadrant for a specific position.
@@ -103,27 +114,65 @@ class Day14(DaySolution):
 
         return (qy * 2) + qx
 
-    def _move_all_robots(self, count: int) -> None:
-        """Move all robots.
+    def _positions_after(self, count: int) -> list[Position]:
+        """Get the positions of all robots after moving.
+
+        Args:
+            count: how many times (seconds) to move the robots.
+
+        Returns:
+            The new position of every robot.
+        """
+        return [
+            robot.position_after(count, self._map_size)
+            for robot in self._robots
+        ]
+
+    def _safety_factor_numpy(self, count: int) -> int:
+        """Get the safety factor after moving, with NumPy.
 
         Args:
             count: how many times (seconds) to move the robots.
+
+        Returns:
+            The product of the number of robots in every quadrant.
         """
-        for robot in self._robots:
-            robot.move(count, self._map_size)
+        import numpy as np  # noqa: PLC0415
+
+        if not self._robots:
+            return 0
+        # The robots are converted without creating a tuple per robot
+        robot_count = len(self._robots)
+        start, velocity = (
+            np.fromiter(
+                chain.from_iterable(map(attrgetter(name), self._robots)),
+                dtype=np.int64,
+                count=2 * robot_count,
+            ).reshape(robot_count, 2)
+            for name in ('position', 'velocity')
+        )
+        size = np.array(self._map_size, dtype=np.int64)
+        positions = (start + velocity * count) % size
+
+        middle = size // 2
+        in_quadrant = (positions != middle).all(axis=1)
+        quadrants = (positions[in_quadrant] > middle) @ np.array([1, 2])
+        return int(np.bincount(quadrants, minlength=4).prod())
 
     def solve_puzzle_one(self) -> str:
         """Solve puzzle one."""
-        self._load_data()
+        self.load_data()
+        if self._backend == 'numpy':
+            return str(self._safety_factor_numpy(100))
 
         # Move the robots
-        self._move_all_robots(100)
+        positions = self._positions_after(100)
 
         # Get the count of robots per quadrant
         quadrant_robot_count: list[int] = [0, 0, 0, 0, 0]
-        for robot in self._robots:
+        for position in positions:
             quadrant_robot_count[
-                self._get_quadrant_for_position(robot.position)
+                self._get_quadrant_for_position(position)
             ] += 1
 
         return str(
@@ -135,5 +184,5 @@ class Day14(DaySolution):
 
     def solve_puzzle_two(self) -> str:
         """Solve puzzle two."""
-        self._load_data()
+        self.load_data()
         return ''
@@ -0,0 +1,115 @@
+"""Tests for the answer cache and the fingerprints of solutions."""
+
+import itertools
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc import AnswerCache, SolutionEntry
+from aoc.solution_entry import _hash_files, _package_files
+
+
+class TestAnswerCache(unittest.TestCase):
+    """Tests for `AnswerCache`."""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cache', 'answers.sqlite3')
+
+    def _cache(self, max_entries: int = 1000) -> AnswerCache:
+        """Open the cache.
+
+        Args:
+            max_entries: the maximum number of answers to keep.
+
+        Returns:
+            The cache, which is closed after the test.
+        """
+        cache = AnswerCache(self.path, max_entries)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_round_trip(self) -> None:
+        """A stored answer is found again, also after reopening."""
+        with AnswerCache(self.path) as cache:
+            cache.put(1, 2, 'input', 'solution', '31')
+            self.assertEqual(cache.get(1, 2, 'input', 'solution'), '31')
+        self.assertEqual(self._cache().get(1, 2, 'input', 'solution'), '31')
+
+    def test_invalidation(self) -> None:
+        """Another input, solution, day or part gives no answer."""
+        cache = self._cache()
+        cache.put(1, 2, 'input', 'solution', '31')
+        self.assertIsNone(cache.get(1, 2, 'other input', 'solution'))
+        self.assertIsNone(cache.get(1, 2, 'input', 'other solution'))
+        self.assertIsNone(cache.get(1, 1, 'input', 'solution'))
+        self.assertIsNone(cache.get(2, 2, 'input', 'solution'))
+
+    def test_eviction(self) -> None:
+        """The answers that were used the longest time ago are removed."""
+        cache = self._cache(max_entries=2)
+        with mock.patch('aoc.answer_cache.time') as clock:
+            clock.time.side_effect = itertools.count()
+            cache.put(1, 1, 'a', 'solution', 'A')
+            cache.put(1, 1, 'b', 'solution', 'B')
+            cache.get(1, 1, 'a', 'solution')
+            cache.put(1, 1, 'c', 'solution', 'C')
+        self.assertEqual(cache.get(1, 1, 'a', 'solution'), 'A')
+        self.assertIsNone(cache.get(1, 1, 'b', 'solution'))
+        self.assertEqual(cache.get(1, 1, 'c', 'solution'), 'C')
+
+    def test_clear(self) -> None:
+        """Clearing removes all answers."""
+        cache = self._cache()
+        cache.put(1, 1, 'input', 'solution', '11')
+        cache.clear()
+        self.assertIsNone(cache.get(1, 1, 'input', 'solution'))
+
+
+class TestFingerprint(unittest.TestCase):
+    """Tests for `SolutionEntry.fingerprint`."""
+
+    def test_arguments(self) -> None:
+        """The fingerprint is stable, and changes with the arguments."""
+        entry = SolutionEntry('aoc24.solutions.day14:Day14', 'input.txt')
+        fingerprint = entry.fingerprint()
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(
+            SolutionEntry(
+                'aoc24.solutions.day14:Day14', 'input.txt'
+            ).fingerprint(),
+            fingerprint,
+        )
+        self.assertNotEqual(
+            SolutionEntry(
+                'aoc24.solutions.day14:Day14',
+                'input.txt',
+                {'map_size': (11, 7)},
+            ).fingerprint(),
+            fingerprint,
+        )
+
+    def test_package_files(self) -> None:
+        """The hash of a package changes when one of its files changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            module = Path(directory) / 'grid.py'
+            module.write_text('CELL = 1\n')
+            (Path(directory) / 'notes.txt').write_text('not hashed\n')
+            digest = _hash_files(directory, _package_files(directory))
+
+            module.write_text('CELL = 22\n')
+            changed = _hash_files(directory, _package_files(directory))
+            self.assertNotEqual(changed, digest)
+
+            (Path(directory) / 'search.py').write_text('')
+            self.assertNotEqual(
+                _hash_files(directory, _package_files(directory)), changed
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for the benchmark reports."""
+
+import math
+import unittest
+
+from aoc.benchmark import (
+    BenchmarkReport,
+    DayBenchmark,
+    TimingStatistics,
+    compare_reports,
+    fit_power_law,
+)
+
+
+def _report(days: dict[int, dict[str, float]]) -> BenchmarkReport:
+    """Create a report with one sample per phase.
+
+    Args:
+        days: the time of every phase, per day.
+
+    Returns:
+        The report.
+    """
+    return BenchmarkReport(
+        warmup=0,
+        repeat=1,
+        days=[
+            DayBenchmark(
+                day,
+                {
+                    phase: TimingStatistics((time,))
+                    for phase, time in phases.items()
+                },
+            )
+            for day, phases in days.items()
+        ],
+    )
+
+
+class TestCompareReports(unittest.TestCase):
+    """Tests for `compare_reports`."""
+
+    def test_regression(self) -> None:
+        """A phase that got slower than the threshold is a regression."""
+        baseline = _report({1: {'load': 1.0, 'part1': 1.0}})
+        current = _report({1: {'load': 1.05, 'part1': 1.5}})
+        comparisons = compare_reports(current, baseline)
+        self.assertEqual(
+            [comparison.phase for comparison in comparisons],
+            ['load', 'part1'],
+        )
+        self.assertEqual(
+            [comparison.is_regression(0.1) for comparison in comparisons],
+            [False, True],
+        )
+        self.assertAlmostEqual(comparisons[1].change, 0.5)
+
+    def test_missing_phase(self) -> None:
+        """A phase that is not in the baseline is missing."""
+        baseline = _report({1: {'load': 1.0}})
+        current = _report({1: {'load': 1.0, 'part1': 1.0}})
+        comparisons = compare_reports(current, baseline)
+        self.assertEqual(
+            [comparison.missing for comparison in comparisons],
+            [False, True],
+        )
+        self.assertFalse(comparisons[1].is_regression(0.1))
+
+    def test_baseline_of_other_days(self) -> None:
+        """A baseline that matches no day gives only missing phases."""
+        baseline = _report({2: {'load': 1.0}})
+        current = _report({1: {'load': 1.0, 'part1': 1.0}})
+        comparisons = compare_reports(current, baseline)
+        self.assertEqual(len(comparisons), 2)
+        self.assertTrue(all(comparison.missing for comparison in comparisons))
+
+    def test_round_trip(self) -> None:
+        """A report gives the same comparisons after converting to JSON."""
+        report = _report({1: {'load': 1.0}, 3: {'part2': 2.0}})
+        loaded = BenchmarkReport.from_dict(report.to_dict())
+        comparisons = compare_reports(report, loaded)
+        self.assertEqual(
+            [comparison.change for comparison in comparisons], [0.0, 0.0]
+        )
+
+
+class TestFitPowerLaw(unittest.TestCase):
+    """Tests for `fit_power_law`."""
+
+    def test_quadratic(self) -> None:
+        """Values that grow with the square of the size give exponent 2."""
+        sizes = [1.0, 2.0, 4.0, 8.0]
+        exponent, coefficient = fit_power_law(
+            sizes, [3 * size**2 for size in sizes]
+        )
+        self.assertAlmostEqual(exponent, 2.0)
+        self.assertAlmostEqual(coefficient, 3.0)
+
+    def test_zero_values_are_left_out(self) -> None:
+        """Values of zero do not have a logarithm and are left out."""
+        exponent, _ = fit_power_law([1.0, 2.0, 4.0], [0.0, 2.0, 4.0])
+        self.assertAlmostEqual(exponent, 1.0)
+
+    def test_too_few_points(self) -> None:
+        """One usable size gives no fit."""
+        exponent, coefficient = fit_power_law([2.0, 2.0], [1.0, 3.0])
+        self.assertTrue(math.isnan(exponent))
+        self.assertTrue(math.isnan(coefficient))
+
+
+if __name__ == '__main__':
+    unittest.main()
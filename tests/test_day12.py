@@ -0,0 +1,97 @@
+"""Tests for the solution of Day 12."""
+
+import dataclasses
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from aoc24.solutions.day12 import Day12
+
+EXAMPLE = """\
+RRRRIICCFF
+RRRRIICCCF
+VVRRRCCFFF
+VVRCCCJFFF
+VVVVCJJCFE
+VVIVCCJJEE
+VVIIICJJEE
+MIIIIIJJEE
+MIIISIJEEE
+MMMISSJEEE
+"""
+
+
+def _solve_at_once(solution: Day12) -> tuple[str, str]:
+    """Solve both parts of a solution in two threads at the same time.
+
+    Args:
+        solution: the solution to solve.
+
+    Returns:
+        The answers of part one and part two.
+    """
+    barrier = threading.Barrier(2)
+
+    def solve(part: int) -> str:
+        barrier.wait()
+        if part == 1:
+            return solution.solve_puzzle_one()
+        return solution.solve_puzzle_two()
+
+    with ThreadPoolExecutor(2) as executor:
+        one = executor.submit(solve, 1)
+        two = executor.submit(solve, 2)
+        return one.result(), two.result()
+
+
+class TestDay12(unittest.TestCase):
+    """Tests for `Day12`."""
+
+    def setUp(self) -> None:
+        """Write the example input to a temporary file."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input_file = Path(directory.name) / 'day12-input.txt'
+        self.input_file.write_text(EXAMPLE)
+
+    def test_example(self) -> None:
+        """Solve both parts of the example."""
+        solution = Day12(str(self.input_file))
+        self.assertEqual(solution.solve_puzzle_one(), '1930')
+        self.assertEqual(solution.solve_puzzle_two(), '1206')
+
+    def test_regions_are_read_only(self) -> None:
+        """The prepared regions cannot be changed by the parts."""
+        solution = Day12(str(self.input_file))
+        region = solution.prepare()[0]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            region.fences = ()  # type: ignore[misc]
+        with self.assertRaises(TypeError):
+            region.fences[0] = (1, frozenset())  # type: ignore[index]
+        with self.assertRaises(AttributeError):
+            region.fences.clear()  # type: ignore[attr-defined]
+        with self.assertRaises(AttributeError):
+            region.fences[0][1].add(0)  # type: ignore[attr-defined]
+        with self.assertRaises(AttributeError):
+            region.plots.add(0)  # type: ignore[attr-defined]
+
+    def test_parts_at_the_same_time(self) -> None:
+        """Solve both parts at the same time on one instance.
+
+        This is what `--executor threads` does. A short switch interval
+        makes the threads switch often, even on builds with the GIL.
+        """
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        for _ in range(20):
+            solution = Day12(str(self.input_file))
+            self.assertEqual(_solve_at_once(solution), ('1930', '1206'))
+
+
+if __name__ == '__main__':
+    unittest.main()
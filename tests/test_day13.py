@@ -0,0 +1,58 @@
+"""Tests for the solution of Day 13."""
+
+import itertools
+import unittest
+
+from aoc import InputSource
+from aoc24.solutions.day13 import ClawMachine, Day13
+
+# Machines with buttons that move in the same direction, or not at all
+PARALLEL_BUTTONS = [
+    ((2, 4), (3, 6)),
+    ((4, 2), (2, 1)),
+    ((0, 3), (0, 2)),
+    ((0, 2), (0, 5)),
+    ((0, 0), (0, 2)),
+    ((3, 0), (0, 0)),
+    ((0, 0), (0, 0)),
+    ((5, 0), (2, 0)),
+]
+
+
+def _cheapest(machine: ClawMachine, limit: int) -> int:
+    """Find the cheapest way to win a machine by trying all presses.
+
+    Args:
+        machine: the machine.
+        limit: the most presses of one button to try.
+
+    Returns:
+        The minimum price, or 0 when the machine cannot be won.
+    """
+    (a_x, a_y), (b_x, b_y) = machine.button_a, machine.button_b
+    prices = [
+        a * 3 + b
+        for a, b in itertools.product(range(limit), repeat=2)
+        if [a * a_x + b * b_x, a * a_y + b * b_y] == machine.prize_position
+    ]
+    return min(prices, default=0)
+
+
+class TestDay13(unittest.TestCase):
+    """Tests for the claw machines of Day 13."""
+
+    def test_parallel_buttons(self) -> None:
+        """Buttons in one direction give the cheapest price of all presses."""
+        solution = Day13(InputSource.from_bytes(b''))
+        for button_a, button_b in PARALLEL_BUTTONS:
+            for prize in itertools.product(range(13), repeat=2):
+                machine = ClawMachine(button_a, button_b, list(prize))
+                with self.subTest(machine=machine):
+                    self.assertEqual(
+                        solution.get_minimum_price(machine),
+                        _cheapest(machine, 14),
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for the grid."""
+
+import unittest
+
+from aoc import Grid
+
+MAP = [b'abc', b'de', b'ghi']
+
+
+class TestGrid(unittest.TestCase):
+    """Tests for `Grid`."""
+
+    def setUp(self) -> None:
+        """Create a grid with a short line."""
+        self.grid = Grid.from_lines(MAP, padding=ord('#'))
+
+    def test_cells(self) -> None:
+        """The map has a border, and short lines are filled up."""
+        grid = self.grid
+        self.assertEqual((grid.width, grid.height, grid.stride), (3, 3, 5))
+        self.assertEqual(grid.cells, b'######abc##de###ghi######')
+        self.assertEqual(grid[2, 1], ord('#'))
+        self.assertEqual(grid[-1, 0], ord('#'))
+        self.assertEqual(grid[0, 2], ord('g'))
+
+    def test_positions(self) -> None:
+        """Positions and flat indices convert both ways."""
+        grid = self.grid
+        for x in range(-1, 4):
+            for y in range(-1, 4):
+                with self.subTest(x=x, y=y):
+                    self.assertEqual(grid.position(grid.index(x, y)), (x, y))
+                    self.assertEqual(
+                        grid.in_bounds(x, y), 0 <= x < 3 and 0 <= y < 3
+                    )
+        self.assertEqual(
+            [grid.cells[index] for index in grid.indices()],
+            list(b'abcde#ghi'),
+        )
+
+    def test_neighbours(self) -> None:
+        """The offsets go to the neighbours of a cell."""
+        grid = self.grid
+        center = grid.index(1, 1)
+        self.assertEqual(
+            bytes(grid.cells[center + offset] for offset in grid.offsets),
+            b'b#hd',
+        )
+        self.assertEqual(
+            bytes(
+                grid.cells[center + offset] for offset in grid.diagonal_offsets
+            ),
+            b'ciga',
+        )
+
+    def test_find(self) -> None:
+        """Cells are found by value."""
+        grid = Grid.from_lines([b'.x.', b'x..'])
+        self.assertEqual(grid.position(grid.find(ord('x'))), (1, 0))
+        self.assertEqual(
+            [grid.position(index) for index in grid.find_all(ord('x'))],
+            [(1, 0), (0, 1)],
+        )
+        self.assertEqual(grid.find(ord('y')), -1)
+
+    def test_lines(self) -> None:
+        """Rows, columns and diagonals stop at the border."""
+        grid = self.grid
+        self.assertEqual(list(grid.rows()), [b'abc', b'de#', b'ghi'])
+        self.assertEqual(list(grid.columns()), [b'adg', b'beh', b'c#i'])
+        grid = Grid.from_lines([b'abc', b'def', b'ghi'])
+        self.assertEqual(
+            list(grid.diagonals()), [b'aei', b'bf', b'c', b'dh', b'g']
+        )
+        self.assertEqual(
+            list(grid.anti_diagonals()), [b'a', b'bd', b'ceg', b'fh', b'i']
+        )
+
+    def test_empty(self) -> None:
+        """A map without lines has no cells besides the border."""
+        grid = Grid.from_lines([])
+        self.assertEqual((grid.width, grid.height), (0, 0))
+        self.assertEqual(list(grid.indices()), [])
+        self.assertEqual(list(grid.rows()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
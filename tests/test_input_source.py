@@ -0,0 +1,97 @@
+"""Tests for the input sources."""
+
+import hashlib
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import InputSource
+
+DATA = b'3   4\r\n4   3\n\n2   5\n'
+
+
+class TestInputSource(unittest.TestCase):
+    """Tests for `InputSource`."""
+
+    def setUp(self) -> None:
+        """Write the test data to a temporary file."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.input_file = self.directory / 'input.txt'
+        self.input_file.write_bytes(DATA)
+
+    def _sources(self) -> list[InputSource]:
+        """Create a source for the file and one for the same bytes.
+
+        Returns:
+            The sources, which are closed after the test.
+        """
+        sources = [
+            InputSource(str(self.input_file)),
+            InputSource.from_bytes(DATA),
+        ]
+        for source in sources:
+            self.addCleanup(source.close)
+        return sources
+
+    def test_data(self) -> None:
+        """The data is the content of the file."""
+        for source in self._sources():
+            self.assertEqual(source.read_bytes(), DATA)
+            self.assertEqual(source.read_text(), DATA.decode())
+            self.assertEqual(source.sha256, hashlib.sha256(DATA).hexdigest())
+
+    def test_lines(self) -> None:
+        """Lines are split without line endings, keeping empty lines."""
+        for source in self._sources():
+            self.assertEqual(
+                [line.tobytes() for line in source.lines()],
+                [b'3   4', b'4   3', b'', b'2   5'],
+            )
+
+    def test_fields(self) -> None:
+        """Fields are split on whitespace."""
+        for source in self._sources():
+            self.assertEqual(
+                list(source.fields()),
+                [[b'3', b'4'], [b'4', b'3'], [], [b'2', b'5']],
+            )
+
+    def test_integers(self) -> None:
+        """The integers are given per line."""
+        for source in self._sources():
+            self.assertEqual(
+                [list(row) for row in source.integers()],
+                [[3, 4], [4, 3], [], [2, 5]],
+            )
+
+    def test_empty_file(self) -> None:
+        """An empty file, which cannot be mapped, gives no data."""
+        empty_file = self.directory / 'empty.txt'
+        empty_file.write_bytes(b'')
+        with InputSource(str(empty_file)) as source:
+            self.assertEqual(source.read_bytes(), b'')
+            self.assertEqual(list(source.lines()), [])
+
+    def test_of(self) -> None:
+        """A source is used as given, a path gets a new source."""
+        source = InputSource.from_bytes(DATA)
+        self.assertIs(InputSource.of(source), source)
+        self.assertEqual(
+            InputSource.of(str(self.input_file)).path, str(self.input_file)
+        )
+
+    def test_pickle(self) -> None:
+        """A pickled source gives the same data."""
+        for source in self._sources():
+            source.read_bytes()
+            copy = pickle.loads(pickle.dumps(source))
+            self.addCleanup(copy.close)
+            self.assertEqual(copy.path, source.path)
+            self.assertEqual(copy.read_bytes(), DATA)
+
+
+if __name__ == '__main__':
+    unittest.main()
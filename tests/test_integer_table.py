@@ -0,0 +1,76 @@
+"""Tests for the integer table."""
+
+import unittest
+
+from aoc import IntegerTable, numpy_available
+
+CASES = [
+    b'',
+    b'\n',
+    b'1',
+    b'3   4\n4   3\n',
+    b'Button A: X+94, Y+34\n\nPrize: X=-8400, Y=5400\r\n',
+    b'a-5 5-3 --7\n\n x\r\n12',
+    b'- 3\n-\n',
+    b'123456789012345678 -123456789012345678\n',
+]
+
+
+class TestIntegerTable(unittest.TestCase):
+    """Tests for `IntegerTable`."""
+
+    def test_rows(self) -> None:
+        """Every line is a row with its integers."""
+        table = IntegerTable.from_bytes(b'p=0,4 v=3,-3\n\nx 12\n')
+        self.assertEqual(len(table), 3)
+        self.assertEqual(
+            [list(row) for row in table], [[0, 4, 3, -3], [], [12]]
+        )
+        self.assertEqual(list(table[-1]), [12])
+        self.assertEqual(list(table.offsets), [0, 4, 4, 5])
+
+    def test_minus_signs(self) -> None:
+        """A minus sign is only part of an integer right before it."""
+        table = IntegerTable.from_bytes(b'a - b\n5-3 --7\n')
+        self.assertEqual([list(row) for row in table], [[], [5, -3, -7]])
+
+    def test_sections(self) -> None:
+        """Sections are the rows between rows without integers."""
+        table = IntegerTable.from_bytes(b'1 2\n3\n\n\n4\n')
+        self.assertEqual(
+            [[list(row) for row in section] for section in table.sections()],
+            [[[1, 2], [3]], [[4]]],
+        )
+
+    def test_large_integers(self) -> None:
+        """Integers that do not fit in 64 bits are kept in a list."""
+        table = IntegerTable.from_bytes(b'99999999999999999999 1\n')
+        self.assertIsInstance(table.values, list)
+        self.assertEqual(list(table[0]), [99999999999999999999, 1])
+
+    def test_memoryview(self) -> None:
+        """A view gives the same table as the bytes it is a view on."""
+        for data in CASES:
+            with self.subTest(data=data):
+                table = IntegerTable.from_bytes(data)
+                view = IntegerTable.from_bytes(memoryview(data)[:])
+                self.assertEqual(table.values, view.values)
+                self.assertEqual(table.offsets, view.offsets)
+
+    @unittest.skipUnless(numpy_available(), 'NumPy is not installed')
+    def test_numpy_backend(self) -> None:
+        """The NumPy backend gives the same table as pure Python."""
+        for data in [*CASES, b'99999999999999999999 1\n']:
+            with self.subTest(data=data):
+                table = IntegerTable.from_bytes(data)
+                numpy_table = IntegerTable.from_bytes(
+                    memoryview(data), 'numpy'
+                )
+                self.assertEqual(table.values, numpy_table.values)
+                self.assertEqual(
+                    list(table.offsets), list(numpy_table.offsets)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for the parse cache."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc import DaySolution, InputSource, ParseCache
+
+
+class Numbers(DaySolution):
+    """Solution that sums the integers of its input, to test the cache."""
+
+    PARSED_ATTRIBUTES = ('_numbers',)
+
+    def __init__(
+        self, input_file: InputSource | str, backend: str = 'python'
+    ) -> None:
+        """Set internal values."""
+        self._input_source = InputSource.of(input_file)
+        self._loaded_data = False
+        self._numbers: tuple[int, ...] = ()
+        self._backend = backend
+        self.parsed = False
+
+    def _load_data(self) -> None:
+        """Load data from the input file."""
+        if self._loaded_data:
+            return
+        if self._load_parsed(self._input_source):
+            self._loaded_data = True
+            return
+
+        self._numbers = tuple(self._input_source.integers().values)
+        self.parsed = True
+        self._store_parsed(self._input_source)
+        self._loaded_data = True
+
+    def solve_puzzle_one(self) -> str:
+        """Solve puzzle one."""
+        self.load_data()
+        return str(sum(self._numbers))
+
+    def solve_puzzle_two(self) -> str:
+        """Solve puzzle two."""
+        self.load_data()
+        return str(len(self._numbers))
+
+
+class TestParseCache(unittest.TestCase):
+    """Tests for `ParseCache`."""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name) / 'cache'
+        self.cache = ParseCache(str(self.directory))
+
+    def _solve(self, data: bytes, backend: str = 'python') -> Numbers:
+        """Solve part one of `Numbers` with the cache.
+
+        Args:
+            data: the input data.
+            backend: the backend of the solution.
+
+        Returns:
+            The solution.
+        """
+        solution = Numbers(InputSource.from_bytes(data), backend)
+        solution.parse_cache = self.cache
+        self.assertEqual(
+            solution.solve_puzzle_one(),
+            str(sum(InputSource.from_bytes(data).integers().values)),
+        )
+        return solution
+
+    def test_round_trip(self) -> None:
+        """The second load of the same input comes from the cache."""
+        self.assertTrue(self._solve(b'1 2\n3\n').parsed)
+        self.assertFalse(self._solve(b'1 2\n3\n').parsed)
+
+    def test_changed_input(self) -> None:
+        """Another input is parsed again."""
+        self._solve(b'1 2\n3\n')
+        self.assertTrue(self._solve(b'1 2\n4\n').parsed)
+
+    def test_parser_version(self) -> None:
+        """Raising the parser version makes the cached data stale."""
+        self._solve(b'1 2\n3\n')
+        self.addCleanup(setattr, Numbers, 'PARSER_VERSION', 1)
+        Numbers.PARSER_VERSION = 2
+        self.assertTrue(self._solve(b'1 2\n3\n').parsed)
+
+    def test_backend(self) -> None:
+        """The data of one backend is not used for another."""
+        self._solve(b'1 2\n3\n', 'python')
+        self.assertTrue(self._solve(b'1 2\n3\n', 'numpy').parsed)
+        self.assertFalse(self._solve(b'1 2\n3\n', 'numpy').parsed)
+
+    def test_unloadable_file(self) -> None:
+        """Files that cannot be unpickled are a miss, not an error."""
+        self._solve(b'1 2\n3\n')
+        (name,) = os.listdir(self.directory)
+        for content in (
+            b'',
+            b'not a pickle',
+            b'cno_such_module_for_the_test\nNumbers\n.',
+            b'caoc\nNoSuchClassForTheTest\n.',
+        ):
+            with self.subTest(content=content):
+                (self.directory / name).write_bytes(content)
+                self.assertTrue(self._solve(b'1 2\n3\n').parsed)
+
+
+if __name__ == '__main__':
+    unittest.main()
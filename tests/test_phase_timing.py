@@ -0,0 +1,76 @@
+"""Tests for the timing of phases inside solutions."""
+
+import unittest
+
+from aoc import DaySolution, timed
+from aoc.phase_timing import collect_phases, timing_enabled
+
+
+class Phases(DaySolution):
+    """Solution with timed phases, to test the timing."""
+
+    def __init__(self) -> None:
+        """Set internal values."""
+        self._loaded_data = True
+
+    def _load_data(self) -> None:
+        """Load data from the input file."""
+
+    @timed('count')
+    def _count(self) -> int:
+        """Count to a small number.
+
+        Returns:
+            The number.
+        """
+        return sum(1 for _ in range(10))
+
+    def solve_puzzle_one(self) -> str:
+        """Solve puzzle one."""
+        return str(self._count())
+
+    def solve_puzzle_two(self) -> str:
+        """Solve puzzle two."""
+        with self.timing('twice'):
+            return str(self._count() + self._count())
+
+
+class TestPhaseTiming(unittest.TestCase):
+    """Tests for `timed`, `DaySolution.timing` and `collect_phases`."""
+
+    def test_disabled(self) -> None:
+        """Without `collect_phases`, nothing is recorded."""
+        solution = Phases()
+        self.assertFalse(timing_enabled())
+        self.assertEqual(solution.solve_puzzle_one(), '10')
+        self.assertEqual(solution.solve_puzzle_two(), '20')
+        self.assertEqual(solution.timings, {})
+
+    def test_collected(self) -> None:
+        """Inside `collect_phases`, the phases and their calls are recorded."""
+        solution = Phases()
+        with collect_phases() as phases:
+            self.assertTrue(timing_enabled())
+            solution.solve_puzzle_one()
+            solution.solve_puzzle_two()
+        self.assertFalse(timing_enabled())
+
+        self.assertEqual(list(phases), ['count', 'twice'])
+        self.assertEqual(phases['count'].calls, 3)
+        self.assertEqual(phases['twice'].calls, 1)
+        self.assertGreaterEqual(phases['twice'].wall_time, 0)
+        self.assertEqual(solution.timings['count'].calls, 3)
+
+    def test_nested(self) -> None:
+        """Every active collector gets the phases of its own block."""
+        solution = Phases()
+        with collect_phases() as outer:
+            solution.solve_puzzle_one()
+            with collect_phases() as inner:
+                solution.solve_puzzle_one()
+        self.assertEqual(outer['count'].calls, 2)
+        self.assertEqual(inner['count'].calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the graph searches."""
+
+import unittest
+
+from aoc import Grid
+from aoc.search import Visited, bfs, count_paths, dfs, flood_fill
+
+# A chain 0 -> 1 -> 2 -> 3, with a shortcut 0 -> 2 and 4 on its own
+EDGES = {0: [1, 2], 1: [2], 2: [3], 3: [], 4: [3]}
+
+
+class TestVisited(unittest.TestCase):
+    """Tests for `Visited`."""
+
+    def test_add_and_clear(self) -> None:
+        """Nodes are kept once, in order, and clearing resets them."""
+        visited = Visited(5)
+        for node in (3, 1, 3):
+            visited.add(node)
+        self.assertEqual(list(visited), [3, 1])
+        self.assertEqual(len(visited), 2)
+        self.assertIn(1, visited)
+        self.assertNotIn(2, visited)
+        self.assertEqual(bytes(visited.flags), b'\0\1\0\1\0')
+
+        visited.clear()
+        self.assertEqual(list(visited), [])
+        self.assertEqual(bytes(visited.flags), bytes(5))
+
+    def test_read_only_flags(self) -> None:
+        """The flags cannot be changed without `add`."""
+        visited = Visited(2)
+        with self.assertRaises(TypeError):
+            visited.flags[0] = 1
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for `bfs`, `dfs` and `count_paths`."""
+
+    def test_bfs(self) -> None:
+        """Nodes come with their shortest distance, nearest first."""
+        visited = Visited(5)
+        self.assertEqual(
+            list(bfs([0], EDGES.__getitem__, visited)),
+            [(0, 0), (1, 1), (2, 1), (3, 2)],
+        )
+        self.assertEqual(list(visited), [0, 1, 2, 3])
+        self.assertEqual(
+            list(bfs([4, 0], EDGES.__getitem__, visited)), [(4, 0)]
+        )
+
+    def test_dfs(self) -> None:
+        """Nodes are visited once, the last found node first."""
+        visited = Visited(5)
+        self.assertEqual(
+            list(dfs([0], EDGES.__getitem__, visited)), [0, 2, 3, 1]
+        )
+        self.assertEqual(list(dfs([4], EDGES.__getitem__, visited)), [4])
+
+    def test_deep_graph(self) -> None:
+        """A long chain does not hit the recursion limit."""
+        size = 100_000
+
+        def chain(node: int) -> list[int]:
+            return [node + 1] if node + 1 < size else []
+
+        self.assertEqual(len(list(dfs([0], chain, Visited(size)))), size)
+        self.assertEqual(count_paths([0], chain, lambda node: False), [0])
+        self.assertEqual(
+            count_paths([0], chain, lambda node: node == size - 1), [1]
+        )
+
+    def test_count_paths(self) -> None:
+        """Paths are counted to the first target they reach."""
+        self.assertEqual(
+            count_paths(
+                [0, 1, 4, 3], EDGES.__getitem__, lambda node: node == 3
+            ),
+            [2, 1, 1, 1],
+        )
+        self.assertEqual(
+            count_paths([0], EDGES.__getitem__, lambda node: node == 2), [2]
+        )
+
+
+class TestFloodFill(unittest.TestCase):
+    """Tests for `flood_fill`."""
+
+    def test_areas(self) -> None:
+        """The area has the connected cells with the same value."""
+        grid = Grid.from_lines([b'aab', b'bab', b'bba'])
+        visited = Visited.for_grid(grid)
+        area = flood_fill(grid, grid.index(0, 0), visited)
+        self.assertEqual(
+            [grid.position(index) for index in area], [(0, 0), (1, 0), (1, 1)]
+        )
+        self.assertEqual(list(visited), area)
+        self.assertEqual(flood_fill(grid, grid.index(1, 1), visited), [])
+        self.assertEqual(len(flood_fill(grid, grid.index(2, 0))), 2)
+        self.assertEqual(len(flood_fill(grid, grid.index(0, 1))), 3)
+        self.assertEqual(flood_fill(grid, grid.index(-1, 0)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
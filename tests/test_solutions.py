@@ -0,0 +1,92 @@
+"""Tests for the solutions, with the examples of the puzzles."""
+
+import unittest
+from pathlib import Path
+
+from aoc import DaySolution, numpy_available
+from aoc24 import solutions
+
+EXAMPLES = Path(__file__).parent / 'examples'
+
+# The answers of both parts for the examples; None for parts without an
+# answer for the example
+ANSWERS: dict[int, tuple[str, str | None]] = {
+    1: ('11', '31'),
+    2: ('2', '4'),
+    3: ('161', '48'),
+    4: ('18', '9'),
+    5: ('143', '123'),
+    6: ('41', '6'),
+    7: ('3749', '11387'),
+    8: ('14', '34'),
+    9: ('1928', '2858'),
+    10: ('36', '81'),
+    11: ('55312', '65601038650482'),
+    12: ('1930', '1206'),
+    13: ('480', '875318608908'),
+    14: ('12', None),
+}
+
+# The days with a NumPy backend
+NUMPY_DAYS = (1, 2, 4, 13, 14)
+
+
+def _create(day: int, **arguments: object) -> DaySolution:
+    """Create the solution for a day with its example input.
+
+    Args:
+        day: the day.
+        **arguments: extra arguments for the constructor.
+
+    Returns:
+        The solution.
+    """
+    if day == 14:
+        # The example is on a smaller map than the puzzle
+        arguments['map_size'] = (11, 7)
+    solution_class = getattr(solutions, f'Day{day:02}')
+    return solution_class(
+        str(EXAMPLES / f'day{day:02}-input.txt'), **arguments
+    )
+
+
+class TestSolutions(unittest.TestCase):
+    """Tests for the answers of the solutions."""
+
+    def _check(self, day: int, **arguments: object) -> None:
+        """Check the answers of a day on its example.
+
+        Every part is solved on a new object, and twice on one object, to
+        check that solving does not change the loaded data.
+
+        Args:
+            day: the day.
+            **arguments: extra arguments for the constructor.
+        """
+        one, two = ANSWERS[day]
+        self.assertEqual(_create(day, **arguments).solve_puzzle_one(), one)
+        if two is not None:
+            self.assertEqual(_create(day, **arguments).solve_puzzle_two(), two)
+
+        solution = _create(day, **arguments)
+        for _ in range(2):
+            self.assertEqual(solution.solve_puzzle_one(), one)
+            if two is not None:
+                self.assertEqual(solution.solve_puzzle_two(), two)
+
+    def test_examples(self) -> None:
+        """Every day gives the answers of its example."""
+        for day in ANSWERS:
+            with self.subTest(day=day):
+                self._check(day)
+
+    @unittest.skipUnless(numpy_available(), 'NumPy is not installed')
+    def test_examples_numpy(self) -> None:
+        """The NumPy backend gives the same answers."""
+        for day in NUMPY_DAYS:
+            with self.subTest(day=day):
+                self._check(day, backend='numpy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for solving parts within a time budget."""
+
+import time
+import unittest
+
+from aoc import DaySolution
+from aoc.time_budget import TIMEOUT, solve_parts
+
+
+class Slow(DaySolution):
+    """Solution with a fast part one and a part two that never ends."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Set internal values."""
+        self._loaded_data = True
+        self._fail = fail
+
+    def _load_data(self) -> None:
+        """Load data from the input file."""
+
+    def solve_puzzle_one(self) -> str:
+        """Solve puzzle one.
+
+        Raises:
+            ValueError: when the solution is made to fail.
+        """
+        if self._fail:
+            raise ValueError('no answer')
+        with self.timing('fast'):
+            return '1'
+
+    def solve_puzzle_two(self) -> str:
+        """Solve puzzle two."""
+        with self.timing('spin'):
+            while True:
+                time.sleep(0.01)
+
+
+class TestSolveParts(unittest.TestCase):
+    """Tests for `solve_parts`."""
+
+    def test_timeout(self) -> None:
+        """A slow part is stopped, the fast part still gives its answer."""
+        start = time.perf_counter()
+        results = {
+            result.part: result
+            for result in solve_parts(
+                [(1, 1, Slow()), (1, 2, Slow())], 0.5, timings=True
+            )
+        }
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(results[1].answer, '1')
+        self.assertFalse(results[1].timed_out)
+        self.assertEqual(list(results[1].timings), ['fast'])
+
+        self.assertEqual(results[2].answer, TIMEOUT)
+        self.assertTrue(results[2].timed_out)
+        self.assertGreaterEqual(results[2].wall_time, 0.5)
+        self.assertEqual(results[2].timings['spin'].calls, 1)
+
+    def test_no_timings(self) -> None:
+        """Without timings, no phases are recorded."""
+        (result,) = solve_parts([(1, 1, Slow())], 5)
+        self.assertEqual(result.answer, '1')
+        self.assertEqual(result.timings, {})
+
+    def test_failure(self) -> None:
+        """The exception of a failing part is raised."""
+        with self.assertRaisesRegex(ValueError, 'no answer'):
+            list(solve_parts([(1, 1, Slow(fail=True))], 5))
+
+
+if __name__ == '__main__':
+    unittest.main()